@@ -0,0 +1,42 @@
+from datetime import datetime
+from typing import Annotated, Literal
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from core.auth import get_admin_user
+from core.database import get_read_session
+from core.export import EXPORT_MODELS, export_query, stream_export
+from models.users import User
+
+admin_router = APIRouter(prefix="/api/admin")
+
+
+@admin_router.get("/export/{kind}")
+async def export_rows(
+    kind: Literal["posts", "comments"],
+    admin: Annotated[User, Depends(get_admin_user)],
+    db: AsyncSession = Depends(get_read_session),
+    since: datetime | None = None,
+    until: datetime | None = None,
+    include_deleted: bool = False,
+    after_id: int | None = None,
+):
+    """
+    게시글 또는 댓글 전체를 NDJSON(한 줄에 JSON 객체 하나)으로 스트리밍하는 엔드포인트입니다.
+    관리자만 접근할 수 있습니다.
+    id 오름차순으로 내보내므로, 중간에 끊기면 마지막으로 받은 id를 after_id로 넘겨
+    이어서 받을 수 있습니다.
+    """
+    query = export_query(
+        EXPORT_MODELS[kind],
+        since=since,
+        until=until,
+        include_deleted=include_deleted,
+        after_id=after_id,
+    )
+    # 요청 세션과 별개의 커넥션에서 스트리밍 (응답 전송 중에도 커서를 유지)
+    return StreamingResponse(
+        stream_export(db.bind, query), media_type="application/x-ndjson"
+    )
@@ -1,16 +1,65 @@
-from typing import Annotated, List
+import asyncio
+import json
+from collections import Counter
+from datetime import datetime
+from typing import Annotated, Any, List, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, select
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Request,
+    Response,
+    WebSocket,
+    status,
+)
+from pydantic import TypeAdapter
+from sqlalchemy import insert, update
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from core.database import get_session
+from core.database import get_read_session, get_write_session
 from core.auth import get_current_user
+from core.conditional import build_validators, is_not_modified, not_modified_response
+from core.config import get_settings
+from core.counters import change_comment_counts
+from core.projection import parse_fields, parse_ids, project_row
+from core.pubsub import broker
+from core.response_cache import response_cache
+from core.search import index_rows
+from core.serialization import model_response
+from core.pagination import (
+    NEXT_CURSOR_HEADER,
+    encode_cursor,
+    keyset_condition,
+    keyset_order,
+)
 from models.posts import Comment, Post
 from models.users import User
-from schemas.comments import CommentCreate, CommentUpdate, CommentResponse
+from schemas.bulk import BulkDeleteRequest, BulkItemResult, BulkResponse
+from schemas.comments import (
+    CommentBatchResponse,
+    CommentBulkCreateRequest,
+    CommentCreate,
+    CommentUpdate,
+    CommentResponse,
+)
+
+settings = get_settings()
 
 comment_router = APIRouter(prefix="/api/comments")
 
+row_list_adapter = TypeAdapter(List[dict[str, Any]])
+row_adapter = TypeAdapter(dict[str, Any])
+
+# 필드 선택(fields)에 사용할 수 있는 컬럼
+COMMENT_FIELD_COLUMNS = {
+    "id": Comment.id,
+    "content": Comment.content,
+    "user_name": User.user_name,
+    "post_id": Comment.post_id,
+}
+
 
 @comment_router.post(
     "", response_model=CommentResponse, status_code=status.HTTP_201_CREATED
@@ -19,19 +68,25 @@ async def create_comment(
     post_id: int,
     request: CommentCreate,
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Session = Depends(get_session),
+    db: AsyncSession = Depends(get_write_session),
 ):
     """
     댓글을 작성하는 엔드포인트입니다.
     로그인한 사용자만 작성할 수 있습니다.
+    게시글의 댓글 수 증가가 게시글 존재 여부 확인을 겸합니다.
     """
     try:
-        # 게시글 존재 여부 확인
-        post = db.exec(
-            select(Post).where(Post.id == post_id, Post.is_deleted == False)
-        ).first()
+        # 댓글 수를 원자적으로 증가 (삭제되지 않은 게시글이 없으면 0행)
+        # 댓글 수는 게시글 내용이 아니므로 updated_at(onupdate)을 유지한다
+        result = await db.exec(
+            update(Post)
+            .where(Post.id == post_id, Post.is_deleted == False)
+            .values(
+                comment_count=Post.comment_count + 1, updated_at=Post.updated_at
+            )
+        )
 
-        if not post:
+        if result.rowcount == 0:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="게시글을 찾을 수 없습니다.",
@@ -43,38 +98,150 @@ async def create_comment(
         )
 
         db.add(new_comment)
-        db.commit()
-        db.refresh(new_comment)
+        await db.flush()
+        await index_rows(db, Comment, [new_comment.id])
+        await db.commit()
+        await db.refresh(new_comment)
+
+        await response_cache.invalidate_post(post_id)
 
-        return CommentResponse(
+        response = CommentResponse(
             id=new_comment.id,
             content=new_comment.content,
             user_name=current_user.user_name,
             post_id=post_id,
         )
+        await publish_comment_event("created", post_id, response.model_dump())
+        return model_response(
+            response, CommentResponse, status_code=status.HTTP_201_CREATED
+        )
 
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="댓글 작성 중 오류가 발생했습니다.",
         )
 
 
-@comment_router.get("", response_model=List[CommentResponse])
+def comment_channel(post_id: int) -> str:
+    return f"comments:{post_id}"
+
+
+async def publish_comment_event(
+    event: str, post_id: int, comment: dict[str, Any]
+) -> None:
+    """
+    게시글의 실시간 댓글 채널에 댓글 변경(created/updated/deleted)을 발행합니다.
+    """
+    await broker.publish(
+        comment_channel(post_id),
+        json.dumps({"type": event, "comment": comment}, ensure_ascii=False),
+    )
+
+
+def comment_select(fields: list[str]):
+    """
+    요청된 필드와 페이지네이션/검증 헤더에 필요한 컬럼만 조회하는 쿼리를 만듭니다.
+    """
+    columns = [COMMENT_FIELD_COLUMNS[field] for field in fields if field != "id"]
+    return select(
+        Comment.id,
+        Comment.created_at,
+        Comment.updated_at,
+        User.updated_at.label("user_updated_at"),
+        *columns,
+    ).join(User, Comment.user_uuid == User.uuid)
+
+
+async def get_comments_by_ids(
+    db: AsyncSession, comment_ids: list[int], selected: list[str]
+) -> Any:
+    """
+    여러 댓글을 IN 쿼리 한 번으로 조회하여 요청 순서대로 정렬합니다.
+    삭제되었거나 삭제된 게시글에 달린 댓글 id는 missing으로 반환합니다.
+    전체 필드를 요청하면 CommentBatchResponse를, 필드를 골랐다면 고른 필드만 반환합니다.
+    """
+    rows = (
+        (
+            await db.exec(
+                comment_select(selected)
+                .join(Post, Comment.post_id == Post.id)
+                .where(
+                    Comment.id.in_(comment_ids),
+                    Comment.is_deleted == False,
+                    Post.is_deleted == False,
+                )
+            )
+        )
+        .mappings()
+        .all()
+    )
+    found = {row["id"]: row for row in rows}
+    items = [
+        project_row(found[comment_id], selected)
+        for comment_id in comment_ids
+        if comment_id in found
+    ]
+    missing = [comment_id for comment_id in comment_ids if comment_id not in found]
+
+    if selected == list(COMMENT_FIELD_COLUMNS):
+        return model_response(
+            CommentBatchResponse(
+                items=[CommentResponse(**item) for item in items], missing=missing
+            ),
+            CommentBatchResponse,
+        )
+    return Response(
+        content=row_adapter.dump_json({"items": items, "missing": missing}),
+        media_type="application/json",
+    )
+
+
+@comment_router.get(
+    "", response_model=Union[List[CommentResponse], CommentBatchResponse]
+)
 async def get_comments(
-    post_id: int, db: Session = Depends(get_session), skip: int = 0, limit: int = 50
+    request: Request,
+    post_id: int | None = None,
+    db: AsyncSession = Depends(get_read_session),
+    skip: int = 0,
+    limit: int = 50,
+    cursor: str | None = None,
+    fields: str | None = None,
+    ids: str | None = None,
 ):
     """
     특정 게시글의 댓글 목록을 조회하는 엔드포인트입니다.
     누구나 조회할 수 있습니다.
+    post_id 대신 ids=1,2,3이 주어지면 해당 댓글들을 한 번의 쿼리로 조회하여
+    {"items": [...], "missing": [...]} 형태로 요청 순서대로 반환합니다.
+    cursor가 주어지면 키셋 페이지네이션을 사용하며,
+    다음 페이지 커서는 X-Next-Cursor 헤더로 반환합니다.
+    fields=id,content처럼 필요한 필드만 골라 조회할 수 있습니다.
+    If-None-Match가 현재 ETag와 같으면 본문 없이 304를 반환합니다.
     """
     try:
+        selected = parse_fields(fields, COMMENT_FIELD_COLUMNS, COMMENT_FIELD_COLUMNS)
+
+        if ids is not None:
+            return await get_comments_by_ids(
+                db, parse_ids(ids, settings.BATCH_MAX_IDS), selected
+            )
+
+        if post_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="post_id 또는 ids가 필요합니다.",
+            )
+
         # 게시글 존재 여부 확인
-        post = db.exec(
-            select(Post).where(Post.id == post_id, Post.is_deleted == False)
+        post = (
+            await db.exec(
+                select(Post.id).where(Post.id == post_id, Post.is_deleted == False)
+            )
         ).first()
 
         if not post:
@@ -83,25 +250,55 @@ async def get_comments(
                 detail="게시글을 찾을 수 없습니다.",
             )
 
-        # 댓글 목록 조회
-        comments = db.exec(
-            select(Comment, User)
-            .join(User, Comment.user_uuid == User.uuid)
+        # 댓글 목록 조회 (요청된 필드와 페이지네이션/검증에 필요한 컬럼만)
+        query = (
+            comment_select(selected)
             .where(Comment.post_id == post_id, Comment.is_deleted == False)
-            .offset(skip)
+            .order_by(*keyset_order(Comment))
             .limit(limit)
-            .order_by(Comment.created_at.desc())
-        ).all()
+        )
+        if cursor:
+            query = query.where(keyset_condition(Comment, cursor))
+        else:
+            query = query.offset(skip)
+
+        comments = (await db.exec(query)).mappings().all()
 
-        return [
-            CommentResponse(
-                id=comment.id,
-                content=comment.content,
-                user_name=user.user_name,
-                post_id=post_id,
+        # 페이지가 가득 찼다면 마지막 행 기준으로 다음 커서를 발급
+        headers = {}
+        if comments and len(comments) == limit:
+            last_comment = comments[-1]
+            headers[NEXT_CURSOR_HEADER] = encode_cursor(
+                last_comment["created_at"], last_comment["id"]
             )
-            for comment, user in comments
-        ]
+
+        # 행 버전으로 검증 헤더를 만들고, 바뀐 것이 없으면 직렬화 없이 304 반환
+        headers.update(
+            build_validators(
+                [selected]
+                + [
+                    (comment["id"], comment["updated_at"], comment["user_updated_at"])
+                    for comment in comments
+                ],
+                max(
+                    (
+                        max(comment["updated_at"], comment["user_updated_at"])
+                        for comment in comments
+                    ),
+                    default=None,
+                ),
+            )
+        )
+        if is_not_modified(request, headers, check_modified_since=False):
+            return not_modified_response(headers)
+
+        return Response(
+            content=row_list_adapter.dump_json(
+                [project_row(comment, selected) for comment in comments]
+            ),
+            media_type="application/json",
+            headers=headers,
+        )
 
     except HTTPException:
         raise
@@ -118,7 +315,7 @@ async def update_comment(
     comment_id: int,
     request: CommentUpdate,
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Session = Depends(get_session),
+    db: AsyncSession = Depends(get_write_session),
 ):
     """
     댓글을 수정하는 엔드포인트입니다.
@@ -126,11 +323,13 @@ async def update_comment(
     """
     try:
         # 댓글 조회
-        comment = db.exec(
-            select(Comment).where(
-                Comment.id == comment_id,
-                Comment.post_id == post_id,
-                Comment.is_deleted == False,
+        comment = (
+            await db.exec(
+                select(Comment).where(
+                    Comment.id == comment_id,
+                    Comment.post_id == post_id,
+                    Comment.is_deleted == False,
+                )
             )
         ).first()
 
@@ -150,20 +349,24 @@ async def update_comment(
         comment.content = request.content
 
         db.add(comment)
-        db.commit()
-        db.refresh(comment)
+        await db.flush()
+        await index_rows(db, Comment, [comment.id])
+        await db.commit()
+        await db.refresh(comment)
 
-        return CommentResponse(
+        response = CommentResponse(
             id=comment.id,
             content=comment.content,
             user_name=current_user.user_name,
             post_id=post_id,
         )
+        await publish_comment_event("updated", post_id, response.model_dump())
+        return model_response(response, CommentResponse)
 
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="댓글 수정 중 오류가 발생했습니다.",
@@ -175,7 +378,7 @@ async def delete_comment(
     post_id: int,
     comment_id: int,
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Session = Depends(get_session),
+    db: AsyncSession = Depends(get_write_session),
 ):
     """
     댓글을 삭제하는 엔드포인트입니다.
@@ -183,11 +386,13 @@ async def delete_comment(
     """
     try:
         # 댓글 조회
-        comment = db.exec(
-            select(Comment).where(
-                Comment.id == comment_id,
-                Comment.post_id == post_id,
-                Comment.is_deleted == False,
+        comment = (
+            await db.exec(
+                select(Comment).where(
+                    Comment.id == comment_id,
+                    Comment.post_id == post_id,
+                    Comment.is_deleted == False,
+                )
             )
         ).first()
 
@@ -203,17 +408,268 @@ async def delete_comment(
                 detail="댓글을 삭제할 권한이 없습니다.",
             )
 
-        # 소프트 삭제 처리
-        comment.soft_delete()
+        # 삭제되지 않은 경우에만 소프트 삭제 (동시에 삭제한 요청은 0행)
+        result = await db.exec(
+            update(Comment)
+            .where(Comment.id == comment_id, Comment.is_deleted == False)
+            .values(is_deleted=True, deleted_at=datetime.now())
+        )
 
-        db.add(comment)
-        db.commit()
+        if result.rowcount != 1:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="댓글을 찾을 수 없습니다."
+            )
+
+        # 실제로 삭제한 요청만 게시글 댓글 수를 감소
+        await db.exec(
+            update(Post)
+            .where(Post.id == post_id)
+            .values(
+                comment_count=Post.comment_count - 1, updated_at=Post.updated_at
+            )
+        )
+        await db.commit()
+
+        await response_cache.invalidate_post(post_id)
+        await publish_comment_event(
+            "deleted", post_id, {"id": comment_id, "post_id": post_id}
+        )
 
     except HTTPException as e:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="댓글 삭제 중 오류가 발생했습니다.",
         )
+
+
+@comment_router.post("/bulk", response_model=BulkResponse)
+async def bulk_create_comments(
+    request: CommentBulkCreateRequest,
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: AsyncSession = Depends(get_write_session),
+):
+    """
+    여러 댓글을 한 번에 작성하는 엔드포인트입니다.
+    게시글 존재 여부를 한 번에 확인하고, 다중 행 INSERT와 댓글 수 갱신을
+    하나의 트랜잭션으로 처리합니다. 결과는 항목별 상태로 반환합니다.
+    """
+    try:
+        # 대상 게시글 존재 여부를 한 번에 확인
+        post_ids = {item.post_id for item in request.items}
+        existing_post_ids = set(
+            (
+                await db.exec(
+                    select(Post.id).where(
+                        Post.id.in_(post_ids), Post.is_deleted == False
+                    )
+                )
+            ).all()
+        )
+
+        now = datetime.now()
+        valid_items = [
+            (index, item)
+            for index, item in enumerate(request.items)
+            if item.post_id in existing_post_ids
+        ]
+
+        new_ids = []
+        if valid_items:
+            # 다중 행 INSERT (요청 순서대로 생성된 id 반환)
+            new_ids = (
+                await db.exec(
+                    insert(Comment).returning(
+                        Comment.id, sort_by_parameter_order=True
+                    ),
+                    params=[
+                        {
+                            "content": item.content,
+                            "user_uuid": current_user.uuid,
+                            "post_id": item.post_id,
+                            "created_at": now,
+                            "updated_at": now,
+                            "is_deleted": False,
+                        }
+                        for _, item in valid_items
+                    ],
+                )
+            ).scalars().all()
+            await index_rows(db, Comment, new_ids)
+
+            await db.exec(
+                change_comment_counts(
+                    Counter(item.post_id for _, item in valid_items)
+                )
+            )
+
+        await db.commit()
+
+        for post_id in {item.post_id for _, item in valid_items}:
+            await response_cache.invalidate_post(post_id)
+        for (_, item), new_id in zip(valid_items, new_ids):
+            await publish_comment_event(
+                "created",
+                item.post_id,
+                CommentResponse(
+                    id=new_id,
+                    content=item.content,
+                    user_name=current_user.user_name,
+                    post_id=item.post_id,
+                ).model_dump(),
+            )
+
+        created = {index: new_id for (index, _), new_id in zip(valid_items, new_ids)}
+        bulk_response = BulkResponse(
+            results=[
+                (
+                    BulkItemResult(
+                        index=index, id=created[index], status=status.HTTP_201_CREATED
+                    )
+                    if index in created
+                    else BulkItemResult(
+                        index=index,
+                        status=status.HTTP_404_NOT_FOUND,
+                        detail="게시글을 찾을 수 없습니다.",
+                    )
+                )
+                for index in range(len(request.items))
+            ]
+        )
+        return model_response(bulk_response, BulkResponse)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="댓글 일괄 작성 중 오류가 발생했습니다.",
+        )
+
+
+@comment_router.post("/bulk-delete", response_model=BulkResponse)
+async def bulk_delete_comments(
+    request: BulkDeleteRequest,
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: AsyncSession = Depends(get_write_session),
+):
+    """
+    여러 댓글을 한 번에 소프트 삭제하는 엔드포인트입니다.
+    작성자 확인을 한 번의 조회로 처리하고, 본인 댓글만 삭제합니다.
+    결과는 항목별 상태로 반환합니다.
+    """
+    try:
+        # 대상 댓글의 작성자와 게시글을 한 번에 조회
+        rows = (
+            await db.exec(
+                select(Comment.id, Comment.user_uuid, Comment.post_id).where(
+                    Comment.id.in_(request.ids), Comment.is_deleted == False
+                )
+            )
+        ).all()
+        found = {row.id: row for row in rows}
+        deletable = [row.id for row in rows if row.user_uuid == current_user.uuid]
+
+        deleted = []
+        if deletable:
+            # 조회 이후 다른 요청이 먼저 삭제한 댓글은 건너뛰고,
+            # 실제로 삭제한 행만 댓글 수 감소에 반영한다
+            deleted = (
+                await db.exec(
+                    update(Comment)
+                    .where(Comment.id.in_(deletable), Comment.is_deleted == False)
+                    .values(is_deleted=True, deleted_at=datetime.now())
+                    .returning(Comment.id, Comment.post_id)
+                )
+            ).all()
+            if deleted:
+                await db.exec(
+                    change_comment_counts(
+                        Counter(row.post_id for row in deleted), sign=-1
+                    )
+                )
+
+        await db.commit()
+
+        for post_id in {row.post_id for row in deleted}:
+            await response_cache.invalidate_post(post_id)
+        for row in deleted:
+            await publish_comment_event(
+                "deleted", row.post_id, {"id": row.id, "post_id": row.post_id}
+            )
+
+        deleted_ids = {row.id for row in deleted}
+        results = []
+        for index, comment_id in enumerate(request.ids):
+            row = found.get(comment_id)
+            if row is None or (
+                row.user_uuid == current_user.uuid and comment_id not in deleted_ids
+            ):
+                results.append(
+                    BulkItemResult(
+                        index=index,
+                        id=comment_id,
+                        status=status.HTTP_404_NOT_FOUND,
+                        detail="댓글을 찾을 수 없습니다.",
+                    )
+                )
+            elif row.user_uuid != current_user.uuid:
+                results.append(
+                    BulkItemResult(
+                        index=index,
+                        id=comment_id,
+                        status=status.HTTP_403_FORBIDDEN,
+                        detail="댓글을 삭제할 권한이 없습니다.",
+                    )
+                )
+            else:
+                results.append(
+                    BulkItemResult(
+                        index=index, id=comment_id, status=status.HTTP_204_NO_CONTENT
+                    )
+                )
+
+        return model_response(BulkResponse(results=results), BulkResponse)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="댓글 일괄 삭제 중 오류가 발생했습니다.",
+        )
+
+
+@comment_router.websocket("/live")
+async def live_comments(websocket: WebSocket, post_id: int):
+    """
+    게시글의 댓글 작성/수정/삭제를 실시간으로 받는 WebSocket 엔드포인트입니다.
+    메시지는 {"type": "created"|"updated"|"deleted", "comment": {...}} 형태의 JSON이며,
+    수신이 느려 대기 메시지가 PUBSUB_QUEUE_SIZE를 넘으면 1013 코드로 연결을 끊습니다.
+    클라이언트는 다시 연결한 뒤 댓글 목록을 새로 불러오면 됩니다.
+    """
+    await websocket.accept()
+
+    async with broker.subscribe(comment_channel(post_id)) as subscription:
+
+        async def forward() -> None:
+            async for message in subscription:
+                await websocket.send_text(message)
+            # 느린 구독자로 판단되어 구독이 끊긴 경우
+            await websocket.close(code=1013)
+
+        async def wait_disconnect() -> None:
+            while (await websocket.receive())["type"] != "websocket.disconnect":
+                pass
+
+        tasks = {
+            asyncio.create_task(forward()),
+            asyncio.create_task(wait_disconnect()),
+        }
+        _, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
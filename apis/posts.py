@@ -1,22 +1,107 @@
-from typing import Annotated, List
-
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, select
-
-from core.database import get_session
-from core.auth import get_current_user
-from models.posts import Post
+from datetime import datetime
+from typing import Annotated, Any, List, Literal, Union
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy import insert, update
+from sqlmodel import func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from core.config import get_settings
+from core.database import (
+    get_read_session,
+    get_write_session,
+    read_your_writes,
+    replica_cache_ttl,
+)
+from core.auth import get_current_user, get_optional_user
+from core.conditional import build_validators, is_not_modified, not_modified_response
+from core.pagination import (
+    NEXT_CURSOR_HEADER,
+    encode_cursor,
+    keyset_condition,
+    keyset_order,
+)
+from core.projection import parse_fields, parse_ids, project_row
+from core.response_cache import response_cache
+from core.search import index_rows
+from core.serialization import model_response
+from models.posts import Comment, Post
 from models.users import User
-from schemas.posts import PostCreate, PostResponse, PostUpdate
+from schemas.bulk import BulkDeleteRequest, BulkItemResult, BulkResponse
+from schemas.comments import CommentResponse
+from schemas.posts import (
+    PostAuthorResponse,
+    PostBatchResponse,
+    PostBulkCreateRequest,
+    PostCreate,
+    PostDetailResponse,
+    PostResponse,
+    PostUpdate,
+)
+from schemas.users import UserInfoResponse
+
+settings = get_settings()
 
 post_router = APIRouter(prefix="/api/posts")
 
+row_list_adapter = TypeAdapter(List[dict[str, Any]])
+row_adapter = TypeAdapter(dict[str, Any])
+
+# 필드 선택(fields)에 사용할 수 있는 컬럼. excerpt는 본문 앞부분만 SQL에서 잘라온다
+POST_FIELD_COLUMNS = {
+    "id": Post.id,
+    "title": Post.title,
+    "content": Post.content,
+    # 잘렸는지 알 수 있도록 한 글자 더 가져온다
+    "excerpt": func.substr(Post.content, 1, settings.POST_EXCERPT_LENGTH + 1)
+    .label("excerpt"),
+    "user_name": User.user_name,
+    "comment_count": Post.comment_count,
+}
+POST_VIEW_FIELDS = {
+    "full": ("id", "title", "content", "user_name", "comment_count"),
+    "summary": ("id", "title", "excerpt", "user_name", "comment_count"),
+}
+
+
+def post_select(fields: list[str]):
+    """
+    요청된 필드와 페이지네이션/검증 헤더에 필요한 컬럼만 조회하는 쿼리를 만듭니다.
+    엔티티 전체를 로딩하지 않으므로 ORM 객체 생성 비용이 들지 않습니다.
+    """
+    columns = [POST_FIELD_COLUMNS[field] for field in fields if field != "id"]
+    return select(
+        Post.id,
+        Post.created_at,
+        Post.updated_at,
+        User.updated_at.label("user_updated_at"),
+        *columns,
+    ).join(User, Post.user_uuid == User.uuid)
+
+
+def post_version(post: Any) -> tuple[Any, ...]:
+    """
+    검증 헤더(ETag)에 사용할 게시글 행 버전입니다.
+    댓글 수 갱신은 updated_at을 바꾸지 않으므로, 조회한 경우 댓글 수도 포함합니다.
+    """
+    return (
+        post["id"],
+        post["updated_at"],
+        post["user_updated_at"],
+        post.get("comment_count"),
+    )
+
+
+def json_response(body: bytes, headers: dict[str, str] | None = None) -> Response:
+    return Response(content=body, media_type="application/json", headers=headers)
+
 
 @post_router.post("", response_model=PostResponse, status_code=status.HTTP_201_CREATED)
 async def create_post(
     request: PostCreate,
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Session = Depends(get_session),
+    db: AsyncSession = Depends(get_write_session),
 ):
     """
     새로운 게시글을 작성하는 엔드포인트입니다.
@@ -29,53 +114,172 @@ async def create_post(
         )
 
         db.add(new_post)
-        db.commit()
-        db.refresh(new_post)
+        await db.flush()
+        await index_rows(db, Post, [new_post.id])
+        await db.commit()
+        await db.refresh(new_post)
+
+        await response_cache.invalidate_post()
 
         # 응답 데이터 구성
-        return PostResponse(
-            id=new_post.id,
-            title=new_post.title,
-            content=new_post.content,
-            user_name=current_user.user_name,
+        return model_response(
+            PostResponse(
+                id=new_post.id,
+                title=new_post.title,
+                content=new_post.content,
+                user_name=current_user.user_name,
+            ),
+            PostResponse,
+            status_code=status.HTTP_201_CREATED,
         )
 
     except Exception as e:
         print(f"@@@@@@@@@@@ Error: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="게시글 작성 중 오류가 발생했습니다.",
         )
 
 
-@post_router.get("", response_model=List[PostResponse])
-async def get_posts(db: Session = Depends(get_session), skip: int = 0, limit: int = 10):
+async def get_posts_by_ids(
+    db: AsyncSession, post_ids: list[int], selected: list[str]
+) -> Any:
+    """
+    여러 게시글을 IN 쿼리 한 번으로 조회하여 요청 순서대로 정렬합니다.
+    삭제되었거나 존재하지 않는 게시글 id는 missing으로 반환합니다.
+    전체 필드를 요청하면 PostBatchResponse를, 필드를 골랐다면 고른 필드만 반환합니다.
+    """
+    rows = (
+        (
+            await db.exec(
+                post_select(selected).where(
+                    Post.id.in_(post_ids), Post.is_deleted == False
+                )
+            )
+        )
+        .mappings()
+        .all()
+    )
+    found = {row["id"]: row for row in rows}
+    items = [
+        project_row(found[post_id], selected, settings.POST_EXCERPT_LENGTH)
+        for post_id in post_ids
+        if post_id in found
+    ]
+    missing = [post_id for post_id in post_ids if post_id not in found]
+
+    if selected == list(POST_VIEW_FIELDS["full"]):
+        return model_response(
+            PostBatchResponse(
+                items=[PostResponse(**item) for item in items], missing=missing
+            ),
+            PostBatchResponse,
+        )
+    return json_response(row_adapter.dump_json({"items": items, "missing": missing}))
+
+
+@post_router.get("", response_model=Union[List[PostResponse], PostBatchResponse])
+async def get_posts(
+    request: Request,
+    db: AsyncSession = Depends(get_read_session),
+    skip: int = 0,
+    limit: int = 10,
+    cursor: str | None = None,
+    view: Literal["full", "summary"] = "full",
+    fields: str | None = None,
+    ids: str | None = None,
+):
     """
     게시글 목록을 조회하는 엔드포인트입니다.
     페이지네이션을 지원하며 누구나 접근 가능합니다.
+    ids=1,2,3이 주어지면 해당 게시글들을 한 번의 쿼리로 조회하여
+    {"items": [...], "missing": [...]} 형태로 요청 순서대로 반환합니다.
+    cursor가 주어지면 offset 대신 (created_at, id) 기준 키셋 페이지네이션을 사용하며,
+    다음 페이지 커서는 X-Next-Cursor 헤더로 반환합니다.
+    view=summary이면 본문 대신 미리보기(excerpt)를 반환하고,
+    fields=id,title처럼 필요한 필드만 골라 조회할 수도 있습니다.
+    직렬화된 응답은 글이 작성/수정/삭제될 때까지 캐시됩니다.
+    If-None-Match가 현재 ETag와 같으면 본문 없이 304를 반환합니다.
     """
     try:
+        selected = parse_fields(fields, POST_FIELD_COLUMNS, POST_VIEW_FIELDS[view])
+
+        if ids is not None:
+            return await get_posts_by_ids(
+                db, parse_ids(ids, settings.BATCH_MAX_IDS), selected
+            )
+
+        generation = await response_cache.generation()
+        cache_key = response_cache.feed_key(
+            generation, skip, limit, cursor, ",".join(selected)
+        )
+        # 최근에 쓴 사용자는 (복제본 결과였을 수 있는) 캐시 대신 primary에서 읽는다
+        cached = None
+        if not read_your_writes(request):
+            cached = await response_cache.get(cache_key)
+        if cached:
+            body, headers = cached
+            if is_not_modified(request, headers, check_modified_since=False):
+                return not_modified_response(headers)
+            return json_response(body, headers)
+
         # 삭제되지 않은 게시글만 조회
-        posts = db.exec(
-            select(Post, User)
-            .join(User, Post.user_uuid == User.uuid)
+        query = (
+            post_select(selected)
             .where(Post.is_deleted == False)
-            .offset(skip)
+            .order_by(*keyset_order(Post))
             .limit(limit)
-            .order_by(Post.created_at.desc())
-        ).all()
+        )
+        if cursor:
+            query = query.where(keyset_condition(Post, cursor))
+        else:
+            query = query.offset(skip)
+
+        posts = (await db.exec(query)).mappings().all()
+
+        # 페이지가 가득 찼다면 마지막 행 기준으로 다음 커서를 발급
+        headers = {}
+        if posts and len(posts) == limit:
+            last_post = posts[-1]
+            headers[NEXT_CURSOR_HEADER] = encode_cursor(
+                last_post["created_at"], last_post["id"]
+            )
 
-        # (Post, User) 튜플을 PostResponse로 변환
-        return [
-            PostResponse(
-                id=post.id,
-                title=post.title,
-                content=post.content,
-                user_name=user.user_name,
+        # 행 버전으로 검증 헤더를 만들고, 바뀐 것이 없으면 직렬화 없이 304 반환
+        headers.update(
+            build_validators(
+                [selected] + [post_version(post) for post in posts],
+                max(
+                    (
+                        max(post["updated_at"], post["user_updated_at"])
+                        for post in posts
+                    ),
+                    default=None,
+                ),
             )
-            for post, user in posts
-        ]
+        )
+        if is_not_modified(request, headers, check_modified_since=False):
+            return not_modified_response(headers)
+
+        body = row_list_adapter.dump_json(
+            [
+                project_row(post, selected, settings.POST_EXCERPT_LENGTH)
+                for post in posts
+            ]
+        )
+        await response_cache.set(
+            cache_key,
+            body,
+            headers,
+            generation=generation,
+            ttl=replica_cache_ttl(db),
+        )
+
+        return json_response(body, headers)
+
+    except HTTPException:
+        raise
 
     except Exception as e:
         raise HTTPException(
@@ -85,30 +289,188 @@ async def get_posts(db: Session = Depends(get_session), skip: int = 0, limit: in
 
 
 @post_router.get("/{post_id}", response_model=PostResponse)
-async def get_post(post_id: int, db: Session = Depends(get_session)):
+async def get_post(
+    post_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_read_session),
+    fields: str | None = None,
+):
     """
     특정 게시글을 조회하는 엔드포인트입니다.
     게시글 ID를 통해 조회하며 누구나 접근 가능합니다.
+    fields=title,content처럼 필요한 필드만 골라 조회할 수 있습니다.
+    If-None-Match / If-Modified-Since 조건을 만족하면 본문 없이 304를 반환합니다.
+    댓글 수(comment_count)를 포함한 응답은 If-None-Match로만 비교합니다.
     """
     try:
+        selected = parse_fields(fields, POST_FIELD_COLUMNS, POST_VIEW_FIELDS["full"])
+        # 댓글 수 갱신은 updated_at(Last-Modified)을 바꾸지 않으므로 ETag로만 비교한다
+        check_modified_since = "comment_count" not in selected
+
+        generation = await response_cache.generation()
+        cache_key = await response_cache.post_key(post_id, ",".join(selected))
+        cached = None
+        if not read_your_writes(request):
+            cached = await response_cache.get(cache_key)
+        if cached:
+            body, headers = cached
+            if is_not_modified(request, headers, check_modified_since):
+                return not_modified_response(headers)
+            return json_response(body, headers)
+
         # 게시글과 작성자 정보를 함께 조회
-        result = db.exec(
-            select(Post, User)
-            .join(User, Post.user_uuid == User.uuid)
-            .where(Post.id == post_id, Post.is_deleted == False)
-        ).first()
+        post = (
+            (
+                await db.exec(
+                    post_select(selected).where(
+                        Post.id == post_id, Post.is_deleted == False
+                    )
+                )
+            )
+            .mappings()
+            .first()
+        )
 
-        if not result:
+        if not post:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="게시글을 찾을 수 없습니다.",
             )
 
-        post, user = result
+        headers = build_validators(
+            [selected, post_version(post)],
+            max(post["updated_at"], post["user_updated_at"]),
+        )
+        if is_not_modified(request, headers, check_modified_since):
+            return not_modified_response(headers)
 
-        return PostResponse(
-            id=post.id, title=post.title, content=post.content, user_name=user.user_name
+        body = row_adapter.dump_json(
+            project_row(post, selected, settings.POST_EXCERPT_LENGTH)
         )
+        await response_cache.set(
+            cache_key,
+            body,
+            headers,
+            generation=generation,
+            ttl=replica_cache_ttl(db),
+        )
+
+        return json_response(body, headers)
+
+    except HTTPException:
+        raise
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="게시글 조회 중 오류가 발생했습니다.",
+        )
+
+
+async def load_feed_page(
+    db: AsyncSession, limit: int
+) -> list[tuple[dict[str, Any], tuple[Any, ...]]]:
+    """
+    첫 화면에 보여줄 게시글 목록 첫 페이지를 요약(summary) 형태로 조회합니다.
+    각 항목은 (응답 dict, 렌더링 조각 캐시용 버전) 쌍입니다.
+    """
+    rows = (
+        await db.exec(
+            post_select(list(POST_VIEW_FIELDS["summary"]))
+            .where(Post.is_deleted == False)
+            .order_by(*keyset_order(Post))
+            .limit(limit)
+        )
+    ).mappings()
+    return [
+        (
+            project_row(
+                row, POST_VIEW_FIELDS["summary"], settings.POST_EXCERPT_LENGTH
+            ),
+            (row["id"], row["updated_at"], row["user_updated_at"]),
+        )
+        for row in rows
+    ]
+
+
+async def load_post_detail(
+    db: AsyncSession, post_id: int, viewer: User | None, comment_limit: int
+) -> tuple[PostDetailResponse, tuple[datetime, datetime]]:
+    """
+    게시글+작성자 1회, 댓글+작성자 1회의 쿼리로 상세 페이지 데이터를 조회합니다.
+    렌더링 조각 캐시 키로 쓸 수 있도록 게시글/작성자 버전(updated_at)도 함께 반환합니다.
+    """
+    # 게시글과 작성자 정보를 함께 조회
+    post = (
+        (
+            await db.exec(
+                post_select(list(POST_VIEW_FIELDS["full"])).where(
+                    Post.id == post_id, Post.is_deleted == False
+                )
+            )
+        )
+        .mappings()
+        .first()
+    )
+
+    if not post:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="게시글을 찾을 수 없습니다.",
+        )
+
+    # 첫 댓글 페이지 조회 (게시글 존재 여부는 위에서 이미 확인)
+    comments = (
+        await db.exec(
+            select(Comment.id, Comment.created_at, Comment.content, User.user_name)
+            .join(User, Comment.user_uuid == User.uuid)
+            .where(Comment.post_id == post_id, Comment.is_deleted == False)
+            .order_by(*keyset_order(Comment))
+            .limit(comment_limit)
+        )
+    ).all()
+
+    next_comment_cursor = None
+    if comments and len(comments) == comment_limit:
+        next_comment_cursor = encode_cursor(comments[-1].created_at, comments[-1].id)
+
+    detail = PostDetailResponse(
+        post=PostResponse(**project_row(post, POST_VIEW_FIELDS["full"])),
+        author=PostAuthorResponse(user_name=post["user_name"]),
+        comments=[
+            CommentResponse(
+                id=comment.id,
+                content=comment.content,
+                user_name=comment.user_name,
+                post_id=post_id,
+            )
+            for comment in comments
+        ],
+        next_comment_cursor=next_comment_cursor,
+        viewer=(
+            UserInfoResponse(email=viewer.email, user_name=viewer.user_name)
+            if viewer
+            else None
+        ),
+    )
+    return detail, (post["updated_at"], post["user_updated_at"])
+
+
+@post_router.get("/{post_id}/detail", response_model=PostDetailResponse)
+async def get_post_detail(
+    post_id: int,
+    viewer: Annotated[User | None, Depends(get_optional_user)],
+    db: AsyncSession = Depends(get_read_session),
+    comment_limit: int = 50,
+):
+    """
+    게시글 상세 페이지에 필요한 게시글, 작성자, 첫 댓글 페이지, 현재 사용자 정보를
+    한 번에 반환하는 엔드포인트입니다. 누구나 접근 가능합니다.
+    게시글+작성자 1회, 댓글+작성자 1회의 쿼리로 구성됩니다.
+    """
+    try:
+        detail, _ = await load_post_detail(db, post_id, viewer, comment_limit)
+        return model_response(detail, PostDetailResponse)
 
     except HTTPException:
         raise
@@ -125,7 +487,7 @@ async def update_post(
     post_id: int,
     request: PostUpdate,
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Session = Depends(get_session),
+    db: AsyncSession = Depends(get_write_session),
 ):
     """
     게시글을 수정하는 엔드포인트입니다.
@@ -133,8 +495,10 @@ async def update_post(
     """
     try:
         # 게시글 조회
-        post = db.exec(
-            select(Post).where(Post.id == post_id, Post.is_deleted == False)
+        post = (
+            await db.exec(
+                select(Post).where(Post.id == post_id, Post.is_deleted == False)
+            )
         ).first()
 
         if not post:
@@ -157,21 +521,29 @@ async def update_post(
             post.content = request.content
 
         db.add(post)
-        db.commit()
-        db.refresh(post)
+        await db.flush()
+        await index_rows(db, Post, [post.id])
+        await db.commit()
+        await db.refresh(post)
 
-        return PostResponse(
-            id=post.id,
-            title=post.title,
-            content=post.content,
-            user_name=current_user.user_name,
+        await response_cache.invalidate_post(post_id)
+
+        return model_response(
+            PostResponse(
+                id=post.id,
+                title=post.title,
+                content=post.content,
+                user_name=current_user.user_name,
+                comment_count=post.comment_count,
+            ),
+            PostResponse,
         )
 
     except HTTPException:
         raise
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="게시글 수정 중 오류가 발생했습니다.",
@@ -182,7 +554,7 @@ async def update_post(
 async def delete_post(
     post_id: int,
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Session = Depends(get_session),
+    db: AsyncSession = Depends(get_write_session),
 ):
     """
     게시글을 삭제하는 엔드포인트입니다.
@@ -190,8 +562,10 @@ async def delete_post(
     """
     try:
         # 게시글 조회
-        post = db.exec(
-            select(Post).where(Post.id == post_id, Post.is_deleted == False)
+        post = (
+            await db.exec(
+                select(Post).where(Post.id == post_id, Post.is_deleted == False)
+            )
         ).first()
 
         if not post:
@@ -211,14 +585,146 @@ async def delete_post(
         post.soft_delete()
 
         db.add(post)
-        db.commit()
+        await db.commit()
+
+        await response_cache.invalidate_post(post_id)
 
     except HTTPException:
         raise
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="게시글 삭제 중 오류가 발생했습니다.",
         )
+
+
+@post_router.post("/bulk", response_model=BulkResponse)
+async def bulk_create_posts(
+    request: PostBulkCreateRequest,
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: AsyncSession = Depends(get_write_session),
+):
+    """
+    여러 게시글을 한 번에 작성하는 엔드포인트입니다.
+    다중 행 INSERT 한 번으로 하나의 트랜잭션에서 처리하며,
+    결과는 항목별 상태로 반환합니다.
+    """
+    try:
+        now = datetime.now()
+        new_ids = (
+            await db.exec(
+                insert(Post).returning(Post.id, sort_by_parameter_order=True),
+                params=[
+                    {
+                        "title": item.title,
+                        "content": item.content,
+                        "user_uuid": current_user.uuid,
+                        "created_at": now,
+                        "updated_at": now,
+                        "is_deleted": False,
+                        "comment_count": 0,
+                    }
+                    for item in request.items
+                ],
+            )
+        ).scalars().all()
+        await index_rows(db, Post, new_ids)
+
+        await db.commit()
+
+        await response_cache.invalidate_post()
+
+        return model_response(
+            BulkResponse(
+                results=[
+                    BulkItemResult(
+                        index=index, id=new_id, status=status.HTTP_201_CREATED
+                    )
+                    for index, new_id in enumerate(new_ids)
+                ]
+            ),
+            BulkResponse,
+        )
+
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="게시글 일괄 작성 중 오류가 발생했습니다.",
+        )
+
+
+@post_router.post("/bulk-delete", response_model=BulkResponse)
+async def bulk_delete_posts(
+    request: BulkDeleteRequest,
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: AsyncSession = Depends(get_write_session),
+):
+    """
+    여러 게시글을 한 번에 소프트 삭제하는 엔드포인트입니다.
+    작성자 확인을 한 번의 조회로 처리하고, 본인 게시글만 삭제합니다.
+    결과는 항목별 상태로 반환합니다.
+    """
+    try:
+        # 대상 게시글의 작성자를 한 번에 조회
+        rows = (
+            await db.exec(
+                select(Post.id, Post.user_uuid).where(
+                    Post.id.in_(request.ids), Post.is_deleted == False
+                )
+            )
+        ).all()
+        owners = {row.id: row.user_uuid for row in rows}
+        deletable = [
+            post_id for post_id, owner in owners.items() if owner == current_user.uuid
+        ]
+
+        if deletable:
+            await db.exec(
+                update(Post)
+                .where(Post.id.in_(deletable))
+                .values(is_deleted=True, deleted_at=datetime.now())
+            )
+
+        await db.commit()
+
+        for post_id in deletable:
+            await response_cache.invalidate_post(post_id)
+
+        results = []
+        for index, post_id in enumerate(request.ids):
+            if post_id not in owners:
+                results.append(
+                    BulkItemResult(
+                        index=index,
+                        id=post_id,
+                        status=status.HTTP_404_NOT_FOUND,
+                        detail="게시글을 찾을 수 없습니다.",
+                    )
+                )
+            elif owners[post_id] != current_user.uuid:
+                results.append(
+                    BulkItemResult(
+                        index=index,
+                        id=post_id,
+                        status=status.HTTP_403_FORBIDDEN,
+                        detail="게시글을 삭제할 권한이 없습니다.",
+                    )
+                )
+            else:
+                results.append(
+                    BulkItemResult(
+                        index=index, id=post_id, status=status.HTTP_204_NO_CONTENT
+                    )
+                )
+
+        return model_response(BulkResponse(results=results), BulkResponse)
+
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="게시글 일괄 삭제 중 오류가 발생했습니다.",
+        )
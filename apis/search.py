@@ -0,0 +1,137 @@
+from typing import Any, Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from apis.comments import comment_select
+from apis.posts import POST_VIEW_FIELDS, post_select
+from core.config import get_settings
+from core.database import get_read_session
+from core.pagination import (
+    NEXT_CURSOR_HEADER,
+    encode_rank_cursor,
+    rank_keyset_condition,
+)
+from core.projection import project_row
+from core.search import ranked_matches
+from models.posts import Comment, Post
+
+settings = get_settings()
+
+search_router = APIRouter(prefix="/api/search")
+
+SEARCH_COMMENT_FIELDS = ("id", "content", "user_name", "post_id")
+
+
+def validate_query(q: str) -> str:
+    if not q.strip():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="검색어를 입력해주세요."
+        )
+    return q.strip()
+
+
+def set_next_cursor(response: Response, rows: list[Any], limit: int) -> None:
+    # 페이지가 가득 찼다면 마지막 행 기준으로 다음 커서를 발급
+    if rows and len(rows) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_rank_cursor(
+            rows[-1]["score"], rows[-1]["id"]
+        )
+
+
+@search_router.get("/posts")
+async def search_posts(
+    response: Response,
+    q: str = Query(max_length=200),
+    db: AsyncSession = Depends(get_read_session),
+    limit: int = 10,
+    cursor: str | None = None,
+    view: Literal["full", "summary"] = "summary",
+):
+    """
+    게시글 제목과 본문을 전문 검색하는 엔드포인트입니다. 누구나 접근 가능합니다.
+    관련도가 높은 순으로 반환하며, 다음 페이지 커서는 X-Next-Cursor 헤더로 반환합니다.
+    Postgres에서는 search_vector(GIN 인덱스), SQLite에서는 FTS5 색인을 사용합니다.
+    """
+    try:
+        q = validate_query(q)
+        selected = POST_VIEW_FIELDS[view]
+        matches = ranked_matches(db.bind.dialect.name, Post, q)
+
+        query = (
+            post_select(list(selected))
+            .add_columns(matches.c.score)
+            .join(matches, matches.c.id == Post.id)
+            .where(Post.is_deleted == False)
+            .order_by(matches.c.score.desc(), Post.id.desc())
+            .limit(limit)
+        )
+        if cursor:
+            query = query.where(
+                rank_keyset_condition(matches.c.score, Post.id, cursor)
+            )
+
+        rows = (await db.exec(query)).mappings().all()
+        set_next_cursor(response, rows, limit)
+
+        return [
+            project_row(row, selected, settings.POST_EXCERPT_LENGTH) for row in rows
+        ]
+
+    except HTTPException:
+        raise
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="게시글 검색 중 오류가 발생했습니다.",
+        )
+
+
+@search_router.get("/comments")
+async def search_comments(
+    response: Response,
+    q: str = Query(max_length=200),
+    post_id: int | None = None,
+    db: AsyncSession = Depends(get_read_session),
+    limit: int = 50,
+    cursor: str | None = None,
+):
+    """
+    댓글 내용을 전문 검색하는 엔드포인트입니다. 누구나 접근 가능합니다.
+    post_id가 주어지면 해당 게시글의 댓글만 검색합니다.
+    삭제된 댓글과 삭제된 게시글에 달린 댓글은 제외합니다.
+    """
+    try:
+        q = validate_query(q)
+        matches = ranked_matches(db.bind.dialect.name, Comment, q)
+
+        query = (
+            comment_select(list(SEARCH_COMMENT_FIELDS))
+            .add_columns(matches.c.score)
+            .join(matches, matches.c.id == Comment.id)
+            .join(Post, Comment.post_id == Post.id)
+            .where(Comment.is_deleted == False, Post.is_deleted == False)
+            .order_by(matches.c.score.desc(), Comment.id.desc())
+            .limit(limit)
+        )
+        if post_id is not None:
+            query = query.where(Comment.post_id == post_id)
+        if cursor:
+            query = query.where(
+                rank_keyset_condition(matches.c.score, Comment.id, cursor)
+            )
+
+        rows = (await db.exec(query)).mappings().all()
+        set_next_cursor(response, rows, limit)
+
+        return [project_row(row, SEARCH_COMMENT_FIELDS) for row in rows]
+
+    except HTTPException:
+        raise
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="댓글 검색 중 오류가 발생했습니다.",
+        )
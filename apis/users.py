@@ -3,10 +3,15 @@ from datetime import timedelta
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status, Response
-from sqlmodel import Session, select
-
-from core.database import get_session
-from core.security import get_password_hash, verify_password, create_access_token
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from core.database import get_write_session
+from core.security import (
+    get_password_hash_async,
+    verify_password_async,
+    create_access_token,
+)
 from core.auth import get_current_user
 from models.users import User
 from schemas.users import SignUpRequest, SignInRequest
@@ -15,7 +20,9 @@ user_router = APIRouter(prefix="/api/users")
 
 
 @user_router.post("/signup", status_code=status.HTTP_201_CREATED)
-async def signup(request: SignUpRequest, db: Session = Depends(get_session)):
+async def signup(
+    request: SignUpRequest, db: AsyncSession = Depends(get_write_session)
+):
     """
     회원가입을 처리하는 엔드포인트입니다.
     1. 비밀번호 확인
@@ -30,29 +37,34 @@ async def signup(request: SignUpRequest, db: Session = Depends(get_session)):
         )
 
     # 이메일 중복 확인
-    existing_user = db.exec(select(User).where(User.email == request.email)).first()
+    existing_user = (
+        await db.exec(select(User).where(User.email == request.email))
+    ).first()
 
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT, detail="이미 등록된 이메일입니다."
         )
 
+    # 비밀번호 해시는 워커 풀에서 처리 (풀이 가득 차면 503)
+    hashed_password = await get_password_hash_async(request.password)
+
     try:
         # 새로운 사용자 생성
         new_user = User(
             email=request.email,
-            password=get_password_hash(request.password),
+            password=hashed_password,
             user_name=request.user_name,
             uuid=str(uuid.uuid4()),
         )
 
         db.add(new_user)
-        db.commit()
+        await db.commit()
 
         return {"message": "회원가입이 완료되었습니다."}
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="회원가입 처리 중 오류가 발생했습니다.",
@@ -61,7 +73,9 @@ async def signup(request: SignUpRequest, db: Session = Depends(get_session)):
 
 @user_router.post("/login")
 async def signin(
-    request: SignInRequest, response: Response, db: Session = Depends(get_session)
+    request: SignInRequest,
+    response: Response,
+    db: AsyncSession = Depends(get_write_session),
 ):
     """
     로그인을 처리하는 엔드포인트입니다.
@@ -71,9 +85,13 @@ async def signin(
     """
     try:
         # 사용자 조회 및 비밀번호 검증
-        user = db.exec(select(User).where(User.email == request.email)).first()
+        user = (
+            await db.exec(select(User).where(User.email == request.email))
+        ).first()
 
-        if not user or not verify_password(request.password, user.password):
+        if not user or not await verify_password_async(
+            request.password, user.password
+        ):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="이메일 또는 비밀번호가 올바르지 않습니다.",
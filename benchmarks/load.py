@@ -0,0 +1,497 @@
+"""
+시드 데이터를 넣은 로컬 DB로 앱(uvicorn)을 띄우고, 동시 httpx 클라이언트로
+읽기/쓰기 혼합 부하를 걸어 엔드포인트별 처리량과 p50/p95/p99 지연 시간을 잽니다.
+결과는 JSON으로 저장하며 --compare로 이전 결과와 비교할 수 있습니다.
+
+    python -m benchmarks.load                                   # 임시 SQLite
+    python -m benchmarks.load --db-url sqlite:///./load.db --workers 4
+    python -m benchmarks.load --mix get_posts=80,get_comments=20 --concurrency 64
+    python -m benchmarks.load --compare benchmarks/results/load-20261017-120000.json
+
+DB 설정(.env)은 앱을 불러오는 데만 필요하며, 요청은 --db-url의 DB로 처리합니다.
+--db-url의 DB는 테이블을 모두 지우고 다시 만듭니다. 실수로 실제 DB를 지우지 않도록
+SQLite가 아니거나 테이블이 이미 있는 DB는 --reset을 함께 줘야 실행합니다.
+
+    python -m benchmarks.load --db-url postgresql://u:p@localhost/bench --reset
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+import httpx
+from sqlalchemy import insert, inspect, text
+from sqlalchemy.engine import Connection, make_url
+from sqlmodel import SQLModel, create_engine, select
+
+from core.pagination import NEXT_CURSOR_HEADER
+from core.search import index_missing_statements
+from core.security import get_password_hash
+from models.posts import Comment, Post
+from models.users import User
+
+# 앱 팩토리(create_app)가 사용할 DB URL을 넘기는 환경 변수
+DB_URL_ENV = "LOAD_DB_URL"
+
+PASSWORD = "loadtest-password"
+DEFAULT_MIX = "get_posts=50,get_comments=30,create_comment=15,signin=5"
+RESULTS_DIR = Path(__file__).parent / "results"
+BATCH_SIZE = 5_000
+
+
+def async_url(db_url: str) -> str:
+    if db_url.startswith("sqlite:"):
+        return db_url.replace("sqlite:", "sqlite+aiosqlite:", 1)
+    if db_url.startswith("postgresql:"):
+        return db_url.replace("postgresql:", "postgresql+asyncpg:", 1)
+    return db_url
+
+
+def create_app() -> Any:
+    """
+    uvicorn --factory용 앱 팩토리입니다.
+    요청 세션을 LOAD_DB_URL의 DB로 바꿔 끼운 앱을 반환합니다.
+    """
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    from core.config import get_settings
+    from core.database import get_async_session
+    from main import app
+
+    settings = get_settings()
+    db_url = async_url(os.environ[DB_URL_ENV])
+    # aiosqlite는 풀 설정을 받지 않으므로 Postgres에서만 운영 풀 설정을 따른다
+    pool_options = (
+        {}
+        if db_url.startswith("sqlite")
+        else {
+            "pool_size": settings.db.DB_POOL_SIZE,
+            "max_overflow": settings.db.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.db.DB_POOL_TIMEOUT,
+        }
+    )
+    engine = create_async_engine(db_url, **pool_options)
+    session_factory = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    async def get_load_session():
+        async with session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_async_session] = get_load_session
+    return app
+
+
+def seed(conn: Connection, users: int, posts: int, comments_per_post: int) -> None:
+    """
+    사용자/게시글/댓글을 배치로 넣고 검색 색인을 만듭니다.
+    모든 사용자의 비밀번호는 PASSWORD이며, 해시는 한 번만 계산해 재사용합니다.
+    """
+    now = datetime.now()
+    password = get_password_hash(PASSWORD)
+    conn.execute(
+        insert(User),
+        [
+            {
+                "email": f"user{i}@example.com",
+                "password": password,
+                "user_name": f"user{i}",
+                "uuid": str(uuid.uuid4()),
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(users)
+        ],
+    )
+    user_uuids = list(conn.execute(select(User.uuid).order_by(User.id)).scalars())
+
+    rows = (
+        {
+            "title": f"게시글 {i}",
+            "content": f"부하 테스트용 게시글 {i}의 본문입니다. " * 10,
+            "user_uuid": user_uuids[i % users],
+            "created_at": now - timedelta(seconds=posts - i),
+            "updated_at": now - timedelta(seconds=posts - i),
+            "comment_count": comments_per_post,
+        }
+        for i in range(posts)
+    )
+    for batch in iter(lambda: list(itertools.islice(rows, BATCH_SIZE)), []):
+        conn.execute(insert(Post), batch)
+
+    post_ids = list(conn.execute(select(Post.id).order_by(Post.id)).scalars())
+    rows = (
+        {
+            "content": f"댓글 {n}",
+            "post_id": post_id,
+            "user_uuid": user_uuids[(post_id + n) % users],
+            "created_at": now,
+            "updated_at": now,
+        }
+        for post_id in post_ids
+        for n in range(comments_per_post)
+    )
+    for batch in iter(lambda: list(itertools.islice(rows, BATCH_SIZE)), []):
+        conn.execute(insert(Comment), batch)
+
+    for model in (Post, Comment):
+        for statement in index_missing_statements(conn.dialect.name, model):
+            conn.execute(statement)
+
+
+def prepare_database(args: argparse.Namespace) -> tuple[str, int]:
+    """
+    DB를 새로 만들고 시드 데이터를 넣은 뒤 (DB URL, 게시글 수)를 반환합니다.
+    """
+    db_url = args.db_url or f"sqlite:///{tempfile.mkdtemp()}/load.db"
+    # 지정한 DB는 전부 지우고 다시 만들므로, 빈 SQLite가 아니면 --reset을 요구한다
+    guarded = args.db_url is not None and not args.reset
+    if guarded and make_url(db_url).get_backend_name() != "sqlite":
+        sys.exit(f"{db_url}: SQLite가 아닌 DB를 초기화하려면 --reset이 필요합니다.")
+
+    engine = create_engine(db_url)
+    if guarded and inspect(engine).get_table_names():
+        sys.exit(f"{db_url}: 비어 있지 않은 DB를 초기화하려면 --reset이 필요합니다.")
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+
+    started_at = time.perf_counter()
+    with engine.begin() as conn:
+        if engine.dialect.name == "sqlite":
+            # 읽기와 쓰기가 서로를 막지 않도록 WAL 모드 사용
+            conn.execute(text("PRAGMA journal_mode=WAL"))
+        seed(conn, args.users, args.posts, args.comments_per_post)
+        conn.execute(text("ANALYZE"))
+    engine.dispose()
+    print(f"seed: {time.perf_counter() - started_at:.1f} s ({db_url})")
+    return db_url, args.posts
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(db_url: str, port: int, workers: int) -> subprocess.Popen:
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "benchmarks.load:create_app",
+            "--factory",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ],
+        env={**os.environ, DB_URL_ENV: db_url},
+    )
+
+
+async def wait_until_ready(
+    server: subprocess.Popen, base_url: str, timeout: float = 30
+) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while True:
+            if server.poll() is not None:
+                raise RuntimeError("서버 프로세스가 종료되었습니다.")
+            try:
+                if (await client.get("/health")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError("서버가 시간 안에 시작되지 않았습니다.")
+            await asyncio.sleep(0.2)
+
+
+@dataclass
+class Results:
+    latencies: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    errors: dict[str, dict[str, int]] = field(
+        default_factory=lambda: defaultdict(lambda: defaultdict(int))
+    )
+
+    def record(self, endpoint: str, elapsed: float, status_code: int | str) -> None:
+        if isinstance(status_code, int) and status_code < 400:
+            self.latencies[endpoint].append(elapsed)
+        else:
+            self.errors[endpoint][str(status_code)] += 1
+
+
+class VirtualUser:
+    """
+    로그인 쿠키를 가진 클라이언트 하나입니다. 매 반복마다 부하 비율에 따라
+    작업 하나를 골라 실행합니다. 인기 게시글에 요청이 몰리도록 게시글은
+    지프 분포로 고릅니다.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        rng: random.Random,
+        email: str,
+        post_weights: list[float],
+    ):
+        self.client = client
+        self.rng = rng
+        self.email = email
+        self.post_weights = post_weights
+        self.next_cursor: str | None = None
+
+    def pick_post(self) -> int:
+        return self.rng.choices(
+            range(1, len(self.post_weights) + 1), cum_weights=self.post_weights
+        )[0]
+
+    async def get_posts(self) -> httpx.Response:
+        response = await self.client.get("/api/posts", params={"limit": 20})
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        # 일부 사용자는 다음 반복에서 다음 페이지까지 넘겨 본다 (get_posts_next로 기록)
+        if cursor and self.rng.random() < 0.3:
+            self.next_cursor = cursor
+        return response
+
+    async def get_posts_next(self) -> httpx.Response:
+        cursor, self.next_cursor = self.next_cursor, None
+        return await self.client.get(
+            "/api/posts", params={"limit": 20, "cursor": cursor}
+        )
+
+    async def get_comments(self) -> httpx.Response:
+        return await self.client.get(
+            "/api/comments", params={"post_id": self.pick_post(), "limit": 50}
+        )
+
+    async def create_comment(self) -> httpx.Response:
+        return await self.client.post(
+            "/api/comments",
+            params={"post_id": self.pick_post()},
+            json={"content": f"부하 테스트 댓글 {self.rng.random()}"},
+        )
+
+    async def signin(self) -> httpx.Response:
+        response = await self.client.post(
+            "/api/users/login", json={"email": self.email, "password": PASSWORD}
+        )
+        # 쿠키가 secure로 설정되어 http 요청에는 자동으로 실리지 않으므로 직접 넣는다
+        if token := response.cookies.get("access_token"):
+            self.client.cookies.set("access_token", token)
+        return response
+
+
+def parse_mix(mix: str) -> dict[str, float]:
+    weights = {}
+    for part in mix.split(","):
+        name, _, weight = part.partition("=")
+        if not hasattr(VirtualUser, name.strip()):
+            raise ValueError(f"알 수 없는 작업입니다: {name}")
+        weights[name.strip()] = float(weight)
+    return weights
+
+
+async def run_user(
+    user: VirtualUser,
+    mix: dict[str, float],
+    results: Results,
+    record_from: float,
+    deadline: float,
+) -> None:
+    names, weights = list(mix), list(mix.values())
+    while (now := time.perf_counter()) < deadline:
+        if user.next_cursor:
+            name = "get_posts_next"
+        else:
+            name = user.rng.choices(names, weights=weights)[0]
+        operation: Callable[[], Awaitable[httpx.Response]] = getattr(user, name)
+        try:
+            status_code: int | str = (await operation()).status_code
+        except httpx.HTTPError as e:
+            status_code = type(e).__name__
+        if now >= record_from:
+            results.record(name, time.perf_counter() - now, status_code)
+
+
+async def run_load(base_url: str, posts: int, args: argparse.Namespace) -> Results:
+    mix = parse_mix(args.mix)
+    post_weights = list(
+        itertools.accumulate(1 / (rank + 1) ** args.zipf for rank in range(posts))
+    )
+    results = Results()
+    limits = httpx.Limits(max_connections=1, max_keepalive_connections=1)
+
+    clients = [
+        httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30)
+        for _ in range(args.concurrency)
+    ]
+    try:
+        users = []
+        for i, client in enumerate(clients):
+            user = VirtualUser(
+                client,
+                random.Random(args.seed + i),
+                f"user{i % args.users}@example.com",
+                post_weights,
+            )
+            (await user.signin()).raise_for_status()
+            users.append(user)
+
+        started_at = time.perf_counter()
+        record_from = started_at + args.warmup
+        deadline = record_from + args.duration
+        await asyncio.gather(
+            *(run_user(user, mix, results, record_from, deadline) for user in users)
+        )
+    finally:
+        await asyncio.gather(*(client.aclose() for client in clients))
+    return results
+
+
+def percentile(values: list[float], p: float) -> float:
+    """
+    nearest-rank 방식 백분위수입니다. values는 정렬되어 있어야 합니다.
+    """
+    if not values:
+        return 0.0
+    return values[max(0, math.ceil(p / 100 * len(values)) - 1)]
+
+
+def summarize(results: Results, duration: float) -> dict[str, Any]:
+    endpoints = {}
+    for name in sorted(set(results.latencies) | set(results.errors)):
+        latencies = sorted(results.latencies.get(name, []))
+        endpoints[name] = {
+            "requests": len(latencies),
+            "errors": dict(results.errors.get(name, {})),
+            "throughput_rps": len(latencies) / duration,
+            "mean_ms": sum(latencies) / len(latencies) * 1000 if latencies else 0.0,
+            "p50_ms": percentile(latencies, 50) * 1000,
+            "p95_ms": percentile(latencies, 95) * 1000,
+            "p99_ms": percentile(latencies, 99) * 1000,
+        }
+    total = sum(endpoint["requests"] for endpoint in endpoints.values())
+    return {"throughput_rps": total / duration, "endpoints": endpoints}
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_report(summary: dict[str, Any], baseline: dict[str, Any] | None) -> None:
+    print(
+        f"\n{'endpoint':<16} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} "
+        f"{'p99 ms':>9} {'errors':>7}"
+    )
+    for name, stats in summary["endpoints"].items():
+        errors = sum(stats["errors"].values())
+        print(
+            f"{name:<16} {stats['throughput_rps']:>9.1f} {stats['p50_ms']:>9.2f} "
+            f"{stats['p95_ms']:>9.2f} {stats['p99_ms']:>9.2f} {errors:>7}"
+        )
+        previous = (baseline or {}).get("endpoints", {}).get(name)
+        if previous:
+            print(
+                f"{'  vs baseline':<16} "
+                f"{change(stats['throughput_rps'], previous['throughput_rps']):>9} "
+                f"{change(stats['p50_ms'], previous['p50_ms']):>9} "
+                f"{change(stats['p95_ms'], previous['p95_ms']):>9} "
+                f"{change(stats['p99_ms'], previous['p99_ms']):>9}"
+            )
+    print(f"\ntotal: {summary['throughput_rps']:.1f} req/s")
+
+
+def change(current: float, previous: float) -> str:
+    if previous == 0:
+        return "-"
+    return f"{(current - previous) / previous * 100:+.1f}%"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--db-url", default=None)
+    parser.add_argument(
+        "--reset",
+        action="store_true",
+        help="--db-url의 DB가 SQLite가 아니거나 비어 있지 않아도 지우고 다시 만든다",
+    )
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--posts", type=int, default=5_000)
+    parser.add_argument("--comments-per-post", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=30, help="측정 시간(초)")
+    parser.add_argument("--warmup", type=float, default=5, help="측정 전 예열(초)")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="작업=비율,...")
+    parser.add_argument("--zipf", type=float, default=1.0, help="게시글 인기 편중도")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--compare", type=Path, default=None)
+    args = parser.parse_args()
+    parse_mix(args.mix)
+
+    db_url, posts = prepare_database(args)
+    port = free_port()
+    server = start_server(db_url, port, args.workers)
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        asyncio.run(wait_until_ready(server, base_url))
+        results = asyncio.run(run_load(base_url, posts, args))
+    finally:
+        server.terminate()
+        server.wait()
+
+    summary = summarize(results, args.duration)
+    report = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "config": {
+            key: str(value) if isinstance(value, Path) else value
+            for key, value in vars(args).items()
+            if key != "db_url"  # 접속 정보(비밀번호)는 남기지 않는다
+        }
+        | {"db_dialect": db_url.split(":", 1)[0]},
+        **summary,
+    }
+    baseline = json.loads(args.compare.read_text()) if args.compare else None
+    print_report(summary, baseline)
+
+    output = args.output or RESULTS_DIR / f"load-{datetime.now():%Y%m%d-%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n")
+    print(f"results: {output}")
+
+
+if __name__ == "__main__":
+    main()
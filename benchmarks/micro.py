@@ -0,0 +1,217 @@
+"""
+요청마다 실행되는 인증(core.security)과 응답 스키마 생성/직렬화 비용을 잽니다.
+케이스마다 예열 후 반복 측정해 중앙값/표준편차를 출력하고, 기준 파일보다
+중앙값이 threshold 이상 느려진 케이스가 있으면 종료 코드 1로 실패합니다.
+
+    python -m benchmarks.micro --save-baseline          # 현재 결과를 기준으로 저장
+    python -m benchmarks.micro                          # 기준과 비교 (20% 초과 시 실패)
+    python -m benchmarks.micro --threshold 0.1 --filter comment
+
+기준 값은 실행한 기기에 따라 달라지므로 같은 기기에서 만든 기준 파일과 비교합니다.
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import timeit
+from dataclasses import asdict, dataclass
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Callable, List
+
+from core.security import (
+    create_access_token,
+    decode_access_token,
+    get_password_hash,
+    token_cache,
+    verify_password,
+)
+from core.serialization import get_adapter
+from schemas.comments import CommentResponse
+from schemas.posts import PostResponse
+
+LIST_SIZES = (10, 50, 500)
+DEFAULT_BASELINE = Path(__file__).parent / "results" / "micro-baseline.json"
+
+
+@dataclass
+class Measurement:
+    number: int
+    samples: int
+    median_us: float
+    mean_us: float
+    stdev_us: float
+    min_us: float
+
+
+def post_rows(count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": i,
+            "title": f"게시글 제목 {i}",
+            "content": "본문 " * 200,
+            "user_name": f"user{i % 7}",
+            "comment_count": i % 13,
+        }
+        for i in range(count)
+    ]
+
+
+def comment_rows(count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": i,
+            "content": f"댓글 내용 {i} " * 5,
+            "user_name": f"user{i % 7}",
+            "post_id": 1,
+        }
+        for i in range(count)
+    ]
+
+
+def uncached_decode(token: str) -> Callable[[], Any]:
+    # 매번 캐시를 비워 서명 검증 후 캐시에 넣는 첫 요청 경로를 잰다
+    def run() -> Any:
+        token_cache.clear()
+        return decode_access_token(token)
+
+    return run
+
+
+def cases() -> dict[str, Callable[[], Any]]:
+    """
+    케이스 이름 -> 측정할 함수 (인자 준비는 여기서 미리 끝낸다)
+    """
+    payload = {"sub": "user@example.com"}
+    token = create_access_token(payload, expires_delta=timedelta(hours=1))
+    password_hash = get_password_hash("benchmark-password")
+    token_cache.clear()
+    decode_access_token(token)
+
+    result: dict[str, Callable[[], Any]] = {
+        "security.create_access_token": lambda: create_access_token(payload),
+        "security.decode_access_token (cached)": lambda: decode_access_token(token),
+        "security.decode_access_token (uncached)": uncached_decode(token),
+        "security.verify_password": lambda: verify_password(
+            "benchmark-password", password_hash
+        ),
+    }
+
+    models = ((PostResponse, post_rows), (CommentResponse, comment_rows))
+    for model, make_rows in models:
+        adapter = get_adapter(List[model])
+        name = model.__name__
+        for size in LIST_SIZES:
+            rows = make_rows(size)
+            items = [model.model_validate(row) for row in rows]
+            result[f"{name} build ({size})"] = (
+                lambda model=model, rows=rows: [model.model_validate(r) for r in rows]
+            )
+            result[f"{name} model_dump ({size})"] = lambda items=items: [
+                item.model_dump(mode="json") for item in items
+            ]
+            result[f"{name} dump_json ({size})"] = (
+                lambda adapter=adapter, items=items: adapter.dump_json(items)
+            )
+    return result
+
+
+def measure(
+    func: Callable[[], Any], warmup: float, samples: int, min_sample_time: float
+) -> Measurement:
+    """
+    warmup초 동안 먼저 실행한 뒤, 한 샘플이 min_sample_time 이상 걸리도록
+    호출 횟수를 정해 samples번 측정합니다. 측정 중에는 GC를 끕니다(timeit 기본).
+    """
+    deadline = time.perf_counter() + warmup
+    while time.perf_counter() < deadline:
+        func()
+
+    timer = timeit.Timer(func)
+    number = 1
+    while timer.timeit(number) < min_sample_time:
+        number *= 2
+
+    timings = [t / number * 1_000_000 for t in timer.repeat(samples, number)]
+    return Measurement(
+        number=number,
+        samples=samples,
+        median_us=statistics.median(timings),
+        mean_us=statistics.fmean(timings),
+        stdev_us=statistics.stdev(timings) if samples > 1 else 0.0,
+        min_us=min(timings),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--filter", default="")
+    parser.add_argument("--warmup", type=float, default=0.2, help="케이스별 예열(초)")
+    parser.add_argument("--samples", type=int, default=7)
+    parser.add_argument("--min-sample-time", type=float, default=0.05)
+    args = parser.parse_args()
+
+    baseline: dict[str, Any] = {}
+    if not args.save_baseline and args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())["cases"]
+
+    print(
+        f"{'case':<42} {'median µs':>11} {'± stdev':>9} {'baseline':>10} {'change':>8}"
+    )
+    results: dict[str, Measurement] = {}
+    regressions = []
+    for name, func in cases().items():
+        if args.filter not in name:
+            continue
+        measurement = results[name] = measure(
+            func, args.warmup, args.samples, args.min_sample_time
+        )
+
+        reference = baseline.get(name, {}).get("median_us")
+        change = ""
+        if reference:
+            ratio = measurement.median_us / reference - 1
+            change = f"{ratio:+.1%}"
+            if ratio > args.threshold:
+                regressions.append((name, ratio))
+                change += " !"
+        print(
+            f"{name:<42} {measurement.median_us:>11.2f} "
+            f"{measurement.stdev_us:>9.2f} "
+            f"{reference or float('nan'):>10.2f} {change:>8}"
+        )
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(
+            json.dumps(
+                {
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "cases": {name: asdict(m) for name, m in results.items()},
+                },
+                indent=2,
+                ensure_ascii=False,
+            )
+            + "\n"
+        )
+        print(f"\nbaseline saved: {args.baseline}")
+    elif not baseline:
+        print(f"\n기준 파일이 없습니다: {args.baseline} (--save-baseline으로 생성)")
+
+    if regressions:
+        print(f"\n{len(regressions)}개 케이스가 {args.threshold:.0%} 이상 느려졌습니다:")
+        for name, ratio in regressions:
+            print(f"  {name}: {ratio:+.1%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+목록 조회 쿼리의 실행 계획과 소요 시간을 인덱스 적용 전/후로 비교합니다.
+
+    python -m benchmarks.query_plans                      # 임시 SQLite 파일
+    python -m benchmarks.query_plans --db-url postgresql://...  # 로컬 Postgres
+"""
+import argparse
+import random
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import Index, insert, text
+from sqlalchemy.engine import Connection
+from sqlmodel import SQLModel, create_engine, select
+
+from models.posts import Comment, Post
+from models.users import User
+
+# 마이그레이션 0002에서 추가한 인덱스
+HOT_QUERY_INDEXES = ("ix_post_user_uuid", "ix_post_feed", "ix_comment_post_feed")
+
+
+def hot_queries(post_id: int) -> dict[str, object]:
+    return {
+        "get_posts": select(Post, User)
+        .join(User, Post.user_uuid == User.uuid)
+        .where(Post.is_deleted == False)
+        .order_by(Post.created_at.desc(), Post.id.desc())
+        .limit(10),
+        "get_comments": select(Comment, User)
+        .join(User, Comment.user_uuid == User.uuid)
+        .where(Comment.post_id == post_id, Comment.is_deleted == False)
+        .order_by(Comment.created_at.desc(), Comment.id.desc())
+        .limit(50),
+        "posts_by_user": select(Post.id).where(Post.user_uuid == "user-0"),
+    }
+
+
+def hot_indexes() -> list[Index]:
+    return [
+        index
+        for table in (Post.__table__, Comment.__table__)
+        for index in table.indexes
+        if index.name in HOT_QUERY_INDEXES
+    ]
+
+
+def seed(conn: Connection, posts: int, comments_per_post: int, users: int) -> None:
+    now = datetime.now()
+    conn.execute(
+        insert(User),
+        [
+            {
+                "email": f"user{i}@example.com",
+                "password": "x",
+                "user_name": f"user{i}",
+                "uuid": f"user-{i}" if i == 0 else str(uuid.uuid4()),
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(users)
+        ],
+    )
+    user_uuids = list(conn.execute(select(User.uuid)).scalars())
+
+    rows = []
+    for i in range(posts):
+        created_at = now - timedelta(seconds=posts - i)
+        rows.append(
+            {
+                "title": f"title {i}",
+                "content": "content",
+                "user_uuid": random.choice(user_uuids),
+                "created_at": created_at,
+                "updated_at": created_at,
+                "is_deleted": i % 10 == 0,
+            }
+        )
+    conn.execute(insert(Post), rows)
+
+    rows = []
+    for post_id in range(1, posts + 1):
+        for j in range(comments_per_post):
+            rows.append(
+                {
+                    "content": "comment",
+                    "user_uuid": random.choice(user_uuids),
+                    "post_id": post_id,
+                    "created_at": now,
+                    "updated_at": now,
+                    "is_deleted": j % 10 == 0,
+                }
+            )
+    conn.execute(insert(Comment), rows)
+
+
+def explain(conn: Connection, query: object) -> list[str]:
+    compiled = query.compile(conn, compile_kwargs={"literal_binds": True})
+    if conn.dialect.name == "sqlite":
+        rows = conn.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+        return [row[-1] for row in rows]
+    rows = conn.execute(text(f"EXPLAIN ANALYZE {compiled}")).all()
+    return [row[0] for row in rows]
+
+
+def measure(conn: Connection, query: object, repeat: int) -> float:
+    started_at = time.perf_counter()
+    for _ in range(repeat):
+        conn.execute(query).all()
+    return (time.perf_counter() - started_at) / repeat * 1000
+
+
+def report(conn: Connection, label: str, post_id: int, repeat: int) -> None:
+    print(f"\n=== {label} ===")
+    for name, query in hot_queries(post_id).items():
+        print(f"[{name}] {measure(conn, query, repeat):.3f} ms/query")
+        for line in explain(conn, query):
+            print(f"    {line}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--db-url", default=None)
+    parser.add_argument("--posts", type=int, default=50_000)
+    parser.add_argument("--comments-per-post", type=int, default=5)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    db_url = args.db_url or f"sqlite:///{tempfile.mkdtemp()}/query_plans.db"
+    engine = create_engine(db_url)
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+
+    with engine.begin() as conn:
+        for index in hot_indexes():
+            index.drop(conn)
+        seed(conn, args.posts, args.comments_per_post, args.users)
+        conn.execute(text("ANALYZE"))
+
+    post_id = args.posts // 2
+    with engine.connect() as conn:
+        report(conn, "before (no hot-query indexes)", post_id, args.repeat)
+
+    with engine.begin() as conn:
+        for index in hot_indexes():
+            index.create(conn)
+        conn.execute(text("ANALYZE"))
+
+    with engine.connect() as conn:
+        report(conn, "after (migration 0002 indexes)", post_id, args.repeat)
+
+    SQLModel.metadata.drop_all(engine)
+
+
+if __name__ == "__main__":
+    main()
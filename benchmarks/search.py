@@ -0,0 +1,157 @@
+"""
+전문 검색(tsvector/FTS5) 쿼리와 LIKE 전체 스캔의 소요 시간과 실행 계획을 비교합니다.
+
+    python -m benchmarks.search                               # 임시 SQLite, 10만 건
+    python -m benchmarks.search --posts 1000000               # 100만 건
+    python -m benchmarks.search --db-url postgresql://...     # 로컬 Postgres
+"""
+import argparse
+import random
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert, text
+from sqlalchemy.engine import Connection
+from sqlmodel import SQLModel, create_engine, select
+
+from apis.posts import POST_VIEW_FIELDS, post_select
+from benchmarks.query_plans import explain
+from core.pagination import encode_rank_cursor, rank_keyset_condition
+from core.search import index_statements, ranked_matches
+from models.posts import Post
+from models.users import User
+
+VOCABULARY = [f"word{i}" for i in range(20_000)]
+BATCH_SIZE = 10_000
+
+
+def seed(conn: Connection, posts: int, users: int) -> None:
+    """
+    단어 빈도가 지프 분포를 따르는 게시글 posts건을 배치로 넣고 검색 색인을 만듭니다.
+    """
+    now = datetime.now()
+    conn.execute(
+        insert(User),
+        [
+            {
+                "email": f"user{i}@example.com",
+                "password": "x",
+                "user_name": f"user{i}",
+                "uuid": str(uuid.uuid4()),
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(users)
+        ],
+    )
+    user_uuids = list(conn.execute(select(User.uuid)).scalars())
+    weights = [1 / (rank + 1) for rank in range(len(VOCABULARY))]
+
+    for start in range(0, posts, BATCH_SIZE):
+        rows = []
+        for i in range(start, min(start + BATCH_SIZE, posts)):
+            created_at = now - timedelta(seconds=posts - i)
+            words = random.choices(VOCABULARY, weights=weights, k=40)
+            rows.append(
+                {
+                    "title": " ".join(words[:5]),
+                    "content": " ".join(words[5:]),
+                    "user_uuid": random.choice(user_uuids),
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                    "is_deleted": i % 10 == 0,
+                    "comment_count": 0,
+                }
+            )
+        conn.execute(insert(Post), rows)
+
+    started_at = time.perf_counter()
+    for statement in index_statements(conn.dialect.name, Post):
+        conn.execute(statement)
+    print(f"index build: {time.perf_counter() - started_at:.1f} s")
+
+
+def search_query(dialect: str, term: str, cursor: str | None = None) -> object:
+    matches = ranked_matches(dialect, Post, term)
+    query = (
+        post_select(list(POST_VIEW_FIELDS["summary"]))
+        .add_columns(matches.c.score)
+        .join(matches, matches.c.id == Post.id)
+        .where(Post.is_deleted == False)
+        .order_by(matches.c.score.desc(), Post.id.desc())
+        .limit(10)
+    )
+    if cursor:
+        query = query.where(rank_keyset_condition(matches.c.score, Post.id, cursor))
+    return query
+
+
+def scan_query(term: str) -> object:
+    """
+    검색 기능이 없을 때의 대안인 LIKE 전체 스캔입니다.
+    """
+    return (
+        post_select(list(POST_VIEW_FIELDS["summary"]))
+        .where(
+            Post.is_deleted == False,
+            (Post.title + " " + Post.content).like(f"%{term}%"),
+        )
+        .order_by(Post.created_at.desc(), Post.id.desc())
+        .limit(10)
+    )
+
+
+def measure(conn: Connection, query: object, repeat: int) -> tuple[float, list]:
+    started_at = time.perf_counter()
+    for _ in range(repeat):
+        rows = conn.execute(query).mappings().all()
+    return (time.perf_counter() - started_at) / repeat * 1000, rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--db-url", default=None)
+    parser.add_argument("--posts", type=int, default=100_000)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--explain", action="store_true")
+    args = parser.parse_args()
+
+    db_url = args.db_url or f"sqlite:///{tempfile.mkdtemp()}/search.db"
+    engine = create_engine(db_url)
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+
+    with engine.begin() as conn:
+        seed(conn, args.posts, args.users)
+        conn.execute(text("ANALYZE"))
+
+    # 흔한 단어, 중간 빈도 단어, 드문 단어, 두 단어 조합
+    terms = ["word1", "word200", "word15000", "word3 word40"]
+    dialect = engine.dialect.name
+    with engine.connect() as conn:
+        for term in terms:
+            print(f"\n=== q={term!r} ===")
+            elapsed, rows = measure(conn, search_query(dialect, term), args.repeat)
+            print(f"[search page 1] {elapsed:.3f} ms/query")
+            if rows:
+                cursor = encode_rank_cursor(rows[-1]["score"], rows[-1]["id"])
+                elapsed, _ = measure(
+                    conn, search_query(dialect, term, cursor), args.repeat
+                )
+                print(f"[search page 2] {elapsed:.3f} ms/query")
+            if " " not in term:
+                elapsed, _ = measure(conn, scan_query(term), args.repeat)
+                print(f"[LIKE scan]     {elapsed:.3f} ms/query")
+
+            if args.explain:
+                for line in explain(conn, search_query(dialect, term)):
+                    print(f"    {line}")
+
+    SQLModel.metadata.drop_all(engine)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+엔드포인트별 응답 직렬화 비용을 기본 경로와 FAST_JSON 경로로 비교합니다.
+
+    python -m benchmarks.serialization
+    python -m benchmarks.serialization --number 5000
+
+기본 경로: response_model 재검증(serialize_response) + JSONResponse(json.dumps)
+FAST_JSON: 검증된 모델을 pydantic-core TypeAdapter.dump_json으로 한 번에 직렬화
+"""
+import argparse
+import timeit
+from typing import Any, Callable, List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from core.serialization import get_adapter
+from schemas.bulk import BulkItemResult, BulkResponse
+from schemas.comments import CommentResponse
+from schemas.posts import PostAuthorResponse, PostDetailResponse, PostResponse
+from schemas.users import UserInfoResponse
+
+
+def make_comments(count: int) -> list[CommentResponse]:
+    return [
+        CommentResponse(
+            id=i, content=f"댓글 내용 {i} " * 5, user_name=f"user{i % 7}", post_id=1
+        )
+        for i in range(count)
+    ]
+
+
+def make_post() -> PostResponse:
+    return PostResponse(id=1, title="게시글 제목", content="본문 " * 200, user_name="user1")
+
+
+def cases() -> dict[str, tuple[Any, Any]]:
+    """
+    엔드포인트 이름 -> (핸들러가 만드는 응답 값, response_model 타입)
+    """
+    return {
+        "GET /api/comments (50)": (make_comments(50), List[CommentResponse]),
+        "GET /api/posts/{id}/detail": (
+            PostDetailResponse(
+                post=make_post(),
+                author=PostAuthorResponse(user_name="user1"),
+                comments=make_comments(50),
+                next_comment_cursor=None,
+                viewer=UserInfoResponse(email="a@example.com", user_name="user1"),
+            ),
+            PostDetailResponse,
+        ),
+        "POST /api/posts": (make_post(), PostResponse),
+        "POST /api/posts/bulk (1000)": (
+            BulkResponse(
+                results=[BulkItemResult(index=i, id=i, status=201) for i in range(1000)]
+            ),
+            BulkResponse,
+        ),
+    }
+
+
+def run_coroutine(coroutine: Any) -> Any:
+    # serialize_response(is_coroutine=True)는 실제로 대기하지 않으므로 루프 없이 실행
+    try:
+        coroutine.send(None)
+    except StopIteration as e:
+        return e.value
+    raise RuntimeError("serialize_response가 대기 상태로 전환되었습니다.")
+
+
+def default_path(value: Any, tp: Any) -> Callable[[], bytes]:
+    field = create_model_field(name="Response", type_=tp, mode="serialization")
+
+    def run() -> bytes:
+        content = run_coroutine(serialize_response(field=field, response_content=value))
+        return JSONResponse(content).body
+
+    return run
+
+
+def fast_path(value: Any, tp: Any) -> Callable[[], bytes]:
+    adapter = get_adapter(tp)
+    return lambda: adapter.dump_json(value)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'endpoint':<30} {'default µs':>12} {'fast µs':>10} {'speedup':>8}")
+    for name, (value, tp) in cases().items():
+        default, fast = default_path(value, tp), fast_path(value, tp)
+        assert len(default()) > 0 and len(fast()) > 0
+
+        timings = []
+        for run in (default, fast):
+            best = min(timeit.repeat(run, number=args.number, repeat=args.repeat))
+            timings.append(best / args.number * 1_000_000)
+        print(
+            f"{name:<30} {timings[0]:>12.1f} {timings[1]:>10.1f} "
+            f"{timings[0] / timings[1]:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
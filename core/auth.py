@@ -1,16 +1,36 @@
 from typing import Annotated
 
 from fastapi import Depends, HTTPException, status, Cookie
-from sqlmodel import Session, select
+from sqlalchemy import event
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from core.database import get_session
+from core.cache import TTLCache
+from core.config import get_settings
+from core.database import get_async_session
 from core.security import decode_access_token
 from models.users import User
 
+settings = get_settings()
+
+# uuid -> 사용자 레코드(dict) 캐시
+user_cache = TTLCache(
+    max_size=settings.USER_CACHE_MAX_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS
+)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def invalidate_cached_user(mapper, connection, target: User) -> None:
+    """
+    사용자 레코드가 변경되거나 삭제되면 캐시에서 제거합니다.
+    """
+    user_cache.invalidate(target.uuid)
+
 
 async def get_current_user(
     access_token: Annotated[str | None, Cookie()] = None,
-    db: Session = Depends(get_session),
+    db: AsyncSession = Depends(get_async_session),
 ) -> User:
     """
     쿠키에서 access_token을 확인하고 현재 인증된 사용자를 반환하는 의존성 함수입니다.
@@ -33,8 +53,15 @@ async def get_current_user(
                 detail="유효하지 않은 인증 정보입니다.",
             )
 
+        # 캐시에 있으면 DB 조회 없이 사본을 반환
+        cached_user = user_cache.get(user_uuid)
+        if cached_user is not None:
+            return User.model_validate(cached_user)
+
         # UUID로 사용자 조회
-        user = db.exec(select(User).where(User.uuid == user_uuid)).first()
+        user = (
+            await db.exec(select(User).where(User.uuid == user_uuid))
+        ).first()
 
         if not user:
             raise HTTPException(
@@ -42,6 +69,8 @@ async def get_current_user(
                 detail="사용자를 찾을 수 없습니다.",
             )
 
+        user_cache.set(user_uuid, user.model_dump())
+
         return user
 
     except HTTPException:
@@ -52,3 +81,34 @@ async def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="인증 처리 중 오류가 발생했습니다.",
         )
+
+
+async def get_optional_user(
+    access_token: Annotated[str | None, Cookie()] = None,
+    db: AsyncSession = Depends(get_async_session),
+) -> User | None:
+    """
+    로그인하지 않아도 접근할 수 있는 엔드포인트에서 현재 사용자를 확인하는 의존성 함수입니다.
+    인증에 실패하면 에러 대신 None을 반환합니다.
+    """
+    if not access_token:
+        return None
+
+    try:
+        return await get_current_user(access_token=access_token, db=db)
+    except HTTPException:
+        return None
+
+
+async def get_admin_user(
+    current_user: Annotated[User, Depends(get_current_user)],
+) -> User:
+    """
+    관리자(ADMIN_EMAILS에 등록된 이메일)만 접근할 수 있는 엔드포인트용 의존성 함수입니다.
+    관리자가 아니면 403 에러를 발생시킵니다.
+    """
+    if current_user.email not in settings.ADMIN_EMAILS:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="관리자만 접근할 수 있습니다."
+        )
+    return current_user
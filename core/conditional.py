@@ -0,0 +1,69 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Iterable
+
+from fastapi import Request, Response, status
+
+
+def build_validators(
+    versions: Iterable[Any], last_modified: datetime | None
+) -> dict[str, str]:
+    """
+    행 버전(id, updated_at 등) 목록으로 강한 ETag와 Last-Modified 헤더를 만듭니다.
+    """
+    digest = hashlib.sha256(repr(list(versions)).encode("utf-8")).hexdigest()[:32]
+    headers = {"ETag": f'"{digest}"'}
+    if last_modified is not None:
+        # updated_at은 서버 로컬 시간(naive)으로 저장되므로 UTC로 변환
+        headers["Last-Modified"] = format_datetime(
+            last_modified.astimezone(timezone.utc).replace(microsecond=0),
+            usegmt=True,
+        )
+    return headers
+
+
+def is_not_modified(
+    request: Request, headers: dict[str, str], check_modified_since: bool = True
+) -> bool:
+    """
+    If-None-Match / If-Modified-Since 요청 헤더와 비교해 304로 응답할 수 있는지 판단합니다.
+    If-None-Match가 있으면 If-Modified-Since는 무시합니다.
+    목록처럼 삭제로 인해 Last-Modified가 바뀌지 않을 수 있는 응답은
+    check_modified_since=False로 ETag만 비교합니다.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        etag = headers.get("ETag")
+        if etag is None:
+            return False
+        candidates = [
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        ]
+        return "*" in candidates or etag in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    last_modified = headers.get("Last-Modified")
+    if not check_modified_since or not if_modified_since or not last_modified:
+        return False
+
+    try:
+        return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(
+            if_modified_since
+        )
+    except (TypeError, ValueError):
+        return False
+
+
+def not_modified_response(headers: dict[str, str]) -> Response:
+    """
+    본문 없이 검증 헤더만 담은 304 응답을 반환합니다.
+    """
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={
+            key: value
+            for key, value in headers.items()
+            if key in ("ETag", "Last-Modified")
+        },
+    )
@@ -20,6 +20,18 @@ class DatabaseSettings(BaseSettings):
     DB_MAX_OVERFLOW: int
     DB_POOL_TIMEOUT: int
 
+    # 적응형 풀 모드: checkout마다 하는 pre-ping 대신 IDLE_PING_SECONDS 이상 쉰
+    # 커넥션만 확인 (추천 풀 크기는 모드와 관계없이 /metrics에 노출)
+    DB_POOL_ADAPTIVE: bool = Field(default=False)
+    DB_POOL_IDLE_PING_SECONDS: float = Field(default=30)
+
+    # 읽기 전용 복제본 비동기 URL 목록 (예: '["postgresql+asyncpg://.../blog"]')
+    DB_REPLICA_URLS: list[str] = Field(default_factory=list)
+    # 쓰기 후 이 시간(초) 동안은 같은 사용자의 읽기도 primary에서 처리
+    DB_REPLICA_STICKY_SECONDS: float = Field(default=5)
+    # 연결에 실패한 복제본을 다시 시도하기까지 제외하는 시간(초)
+    DB_REPLICA_RETRY_SECONDS: float = Field(default=30)
+
     model_config = SettingsConfigDict(
         env_file=".env", case_sensitive=True, extra="ignore"
     )
@@ -32,11 +44,66 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ALGORITHM: str = Field(default="HS256")
 
+    # 비밀번호 해시 워커 풀 설정
+    PASSWORD_HASH_EXECUTOR: Literal["thread", "process"] = Field(default="thread")
+    PASSWORD_HASH_WORKERS: int = Field(default=4)
+    PASSWORD_HASH_QUEUE_LIMIT: int = Field(default=32)
+
+    # 검증된 JWT 캐시 설정 (0이면 사용하지 않음)
+    TOKEN_CACHE_MAX_SIZE: int = Field(default=4096)
+
+    # 게시글 목록 요약(view=summary)의 미리보기 글자 수
+    POST_EXCERPT_LENGTH: int = Field(default=200)
+
+    # ids로 한 번에 조회할 수 있는 최대 개수
+    BATCH_MAX_IDS: int = Field(default=100)
+
+    # 일괄 작성/삭제 요청 한 번에 처리할 수 있는 최대 항목 수
+    BULK_MAX_ITEMS: int = Field(default=1000)
+
+    # 인증 사용자 캐시 설정
+    USER_CACHE_MAX_SIZE: int = Field(default=1024)
+    USER_CACHE_TTL_SECONDS: float = Field(default=60)
+
+    # 게시글 응답 캐시 설정 (TTL이 0이면 사용하지 않음)
+    RESPONSE_CACHE_BACKEND: Literal["memory", "redis"] = Field(default="memory")
+    RESPONSE_CACHE_REDIS_URL: str = Field(default="redis://localhost:6379/0")
+    RESPONSE_CACHE_MAX_SIZE: int = Field(default=1024)
+    RESPONSE_CACHE_TTL_SECONDS: float = Field(default=30)
+
+    # 전문 검색 설정 (Postgres text search 설정 이름, 마이그레이션 0004와 일치해야 함)
+    SEARCH_TEXT_CONFIG: str = Field(default="simple")
+
+    # 실시간 댓글 발행/구독 설정 (구독자별 대기 메시지가 QUEUE_SIZE를 넘으면 연결을 끊음)
+    PUBSUB_BACKEND: Literal["memory", "redis"] = Field(default="memory")
+    PUBSUB_REDIS_URL: str = Field(default="redis://localhost:6379/0")
+    PUBSUB_QUEUE_SIZE: int = Field(default=100)
+
+    # /metrics(Prometheus 텍스트 형식) 노출과 요청별 지표 수집
+    METRICS_ENABLED: bool = Field(default=True)
+
+    # 응답 모델을 FastAPI 재검증 없이 pydantic-core로 바로 직렬화 (opt-in)
+    FAST_JSON: bool = Field(default=False)
+
+    # 관리자 계정 이메일 목록 (예: ADMIN_EMAILS='["admin@example.com"]')
+    ADMIN_EMAILS: list[str] = Field(default_factory=list)
+
+    # 내보내기(export) 시 서버 사이드 커서로 한 번에 가져올 행 수
+    EXPORT_BATCH_SIZE: int = Field(default=1000)
+
+    # 서버 사이드 렌더링 설정 (켜면 페이지에 첫 화면 데이터를 포함해 응답)
+    SSR_ENABLED: bool = Field(default=False)
+    SSR_FEED_PAGE_SIZE: int = Field(default=10)
+    FRAGMENT_CACHE_MAX_SIZE: int = Field(default=2048)
+    FRAGMENT_CACHE_TTL_SECONDS: float = Field(default=600)
+
     model_config = SettingsConfigDict(
         env_file=".env", case_sensitive=True, extra="allow"
     )
 
-    def get_database_url(self, driver: Literal["postgresql"]) -> str:
+    def get_database_url(
+        self, driver: Literal["postgresql", "postgresql+asyncpg"]
+    ) -> str:
         return (
             f"{driver}://{self.db.DB_USER}:{quote_plus(self.db.DB_PASSWORD)}"
             f"@{self.db.DB_HOST}:{self.db.DB_PORT}/{self.db.DB_NAME}"
@@ -46,6 +113,10 @@ class Settings(BaseSettings):
     def SYNC_DATABASE_URL(self) -> str:
         return self.get_database_url("postgresql")
 
+    @property
+    def ASYNC_DATABASE_URL(self) -> str:
+        return self.get_database_url("postgresql+asyncpg")
+
 
 @lru_cache
 def get_settings() -> Settings:
@@ -0,0 +1,21 @@
+from collections import Counter
+
+from sqlalchemy import case, update
+
+from models.posts import Post
+
+
+def change_comment_counts(counts: Counter, sign: int = 1):
+    """
+    여러 게시글의 댓글 수를 게시글별 증감량만큼 한 번의 UPDATE로 갱신합니다.
+    게시글 내용 변경이 아니므로 updated_at(onupdate)은 유지합니다.
+    """
+    return (
+        update(Post)
+        .where(Post.id.in_(counts))
+        .values(
+            comment_count=Post.comment_count
+            + sign * case(counts, value=Post.id, else_=0),
+            updated_at=Post.updated_at,
+        )
+    )
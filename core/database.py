@@ -1,20 +1,238 @@
+import itertools
+import time
+from http.cookies import SimpleCookie
+from typing import Any
+
+from fastapi import Depends, Request
+from sqlalchemy import event
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlmodel import create_engine, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.datastructures import MutableHeaders
 
 from core.config import get_settings
+from core.pool import (
+    TimedAsyncQueuePool,
+    TimedQueuePool,
+    enable_idle_ping,
+    time_pings,
+)
 
 
 settings = get_settings()
 
-engine = create_engine(
-    settings.SYNC_DATABASE_URL,
-    # echo=True,
-    pool_pre_ping=True,
-    pool_size=settings.db.DB_POOL_SIZE,
-    max_overflow=settings.db.DB_MAX_OVERFLOW,
-    pool_timeout=settings.db.DB_POOL_TIMEOUT,
+# 쓰기 후 읽기를 primary로 고정하는 쿠키 (값은 고정이 끝나는 unix 시각)
+STICKY_COOKIE = "db_primary_until"
+
+# 요청 중 커밋이 있었는지 표시하는 request.state 키
+WROTE_STATE_KEY = "db_wrote"
+
+
+def pool_options(name: str, poolclass: type) -> dict[str, Any]:
+    """
+    엔진 공통 커넥션 풀 설정입니다.
+    적응형 모드(DB_POOL_ADAPTIVE)에서는 checkout마다 하는 pre-ping을 끄고,
+    configure_pool에서 오래 쉰 커넥션만 확인하도록 바꿉니다.
+    """
+    return {
+        "poolclass": poolclass,
+        "pool_logging_name": name,
+        "pool_pre_ping": not settings.db.DB_POOL_ADAPTIVE,
+        "pool_size": settings.db.DB_POOL_SIZE,
+        "max_overflow": settings.db.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.db.DB_POOL_TIMEOUT,
+    }
+
+
+def configure_pool(engine: Any) -> Any:
+    time_pings(engine)
+    if settings.db.DB_POOL_ADAPTIVE:
+        enable_idle_ping(engine, settings.db.DB_POOL_IDLE_PING_SECONDS)
+    return engine
+
+
+engine = configure_pool(
+    create_engine(
+        settings.SYNC_DATABASE_URL,
+        # echo=True,
+        **pool_options("sync", TimedQueuePool),
+    )
+)
+
+# API 핸들러용 비동기 엔진 (이벤트 루프를 블로킹하지 않도록 asyncpg 사용)
+async_engine = configure_pool(
+    create_async_engine(
+        settings.ASYNC_DATABASE_URL,
+        # echo=True,
+        **pool_options("async", TimedAsyncQueuePool),
+    )
+)
+
+# 커밋 후에도 current_user 등의 속성에 접근할 수 있도록 expire_on_commit을 끈다
+async_session_factory = async_sessionmaker(
+    async_engine, class_=AsyncSession, expire_on_commit=False
+)
+
+
+class ReplicaSet:
+    """
+    읽기 전용 복제본 엔진 목록입니다.
+    건강한 복제본을 돌아가며 고르고, 연결에 실패한 복제본은
+    retry_seconds 동안 제외합니다.
+    """
+
+    def __init__(self, engines: list[AsyncEngine], retry_seconds: float):
+        self.engines = engines
+        self.retry_seconds = retry_seconds
+        self.fallbacks = 0
+        self._unhealthy_until: dict[AsyncEngine, float] = {}
+        self._turn = itertools.count()
+
+    def healthy(self) -> list[AsyncEngine]:
+        now = time.monotonic()
+        return [e for e in self.engines if self._unhealthy_until.get(e, 0) <= now]
+
+    def choose(self) -> AsyncEngine | None:
+        healthy = self.healthy()
+        if not healthy:
+            return None
+        return healthy[next(self._turn) % len(healthy)]
+
+    def mark_unhealthy(self, engine: AsyncEngine) -> None:
+        self._unhealthy_until[engine] = time.monotonic() + self.retry_seconds
+        self.fallbacks += 1
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "replicas": len(self.engines),
+            "healthy": len(self.healthy()),
+            "fallbacks": self.fallbacks,
+        }
+
+
+replicas = ReplicaSet(
+    [
+        configure_pool(
+            create_async_engine(
+                url, **pool_options(f"replica{index}", TimedAsyncQueuePool)
+            )
+        )
+        for index, url in enumerate(settings.db.DB_REPLICA_URLS)
+    ],
+    retry_seconds=settings.db.DB_REPLICA_RETRY_SECONDS,
+)
+
+replica_session_factory = async_sessionmaker(
+    class_=AsyncSession, expire_on_commit=False
 )
 
 
 def get_session():
     with Session(engine) as session:
         yield session
+
+
+async def get_async_session():
+    async with async_session_factory() as session:
+        yield session
+
+
+def read_your_writes(request: Request) -> bool:
+    """
+    최근에 쓰기를 한 사용자의 요청이면 True를 반환합니다.
+    이런 요청은 복제 지연과 상관없이 자신이 쓴 내용을 보도록 primary에서 읽습니다.
+    """
+    try:
+        return float(request.cookies.get(STICKY_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+async def get_read_session(
+    request: Request, primary: AsyncSession = Depends(get_async_session)
+):
+    """
+    읽기 전용 요청용 세션입니다.
+    복제본이 설정되어 있으면 건강한 복제본 세션을, 아니면 primary 세션을 반환합니다.
+    최근에 쓰기를 했거나 복제본 연결에 실패하면 primary로 대신 처리합니다.
+    """
+    engine = None if read_your_writes(request) else replicas.choose()
+    if engine is None:
+        yield primary
+        return
+
+    async with replica_session_factory(bind=engine) as session:
+        try:
+            # 미리 연결해 두어 실패하면 핸들러 실행 전에 primary로 넘긴다
+            await session.connection()
+        except (DBAPIError, OSError):
+            replicas.mark_unhealthy(engine)
+        else:
+            yield session
+            return
+    yield primary
+
+
+def replica_cache_ttl(session: AsyncSession) -> float | None:
+    """
+    복제본에서 읽은 응답을 공유 캐시에 저장할 때 쓸 TTL(초)입니다.
+    복제본 결과는 쓰기 직후 복제 지연만큼 오래된 것일 수 있으므로,
+    고정 쿠키 유지 시간(복제 지연 상한으로 가정) 동안만 캐시합니다.
+    primary에서 읽은 경우 None(기본 TTL)을 반환합니다.
+    """
+    if session.bind in replicas.engines:
+        return settings.db.DB_REPLICA_STICKY_SECONDS
+    return None
+
+
+async def get_write_session(
+    request: Request, session: AsyncSession = Depends(get_async_session)
+):
+    """
+    쓰기 요청용 primary 세션입니다.
+    복제본을 사용할 때는 커밋이 있었던 요청의 응답에 고정 쿠키를 붙여
+    이후 잠시 동안 같은 사용자의 읽기를 primary로 보냅니다.
+    """
+    if replicas.engines:
+
+        @event.listens_for(session.sync_session, "after_commit")
+        def mark_written(sync_session):
+            setattr(request.state, WROTE_STATE_KEY, True)
+
+    yield session
+
+
+def sticky_cookie() -> str:
+    seconds = settings.db.DB_REPLICA_STICKY_SECONDS
+    cookie = SimpleCookie()
+    cookie[STICKY_COOKIE] = str(time.time() + seconds)
+    cookie[STICKY_COOKIE]["max-age"] = int(seconds) or 1
+    cookie[STICKY_COOKIE]["path"] = "/"
+    cookie[STICKY_COOKIE]["httponly"] = True
+    cookie[STICKY_COOKIE]["samesite"] = "lax"
+    return cookie.output(header="").strip()
+
+
+class ReadYourWritesMiddleware:
+    """
+    get_write_session으로 커밋한 요청의 응답에 고정 쿠키를 붙이는 ASGI 미들웨어입니다.
+    핸들러가 Response를 직접 반환해도 쿠키가 빠지지 않도록 응답 시작 메시지에 붙입니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        state = scope.setdefault("state", {})
+
+        async def send_with_cookie(message):
+            if message["type"] == "http.response.start" and state.get(WROTE_STATE_KEY):
+                MutableHeaders(scope=message).append("set-cookie", sticky_cookie())
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
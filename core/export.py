@@ -0,0 +1,79 @@
+from datetime import datetime
+from typing import Any, AsyncIterator, Iterator, Mapping
+
+from pydantic import TypeAdapter
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlmodel import select
+
+from core.config import get_settings
+from models.posts import Comment, Post
+
+settings = get_settings()
+
+row_adapter = TypeAdapter(dict[str, Any])
+
+EXPORT_MODELS = {"posts": Post, "comments": Comment}
+
+# 검색 색인은 다른 컬럼으로 다시 만들 수 있으므로 내보내지 않는다
+EXCLUDED_COLUMNS = {"search_vector"}
+
+
+def export_query(
+    model: Any,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    include_deleted: bool = False,
+    after_id: int | None = None,
+) -> Any:
+    """
+    내보낼 행을 id 오름차순으로 조회하는 쿼리를 만듭니다.
+    since/until은 updated_at 기준 [since, until) 범위이며,
+    after_id를 주면 해당 id 이후부터 이어서 내보냅니다.
+    """
+    columns = [
+        column
+        for column in model.__table__.columns
+        if column.name not in EXCLUDED_COLUMNS
+    ]
+    query = (
+        select(*columns)
+        .order_by(model.id)
+        .execution_options(yield_per=settings.EXPORT_BATCH_SIZE)
+    )
+    if not include_deleted:
+        query = query.where(model.is_deleted == False)
+    if since is not None:
+        query = query.where(model.updated_at >= since)
+    if until is not None:
+        query = query.where(model.updated_at < until)
+    if after_id is not None:
+        query = query.where(model.id > after_id)
+    return query
+
+
+def export_chunk(rows: list[Mapping[str, Any]]) -> bytes:
+    """
+    행 묶음을 줄마다 JSON 객체 하나인 NDJSON 바이트로 직렬화합니다.
+    """
+    return b"".join(row_adapter.dump_json(dict(row)) + b"\n" for row in rows)
+
+
+async def stream_export(engine: AsyncEngine, query: Any) -> AsyncIterator[bytes]:
+    """
+    서버 사이드 커서로 EXPORT_BATCH_SIZE행씩 읽어 NDJSON 조각을 내보냅니다.
+    한 번에 한 묶음만 메모리에 올라가므로 전체 크기와 관계없이 메모리 사용량이 일정합니다.
+    """
+    async with engine.connect() as conn:
+        result = await conn.stream(query)
+        async for rows in result.mappings().partitions():
+            yield export_chunk(rows)
+
+
+def iter_export(engine: Engine, query: Any) -> Iterator[bytes]:
+    """
+    stream_export의 동기 버전입니다. 관리 명령어에서 사용합니다.
+    """
+    with engine.connect() as conn:
+        for rows in conn.execute(query).mappings().partitions():
+            yield export_chunk(rows)
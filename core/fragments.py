@@ -0,0 +1,35 @@
+from typing import Any, Hashable
+
+from jinja2 import Environment
+from markupsafe import Markup
+
+from core.cache import TTLCache
+
+
+class FragmentCache:
+    """
+    게시글 카드처럼 자주 반복되는 HTML 조각을 렌더링 결과 그대로 캐시합니다.
+    키에 게시글 버전(updated_at 등)을 포함하므로 글이 수정되면 자연스럽게
+    새 조각이 렌더링되고, 오래된 조각은 LRU/TTL로 정리됩니다.
+    """
+
+    def __init__(self, env: Environment, max_size: int, ttl: float):
+        self.env = env
+        self._cache = TTLCache(max_size=max_size, ttl=ttl)
+
+    def render(self, template_name: str, version: Hashable, **context: Any) -> Markup:
+        """
+        (템플릿 이름, 버전) 키로 캐시된 조각을 반환하고, 없으면 렌더링해 저장합니다.
+        """
+        key = (template_name, version)
+        fragment = self._cache.get(key)
+        if fragment is None:
+            fragment = Markup(self.env.get_template(template_name).render(**context))
+            self._cache.set(key, fragment)
+        return fragment
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict[str, int]:
+        return self._cache.stats()
@@ -0,0 +1,376 @@
+import csv
+import io
+import json
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, TextIO
+
+from sqlalchemy import insert, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import select
+
+from core.cache import TTLCache
+from core.counters import change_comment_counts
+from core.search import index_missing_statements
+from models.posts import Comment, Post
+from models.users import User
+
+IMPORT_MODELS = {"users": User, "posts": Post, "comments": Comment}
+
+# 참조 확인 결과 캐시 (같은 작성자가 여러 배치에 반복해서 나오는 경우가 많다)
+REFERENCE_CACHE_SIZE = 100_000
+
+# 입력에 해시 대신 평문 비밀번호가 들어오는 실수를 막기 위한 bcrypt 접두사
+BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
+# 로그에 남길 건너뛴 줄 번호 최대 개수
+MAX_REPORTED_SKIPS = 20
+
+
+@dataclass
+class ImportStats:
+    imported: int = 0
+    skipped: int = 0
+    skipped_lines: list[tuple[int, str]] = field(default_factory=list)
+    started_at: float = field(default_factory=time.perf_counter)
+
+    def skip(self, line: int, reason: str) -> None:
+        self.skipped += 1
+        if len(self.skipped_lines) < MAX_REPORTED_SKIPS:
+            self.skipped_lines.append((line, reason))
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.imported / self.elapsed if self.elapsed > 0 else 0.0
+
+
+@dataclass
+class InvalidRecord:
+    """
+    읽을 수 없는 입력 줄입니다. 가져오기에서 사유와 함께 건너뜁니다.
+    """
+
+    reason: str
+
+
+def read_records(
+    stream: TextIO, fmt: str
+) -> Iterator[tuple[int, dict[str, Any] | InvalidRecord]]:
+    """
+    NDJSON 또는 CSV 입력을 한 줄씩 읽어 (줄 번호, 레코드) 쌍으로 반환합니다.
+    CSV의 빈 칸은 값이 없는 것으로 취급합니다.
+    JSON 객체로 읽을 수 없는 줄은 InvalidRecord로 반환해 나머지 줄은 계속 읽습니다.
+    """
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        for record in reader:
+            yield reader.line_num, {
+                key: value for key, value in record.items() if value != ""
+            }
+        return
+
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_number, InvalidRecord(f"JSON 형식이 아닙니다: {e.msg}")
+            continue
+        if not isinstance(record, dict):
+            yield line_number, InvalidRecord("JSON 객체가 아닙니다.")
+            continue
+        yield line_number, record
+
+
+def parse_datetime(value: Any, default: datetime | None) -> datetime | None:
+    if value is None:
+        return default
+    return value if isinstance(value, datetime) else datetime.fromisoformat(value)
+
+
+def parse_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "t", "yes")
+    return bool(value)
+
+
+def required(record: dict[str, Any], key: str) -> Any:
+    value = record.get(key)
+    if value is None:
+        raise ValueError(f"{key} 값이 없습니다.")
+    return value
+
+
+def prepare_user(record: dict[str, Any], now: datetime) -> dict[str, Any]:
+    # 입력의 비밀번호 해시는 다시 해싱하지 않고 그대로 저장한다
+    password = required(record, "password")
+    if not password.startswith(BCRYPT_PREFIXES):
+        raise ValueError("password는 bcrypt 해시여야 합니다.")
+
+    created_at = parse_datetime(record.get("created_at"), now)
+    return {
+        "email": required(record, "email"),
+        "password": password,
+        "user_name": required(record, "user_name"),
+        "uuid": record.get("uuid") or str(uuid.uuid4()),
+        "created_at": created_at,
+        "updated_at": parse_datetime(record.get("updated_at"), created_at),
+        "last_login_at": parse_datetime(record.get("last_login_at"), None),
+    }
+
+
+def prepare_content(record: dict[str, Any], now: datetime) -> dict[str, Any]:
+    created_at = parse_datetime(record.get("created_at"), now)
+    return {
+        "content": required(record, "content"),
+        "created_at": created_at,
+        "updated_at": parse_datetime(record.get("updated_at"), created_at),
+        "is_deleted": parse_bool(record.get("is_deleted", False)),
+        "deleted_at": parse_datetime(record.get("deleted_at"), None),
+    }
+
+
+def prepare_post(record: dict[str, Any], now: datetime) -> dict[str, Any]:
+    return {
+        **prepare_content(record, now),
+        "title": required(record, "title"),
+        "comment_count": 0,
+    }
+
+
+def prepare_comment(record: dict[str, Any], now: datetime) -> dict[str, Any]:
+    return {**prepare_content(record, now), "post_id": int(required(record, "post_id"))}
+
+
+PREPARERS: dict[str, Callable[[dict[str, Any], datetime], dict[str, Any]]] = {
+    "users": prepare_user,
+    "posts": prepare_post,
+    "comments": prepare_comment,
+}
+
+
+class ReferenceResolver:
+    """
+    작성자(user_uuid 또는 user_email)와 게시글(post_id) 참조를 배치 단위 IN 쿼리로
+    확인합니다. 확인된 참조는 캐시해 다음 배치에서 다시 조회하지 않습니다.
+    """
+
+    def __init__(self):
+        self.users = TTLCache(max_size=REFERENCE_CACHE_SIZE, ttl=float("inf"))
+        self.posts = TTLCache(max_size=REFERENCE_CACHE_SIZE, ttl=float("inf"))
+
+    def load(self, conn: Connection, records: list[dict[str, Any]]) -> None:
+        uuids = {r["user_uuid"] for r in records if r.get("user_uuid")}
+        emails = {r["user_email"] for r in records if r.get("user_email")}
+        post_ids = {
+            int(r["post_id"])
+            for r in records
+            if str(r.get("post_id", "")).strip().isdigit()
+        }
+
+        uuids = [value for value in uuids if self.users.get(value) is None]
+        emails = [value for value in emails if self.users.get(value) is None]
+        post_ids = [value for value in post_ids if self.posts.get(value) is None]
+
+        if uuids or emails:
+            rows = conn.execute(
+                select(User.uuid, User.email).where(
+                    User.uuid.in_(uuids) | User.email.in_(emails)
+                )
+            )
+            for user_uuid, email in rows:
+                self.users.set(user_uuid, user_uuid)
+                self.users.set(email, user_uuid)
+
+        if post_ids:
+            rows = conn.execute(select(Post.id).where(Post.id.in_(post_ids)))
+            for (post_id,) in rows:
+                self.posts.set(post_id, True)
+
+    def resolve(self, record: dict[str, Any], row: dict[str, Any]) -> None:
+        reference = record.get("user_uuid") or record.get("user_email")
+        if reference is None:
+            raise ValueError("user_uuid 또는 user_email 값이 없습니다.")
+        user_uuid = self.users.get(reference)
+        if user_uuid is None:
+            raise ValueError(f"사용자를 찾을 수 없습니다: {reference}")
+        row["user_uuid"] = user_uuid
+
+        if "post_id" in row and self.posts.get(row["post_id"]) is None:
+            raise ValueError(f"게시글을 찾을 수 없습니다: {row['post_id']}")
+
+
+def copy_value(value: Any) -> str:
+    """
+    Postgres COPY text 형식에 맞게 값을 이스케이프합니다.
+    """
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def write_rows(conn: Connection, model: Any, rows: list[dict[str, Any]]) -> None:
+    """
+    Postgres에서는 COPY FROM STDIN으로, 그 외(SQLite)에서는 executemany로 씁니다.
+    """
+    if conn.dialect.name != "postgresql":
+        conn.execute(insert(model), rows)
+        return
+
+    columns = list(rows[0])
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write("\t".join(copy_value(row[column]) for column in columns) + "\n")
+    buffer.seek(0)
+
+    table = conn.dialect.identifier_preparer.quote(model.__tablename__)
+    cursor = conn.connection.driver_connection.cursor()
+    try:
+        cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", buffer)
+    finally:
+        cursor.close()
+
+
+def write_groups(conn: Connection, model: Any, rows: list[dict[str, Any]]) -> None:
+    # COPY/executemany는 모든 행의 컬럼이 같아야 하므로 id 유무로 나눈다
+    for group in (
+        [row for row in rows if "id" in row],
+        [row for row in rows if "id" not in row],
+    ):
+        if group:
+            write_rows(conn, model, group)
+
+
+def write_batch(
+    conn: Connection,
+    model: Any,
+    prepared: list[tuple[int, dict[str, Any]]],
+    stats: ImportStats,
+) -> list[dict[str, Any]]:
+    """
+    배치를 한 번에 쓰고, 중복 이메일 같은 제약 조건 위반으로 실패하면
+    SAVEPOINT로 되돌린 뒤 한 행씩 다시 써서 실패한 줄만 건너뜁니다.
+    실제로 쓴 행을 반환합니다.
+    """
+    # COPY는 SQLAlchemy를 거치지 않으므로 DBAPI 예외도 함께 잡는다
+    integrity_errors = (IntegrityError, conn.dialect.loaded_dbapi.IntegrityError)
+    rows = [row for _, row in prepared]
+    try:
+        with conn.begin_nested():
+            write_groups(conn, model, rows)
+        return rows
+    except integrity_errors:
+        pass
+
+    written = []
+    for line, row in prepared:
+        try:
+            with conn.begin_nested():
+                write_rows(conn, model, [row])
+        except integrity_errors as e:
+            reason = str(getattr(e, "orig", e)).splitlines()[0]
+            stats.skip(line, f"제약 조건 위반: {reason}")
+            continue
+        written.append(row)
+    return written
+
+
+def batched(iterable: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def import_records(
+    engine: Engine,
+    kind: str,
+    records: Iterable[tuple[int, dict[str, Any] | InvalidRecord]],
+    batch_size: int,
+    on_batch: Callable[[ImportStats], None] | None = None,
+) -> ImportStats:
+    """
+    레코드를 batch_size개씩 검증/참조 확인 후 배치마다 하나의 트랜잭션으로 씁니다.
+    잘못된 레코드는 건너뛰고 줄 번호와 사유를 기록합니다.
+    모든 배치를 쓴 뒤 검색 색인과 id 시퀀스를 맞춥니다.
+    """
+    model = IMPORT_MODELS[kind]
+    prepare = PREPARERS[kind]
+    resolver = ReferenceResolver()
+    stats = ImportStats()
+    has_explicit_ids = False
+
+    for batch in batched(records, batch_size):
+        now = datetime.now()
+        with engine.begin() as conn:
+            invalid = [(line, r) for line, r in batch if isinstance(r, InvalidRecord)]
+            for line, record in invalid:
+                stats.skip(line, record.reason)
+            batch = [(line, r) for line, r in batch if not isinstance(r, InvalidRecord)]
+
+            if kind != "users":
+                resolver.load(conn, [record for _, record in batch])
+
+            prepared = []
+            for line, record in batch:
+                try:
+                    row = prepare(record, now)
+                    if kind != "users":
+                        resolver.resolve(record, row)
+                    if record.get("id") is not None:
+                        row["id"] = int(record["id"])
+                        has_explicit_ids = True
+                except (KeyError, TypeError, ValueError) as e:
+                    stats.skip(line, str(e))
+                    continue
+                prepared.append((line, row))
+
+            rows = write_batch(conn, model, prepared, stats)
+
+            if kind == "comments":
+                # 삭제되지 않은 댓글 수만큼 게시글 comment_count를 늘린다
+                counts = Counter(
+                    row["post_id"] for row in rows if not row["is_deleted"]
+                )
+                if counts:
+                    conn.execute(change_comment_counts(counts))
+
+        stats.imported += len(rows)
+        if on_batch:
+            on_batch(stats)
+
+    with engine.begin() as conn:
+        if kind != "users":
+            for statement in index_missing_statements(conn.dialect.name, model):
+                conn.execute(statement)
+
+        # id를 직접 넣은 경우 다음 자동 증가 값이 겹치지 않도록 시퀀스를 맞춘다
+        if has_explicit_ids and conn.dialect.name == "postgresql":
+            table = model.__tablename__
+            conn.execute(
+                text(
+                    f"SELECT setval(pg_get_serial_sequence('\"{table}\"', 'id'), "
+                    f'(SELECT MAX(id) FROM "{table}"))'
+                )
+            )
+
+    return stats
@@ -0,0 +1,332 @@
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# 요청 처리 시간(초) 버킷
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 요청당 SQL 실행 수 버킷
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+# 커넥션 풀 대기 시간(초) 버킷
+POOL_WAIT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+
+# 매칭되는 라우트가 없는 요청의 라벨 (경로를 그대로 쓰면 라벨 종류가 무한히 늘어남)
+UNMATCHED_ROUTE = "__unmatched__"
+
+Labels = tuple[str, ...]
+
+
+def escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_labels(names: Labels, values: Labels, extra: str = "") -> str:
+    pairs = [f'{name}="{escape_label(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """
+    라벨 조합별로 증가만 하는 값입니다.
+    """
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Labels = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self._values: dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, labels: Labels = ()) -> float:
+        return self._values.get(labels, 0)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def samples(self) -> Iterable[str]:
+        with self._lock:
+            values = list(self._values.items())
+        for labels, value in values:
+            label_text = format_labels(self.labels, labels)
+            yield f"{self.name}{label_text} {format_value(value)}"
+
+
+class Histogram:
+    """
+    고정 버킷 히스토그램입니다.
+    관측 시에는 해당 버킷 하나만 올리고, 누적 값은 출력할 때 계산합니다.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Labels = (),
+        buckets: Iterable[float] = LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 조합 -> [버킷별 개수..., +Inf 개수, 합계]
+        self._values: dict[Labels, list[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, labels: Labels = ()) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._values.get(labels)
+            if counts is None:
+                counts = self._values[labels] = [0] * (len(self.buckets) + 2)
+            counts[index] += 1
+            counts[-1] += value
+
+    def count(self, labels: Labels = ()) -> int:
+        counts = self._values.get(labels)
+        return int(sum(counts[:-1])) if counts else 0
+
+    def sum(self, labels: Labels = ()) -> float:
+        counts = self._values.get(labels)
+        return counts[-1] if counts else 0.0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def samples(self) -> Iterable[str]:
+        with self._lock:
+            values = [(labels, list(counts)) for labels, counts in self._values.items()]
+        for labels, counts in values:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                le = f'le="{format_value(bound)}"'
+                yield (
+                    f"{self.name}_bucket{format_labels(self.labels, labels, le)} "
+                    f"{int(cumulative)}"
+                )
+            label_text = format_labels(self.labels, labels)
+            yield f"{self.name}_sum{label_text} {format_value(counts[-1])}"
+            yield f"{self.name}_count{label_text} {int(cumulative)}"
+
+
+# 출력 시점에 값을 읽어 오는 수집기: (이름, 타입, 설명, [(라벨 dict, 값)])
+Collected = tuple[str, str, str, list[tuple[dict[str, str], float]]]
+
+
+class MetricsRegistry:
+    """
+    지표를 모아 Prometheus 텍스트 형식으로 출력합니다.
+    카운터/히스토그램 외에, 캐시나 풀처럼 이미 통계를 가진 객체는
+    collector 함수를 등록해 출력할 때 값을 읽습니다.
+    """
+
+    def __init__(self):
+        self._metrics: list[Counter | Histogram] = []
+        self._collectors: list[Callable[[], Iterable[Collected]]] = []
+
+    def counter(self, name: str, documentation: str, labels: Labels = ()) -> Counter:
+        metric = Counter(name, documentation, labels)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labels: Labels = (),
+        buckets: Iterable[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        metric = Histogram(name, documentation, labels, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def register_collector(self, collector: Callable[[], Iterable[Collected]]) -> None:
+        self._collectors.append(collector)
+
+    def clear(self) -> None:
+        for metric in self._metrics:
+            metric.clear()
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+
+        for collector in self._collectors:
+            for name, kind, documentation, samples in collector():
+                lines.append(f"# HELP {name} {documentation}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in samples:
+                    label_text = format_labels(tuple(labels), tuple(labels.values()))
+                    lines.append(f"{name}{label_text} {format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+http_requests = registry.counter(
+    "http_requests_total",
+    "라우트/상태 코드별 HTTP 요청 수",
+    ("method", "route", "status"),
+)
+http_request_duration = registry.histogram(
+    "http_request_duration_seconds",
+    "라우트별 HTTP 요청 처리 시간(초)",
+    ("method", "route"),
+)
+http_request_statements = registry.histogram(
+    "http_request_db_statements",
+    "라우트별 요청 하나가 실행한 SQL 문 수",
+    ("method", "route"),
+    STATEMENT_BUCKETS,
+)
+http_request_db_duration = registry.histogram(
+    "http_request_db_seconds",
+    "라우트별 요청 하나가 SQL 실행에 쓴 시간(초)",
+    ("method", "route"),
+)
+db_statements = registry.counter(
+    "db_statements_total", "실행된 전체 SQL 문 수 (요청 밖 포함)"
+)
+db_pool_checkout_wait = registry.histogram(
+    "db_pool_checkout_wait_seconds",
+    "커넥션 풀에서 커넥션을 받기까지 기다린 시간(초)",
+    ("pool",),
+    POOL_WAIT_BUCKETS,
+)
+db_pool_checkout_timeouts = registry.counter(
+    "db_pool_checkout_timeouts_total",
+    "pool_timeout 안에 커넥션을 받지 못한 횟수",
+    ("pool",),
+)
+db_pool_ping = registry.histogram(
+    "db_pool_ping_seconds",
+    "커넥션 상태 확인(pre-ping 또는 유휴 커넥션 확인)에 걸린 시간(초)",
+    ("pool",),
+    POOL_WAIT_BUCKETS,
+)
+
+
+@dataclass
+class RequestStats:
+    """
+    요청 하나가 실행한 SQL 문 수와 실행 시간입니다.
+    """
+
+    statements: int = 0
+    db_seconds: float = 0.0
+
+
+request_stats: ContextVar[RequestStats | None] = ContextVar(
+    "request_stats", default=None
+)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_started_at"].pop()
+    db_statements.inc()
+    stats = request_stats.get()
+    if stats is not None:
+        stats.statements += 1
+        stats.db_seconds += elapsed
+
+
+@event.listens_for(Engine, "handle_error")
+def handle_error(exception_context):
+    # 실패한 문은 after_cursor_execute가 호출되지 않으므로 시작 시각을 정리한다
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_started_at"):
+        conn.info["query_started_at"].pop()
+
+
+class MetricsMiddleware:
+    """
+    HTTP 요청마다 라우트별 처리 시간, 상태 코드, SQL 실행 수/시간을 기록하는
+    ASGI 미들웨어입니다. 라우트 라벨은 실제 경로가 아닌 경로 템플릿
+    (예: /api/posts/{post_id})을 사용합니다.
+    """
+
+    def __init__(self, app: Any):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = request_stats.set(stats)
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            request_stats.reset(token)
+
+            route = scope.get("route")
+            labels = (scope["method"], getattr(route, "path", UNMATCHED_ROUTE))
+            http_requests.inc((*labels, str(status_code)))
+            http_request_duration.observe(elapsed, labels)
+            http_request_statements.observe(stats.statements, labels)
+            http_request_db_duration.observe(stats.db_seconds, labels)
+
+
+def stats_collector(
+    prefix: str, documentation: str, sources: Callable[[], dict[str, Any]]
+) -> Callable[[], Iterable[Collected]]:
+    """
+    {이름: stats() 결과} 형태의 통계를 지표로 바꾸는 collector를 만듭니다.
+    stats()의 각 키가 지표 하나가 되고, 이름은 name 라벨로 붙습니다.
+    (예: cache_hits{name="token"})
+    """
+
+    def collect() -> Iterable[Collected]:
+        metrics: dict[str, list[tuple[dict[str, str], float]]] = {}
+        for name, stats in sources().items():
+            for key, value in stats.items():
+                metrics.setdefault(key, []).append(({"name": name}, value))
+        for key, samples in metrics.items():
+            yield f"{prefix}_{key}", "gauge", f"{documentation} ({key})", samples
+
+    return collect
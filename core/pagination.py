@@ -0,0 +1,83 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, or_
+
+# 다음 페이지 커서를 담아 보내는 응답 헤더
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """
+    (created_at, id) 쌍을 클라이언트에 내려줄 불투명한 커서 문자열로 인코딩합니다.
+    """
+    raw = json.dumps([created_at.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    커서 문자열을 (created_at, id) 쌍으로 디코딩합니다.
+    형식이 올바르지 않으면 400 에러를 발생시킵니다.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), int(row_id)
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="유효하지 않은 커서입니다."
+        )
+
+
+def keyset_condition(model: Any, cursor: str) -> Any:
+    """
+    (created_at desc, id desc) 정렬 기준으로 커서 이후의 행만 고르는 조건을 만듭니다.
+    동시에 새 글이 추가되어도 이미 본 행이 다시 나오거나 빠지지 않습니다.
+    """
+    created_at, row_id = decode_cursor(cursor)
+    return or_(
+        model.created_at < created_at,
+        and_(model.created_at == created_at, model.id < row_id),
+    )
+
+
+def keyset_order(model: Any) -> tuple[Any, Any]:
+    """
+    커서 페이지네이션과 일치하는 안정적인 정렬 순서를 반환합니다.
+    """
+    return model.created_at.desc(), model.id.desc()
+
+
+def encode_rank_cursor(score: float, row_id: int) -> str:
+    """
+    검색 결과의 (점수, id) 쌍을 커서 문자열로 인코딩합니다.
+    """
+    raw = json.dumps([score, row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_rank_cursor(cursor: str) -> tuple[float, int]:
+    """
+    커서 문자열을 (점수, id) 쌍으로 디코딩합니다.
+    형식이 올바르지 않으면 400 에러를 발생시킵니다.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        score, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return float(score), int(row_id)
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="유효하지 않은 커서입니다."
+        )
+
+
+def rank_keyset_condition(score: Any, row_id: Any, cursor: str) -> Any:
+    """
+    (점수 desc, id desc) 정렬 기준으로 커서 이후의 행만 고르는 조건을 만듭니다.
+    """
+    last_score, last_id = decode_rank_cursor(cursor)
+    return or_(score < last_score, and_(score == last_score, row_id < last_id))
@@ -0,0 +1,172 @@
+import math
+import threading
+import time
+from collections import deque
+from typing import Any
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from core.metrics import db_pool_checkout_timeouts, db_pool_checkout_wait, db_pool_ping
+
+# 풀 크기 추천에 사용할 최근 checkout 표본 수
+DEMAND_SAMPLES = 1000
+
+# 추천 풀 크기 = 최근 동시 수요 p95 × 여유 비율
+DEMAND_PERCENTILE = 95
+SIZE_HEADROOM = 1.25
+
+
+class PoolUsage:
+    """
+    풀 하나의 동시 수요(사용 중 + 대기 중 커넥션 수)를 checkout마다 기록합니다.
+    풀이 모자라 대기가 생기면 사용 중 커넥션 수는 풀 크기에서 멈추므로,
+    대기 중인 요청까지 더해 실제로 필요했던 커넥션 수를 봅니다.
+    """
+
+    def __init__(self, max_samples: int = DEMAND_SAMPLES):
+        self.waiting = 0
+        self.peak_demand = 0
+        self._samples: deque[int] = deque(maxlen=max_samples)
+        self._lock = threading.Lock()
+
+    def start_wait(self) -> None:
+        with self._lock:
+            self.waiting += 1
+
+    def end_wait(self, checked_out: int | None) -> None:
+        with self._lock:
+            self.waiting -= 1
+            if checked_out is not None:
+                demand = checked_out + self.waiting
+                self._samples.append(demand)
+                self.peak_demand = max(self.peak_demand, demand)
+
+    def demand_percentile(self, percentile: float = DEMAND_PERCENTILE) -> int:
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return 0
+        return samples[max(0, math.ceil(percentile / 100 * len(samples)) - 1)]
+
+    def recommended_size(self) -> int:
+        """
+        최근 동시 수요의 p95에 여유를 더한 풀 크기입니다. 표본이 없으면 0입니다.
+        """
+        demand = self.demand_percentile()
+        return math.ceil(demand * SIZE_HEADROOM) if demand else 0
+
+
+# 풀 이름(pool_logging_name) -> 사용량. 풀이 재생성(recreate)되어도 이어서 기록한다
+pool_usage: dict[str, PoolUsage] = {}
+
+
+def pool_name(pool: Pool) -> str:
+    return pool._orig_logging_name or "default"
+
+
+class CheckoutTimingMixin:
+    """
+    풀에서 커넥션을 꺼내는 시간(빈 커넥션 대기, 새 커넥션 생성 포함)과
+    그때의 동시 수요를 기록합니다.
+    SQLAlchemy에는 checkout 직전 이벤트가 없어 _do_get을 감쌉니다.
+    풀 라벨은 create_engine(pool_logging_name=...) 값을 사용합니다.
+    """
+
+    def _do_get(self):
+        name = pool_name(self)
+        usage = pool_usage.setdefault(name, PoolUsage())
+        usage.start_wait()
+        checked_out = None
+        started = time.perf_counter()
+        try:
+            record = super()._do_get()
+            checked_out = self.checkedout()
+            return record
+        except exc.TimeoutError:
+            db_pool_checkout_timeouts.inc((name,))
+            raise
+        finally:
+            db_pool_checkout_wait.observe(time.perf_counter() - started, (name,))
+            usage.end_wait(checked_out)
+
+
+class TimedQueuePool(CheckoutTimingMixin, QueuePool):
+    pass
+
+
+class TimedAsyncQueuePool(CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def sync_engine_of(engine: Engine | AsyncEngine) -> Engine:
+    return engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+
+
+def time_pings(engine: Engine | AsyncEngine) -> None:
+    """
+    커넥션 상태 확인(dialect.do_ping) 시간을 기록하도록 엔진의 dialect를 감쌉니다.
+    pool_pre_ping과 유휴 커넥션 확인(enable_idle_ping) 모두 do_ping을 사용합니다.
+    """
+    sync_engine = sync_engine_of(engine)
+    dialect = sync_engine.dialect
+    do_ping = dialect.do_ping
+    label = (pool_name(sync_engine.pool),)
+
+    def timed_ping(dbapi_connection: Any) -> bool:
+        started = time.perf_counter()
+        try:
+            return do_ping(dbapi_connection)
+        finally:
+            db_pool_ping.observe(time.perf_counter() - started, label)
+
+    dialect.do_ping = timed_ping
+
+
+def enable_idle_ping(engine: Engine | AsyncEngine, idle_seconds: float) -> None:
+    """
+    pool_pre_ping 대신, idle_seconds 이상 풀에서 쉬고 있던 커넥션만 checkout 시
+    확인합니다. 바쁜 풀에서는 checkout마다 생기던 왕복이 사라지고, 오래 쉰 커넥션
+    (DB 재시작, 방화벽 idle timeout 등으로 끊겼을 수 있는)만 확인합니다.
+    확인에 실패하면 DisconnectionError로 풀이 새 커넥션을 받아 다시 시도합니다.
+    """
+    sync_engine = sync_engine_of(engine)
+
+    @event.listens_for(sync_engine, "checkin")
+    def mark_idle(dbapi_connection, connection_record):
+        connection_record.info["idle_since"] = time.monotonic()
+
+    @event.listens_for(sync_engine, "checkout")
+    def ping_if_idle(dbapi_connection, connection_record, connection_proxy):
+        idle_since = connection_record.info.pop("idle_since", None)
+        if idle_since is None or time.monotonic() - idle_since < idle_seconds:
+            return
+        try:
+            alive = sync_engine.dialect.do_ping(dbapi_connection)
+        except Exception as e:
+            raise exc.DisconnectionError() from e
+        if not alive:
+            raise exc.DisconnectionError()
+
+
+def pool_stats(pools: dict[str, Pool]) -> dict[str, dict[str, int]]:
+    """
+    풀별 크기, 사용 중/overflow/대기 중 커넥션 수와 관측된 동시 수요,
+    그에 따른 추천 풀 크기를 반환합니다.
+    """
+    stats = {}
+    for name, pool in pools.items():
+        usage = pool_usage.get(pool_name(pool)) or PoolUsage()
+        stats[name] = {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            # QueuePool.overflow()는 풀이 다 차기 전까지 음수를 반환한다
+            "overflow": max(pool.overflow(), 0),
+            "waiting": usage.waiting,
+            "demand_p95": usage.demand_percentile(),
+            "demand_peak": usage.peak_demand,
+            "recommended_size": usage.recommended_size(),
+        }
+    return stats
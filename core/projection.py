@@ -0,0 +1,65 @@
+from typing import Any, Iterable, Mapping
+
+from fastapi import HTTPException, status
+
+
+def parse_fields(
+    fields: str | None, allowed: Iterable[str], default: Iterable[str]
+) -> list[str]:
+    """
+    쉼표로 구분된 fields 쿼리 파라미터를 검증하여 필드 목록으로 변환합니다.
+    값이 없으면 default를 사용하고, 허용되지 않은 필드가 있으면 400 에러를 발생시킵니다.
+    """
+    if not fields:
+        return list(default)
+
+    selected = list(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    unknown = [f for f in selected if f not in allowed]
+    if unknown or not selected:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"지원하지 않는 필드입니다: {', '.join(unknown)}",
+        )
+    return selected
+
+
+def make_excerpt(text: str, length: int) -> str:
+    """
+    본문 앞부분을 length 글자까지 잘라 미리보기를 만듭니다.
+    """
+    if len(text) <= length:
+        return text
+    return text[:length].rstrip() + "…"
+
+
+def project_row(
+    row: Mapping[str, Any], fields: Iterable[str], excerpt_length: int | None = None
+) -> dict[str, Any]:
+    """
+    컬럼 단위로 조회한 행에서 요청된 필드만 골라 응답 dict를 만듭니다.
+    """
+    data = {field: row[field] for field in fields}
+    if "excerpt" in data and excerpt_length is not None:
+        data["excerpt"] = make_excerpt(data["excerpt"], excerpt_length)
+    return data
+
+
+def parse_ids(ids: str, max_ids: int) -> list[int]:
+    """
+    쉼표로 구분된 ids 쿼리 파라미터를 중복 없이 요청 순서대로 정수 목록으로 변환합니다.
+    형식이 잘못되었거나 max_ids개를 넘으면 400 에러를 발생시킵니다.
+    """
+    try:
+        parsed = list(dict.fromkeys(int(i) for i in ids.split(",") if i.strip()))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="ids는 쉼표로 구분된 정수여야 합니다.",
+        )
+
+    if not parsed or len(parsed) > max_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"ids는 1개 이상 {max_ids}개 이하로 요청해야 합니다.",
+        )
+    return parsed
@@ -0,0 +1,156 @@
+import asyncio
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from typing import AsyncIterator, Protocol
+
+from core.config import get_settings
+
+settings = get_settings()
+
+
+class Subscription:
+    """
+    채널 하나를 구독하는 연결의 메시지 큐입니다.
+    큐 크기가 제한되어 있어, 소비가 느려 큐가 가득 차면 더 쌓지 않고
+    구독을 끊습니다(overflowed). 발행자는 느린 구독자 때문에 기다리지 않습니다.
+    """
+
+    def __init__(self, channel: str, max_size: int):
+        self.channel = channel
+        self.overflowed = False
+        self._queue: asyncio.Queue[str | None] = asyncio.Queue(maxsize=max_size)
+
+    def push(self, message: str) -> bool:
+        if self.overflowed:
+            return False
+        try:
+            self._queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            # 쌓인 메시지를 버리고 종료 신호만 남긴다
+            self.overflowed = True
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(None)
+            return False
+
+    def __aiter__(self) -> AsyncIterator[str]:
+        return self._messages()
+
+    async def _messages(self) -> AsyncIterator[str]:
+        while (message := await self._queue.get()) is not None:
+            yield message
+
+
+class Broker(Protocol):
+    """
+    채널별 메시지 발행/구독 인터페이스입니다.
+    """
+
+    async def publish(self, channel: str, message: str) -> None: ...
+
+    def subscribe(self, channel: str) -> AbstractAsyncContextManager[Subscription]: ...
+
+    def stats(self) -> dict[str, int]: ...
+
+
+class MemoryBroker:
+    """
+    워커 프로세스 안에서만 메시지를 전달하는 기본 브로커입니다.
+    워커가 여러 개라면 다른 워커에 연결된 구독자에게는 전달되지 않습니다.
+    """
+
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self._channels: dict[str, set[Subscription]] = {}
+        self.published = 0
+        self.dropped = 0
+        self.total_connections = 0
+
+    def fan_out(self, channel: str, message: str) -> None:
+        for subscription in list(self._channels.get(channel, ())):
+            if not subscription.push(message):
+                self.dropped += 1
+                self._remove(subscription)
+
+    async def publish(self, channel: str, message: str) -> None:
+        self.published += 1
+        self.fan_out(channel, message)
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncIterator[Subscription]:
+        subscription = Subscription(channel, self.queue_size)
+        self._channels.setdefault(channel, set()).add(subscription)
+        self.total_connections += 1
+        try:
+            yield subscription
+        finally:
+            self._remove(subscription)
+
+    def _remove(self, subscription: Subscription) -> None:
+        subscribers = self._channels.get(subscription.channel)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._channels[subscription.channel]
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "connections": sum(len(subs) for subs in self._channels.values()),
+            "channels": len(self._channels),
+            "total_connections": self.total_connections,
+            "published": self.published,
+            "dropped": self.dropped,
+        }
+
+
+class RedisBroker:
+    """
+    Redis pub/sub으로 여러 워커에 메시지를 전달하는 브로커입니다.
+    워커마다 하나의 패턴 구독으로 모든 채널을 받아 내부 MemoryBroker로 나눠 줍니다.
+    """
+
+    def __init__(self, url: str, queue_size: int, prefix: str = "jg11:pubsub:"):
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError as e:
+            raise RuntimeError(
+                "PUBSUB_BACKEND=redis 를 사용하려면 redis 패키지가 필요합니다."
+            ) from e
+
+        self._client = redis_asyncio.from_url(url)
+        self._prefix = prefix
+        self._local = MemoryBroker(queue_size)
+        self._listener: asyncio.Task | None = None
+
+    async def publish(self, channel: str, message: str) -> None:
+        self._local.published += 1
+        await self._client.publish(self._prefix + channel, message)
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncIterator[Subscription]:
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+        async with self._local.subscribe(channel) as subscription:
+            yield subscription
+
+    async def _listen(self) -> None:
+        pubsub = self._client.pubsub()
+        await pubsub.psubscribe(self._prefix + "*")
+        async for message in pubsub.listen():
+            if message["type"] != "pmessage":
+                continue
+            channel = message["channel"].decode()[len(self._prefix) :]
+            self._local.fan_out(channel, message["data"].decode())
+
+    def stats(self) -> dict[str, int]:
+        return self._local.stats()
+
+
+def create_broker() -> Broker:
+    if settings.PUBSUB_BACKEND == "redis":
+        return RedisBroker(settings.PUBSUB_REDIS_URL, settings.PUBSUB_QUEUE_SIZE)
+    return MemoryBroker(settings.PUBSUB_QUEUE_SIZE)
+
+
+broker = create_broker()
@@ -0,0 +1,209 @@
+import json
+from collections import OrderedDict
+from typing import Any, Protocol
+
+from core.cache import TTLCache
+from core.config import get_settings
+
+settings = get_settings()
+
+# 게시글 목록 캐시 세대 카운터. 글이 바뀌면 증가시켜 모든 목록 페이지를 무효화한다
+FEED_GENERATION_KEY = "posts:feed:generation"
+
+
+class CacheBackend(Protocol):
+    """
+    직렬화된 응답을 저장하는 캐시 백엔드 인터페이스입니다.
+    """
+
+    async def get(self, key: str) -> bytes | None: ...
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None: ...
+
+    async def delete(self, *keys: str) -> None: ...
+
+    async def incr(self, key: str) -> int: ...
+
+    async def get_counter(self, key: str) -> int: ...
+
+    async def clear(self) -> None: ...
+
+
+class MemoryCacheBackend:
+    """
+    워커 프로세스 내부 메모리에 저장하는 기본 백엔드입니다.
+    워커가 여러 개라면 무효화가 다른 워커에 전파되지 않으므로
+    TTL 동안 오래된 응답이 보일 수 있습니다.
+    """
+
+    def __init__(self, max_size: int):
+        self._cache = TTLCache(max_size=max_size, ttl=0)
+        # 버전 카운터도 캐시와 같은 크기의 LRU로 제한한다
+        self._counters: OrderedDict[str, int] = OrderedDict()
+        self._max_counters = max_size
+        # 제거된 카운터가 가졌던 가장 큰 값. 없는 카운터는 이 값부터 시작하므로
+        # 제거된 카운터의 예전 버전으로 저장된 응답을 다시 읽지 않는다
+        self._counter_floor = 0
+
+    async def get(self, key: str) -> bytes | None:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._cache.set(key, value, ttl=ttl)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._cache.invalidate(key)
+
+    async def incr(self, key: str) -> int:
+        value = self._counters.get(key, self._counter_floor) + 1
+        self._counters[key] = value
+        self._counters.move_to_end(key)
+        while len(self._counters) > self._max_counters:
+            _, evicted = self._counters.popitem(last=False)
+            self._counter_floor = max(self._counter_floor, evicted)
+        return value
+
+    async def get_counter(self, key: str) -> int:
+        value = self._counters.get(key)
+        if value is None:
+            return self._counter_floor
+        self._counters.move_to_end(key)
+        return value
+
+    async def clear(self) -> None:
+        self._cache.clear()
+        self._counters.clear()
+        self._counter_floor = 0
+
+    def stats(self) -> dict[str, int]:
+        return {**self._cache.stats(), "counters": len(self._counters)}
+
+
+class RedisCacheBackend:
+    """
+    Redis 호환 서버(Redis, Valkey, KeyDB 등)에 저장하는 백엔드입니다.
+    여러 워커가 같은 캐시와 무효화 상태를 공유합니다.
+    """
+
+    def __init__(self, url: str, prefix: str = "jg11:"):
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError as e:
+            raise RuntimeError(
+                "RESPONSE_CACHE_BACKEND=redis 를 사용하려면 redis 패키지가 필요합니다."
+            ) from e
+
+        self._client = redis_asyncio.from_url(url)
+        self._prefix = prefix
+
+    async def get(self, key: str) -> bytes | None:
+        return await self._client.get(self._prefix + key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await self._client.set(self._prefix + key, value, px=max(int(ttl * 1000), 1))
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self._client.delete(*(self._prefix + key for key in keys))
+
+    async def incr(self, key: str) -> int:
+        return await self._client.incr(self._prefix + key)
+
+    async def get_counter(self, key: str) -> int:
+        value = await self._client.get(self._prefix + key)
+        return int(value) if value is not None else 0
+
+    async def clear(self) -> None:
+        async for key in self._client.scan_iter(match=self._prefix + "*"):
+            await self._client.delete(key)
+
+
+class ResponseCache:
+    """
+    게시글 목록/단건 응답을 직렬화된 바이트로 캐시합니다.
+    응답 헤더(다음 페이지 커서 등)도 본문과 함께 저장합니다.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: float):
+        self.backend = backend
+        self.ttl = ttl
+
+    @staticmethod
+    def _pack(body: bytes, headers: dict[str, str]) -> bytes:
+        return json.dumps(headers).encode("utf-8") + b"\n" + body
+
+    @staticmethod
+    def _unpack(value: bytes) -> tuple[bytes, dict[str, str]]:
+        raw_headers, body = value.split(b"\n", 1)
+        return body, json.loads(raw_headers)
+
+    async def get(self, key: str) -> tuple[bytes, dict[str, str]] | None:
+        if self.ttl <= 0:
+            return None
+        value = await self.backend.get(key)
+        return self._unpack(value) if value is not None else None
+
+    async def set(
+        self,
+        key: str,
+        body: bytes,
+        headers: dict[str, str] | None = None,
+        generation: int | None = None,
+        ttl: float | None = None,
+    ) -> None:
+        """
+        응답을 저장합니다. 조회 시작 시점의 generation을 넘기면,
+        조회 도중 쓰기가 일어나 세대가 바뀐 경우 오래된 응답을 저장하지 않습니다.
+        ttl을 주면 기본 TTL보다 짧은 경우에만 해당 값(초)을 사용합니다.
+        """
+        if self.ttl <= 0:
+            return
+        if generation is not None and await self.generation() != generation:
+            return
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        await self.backend.set(key, self._pack(body, headers or {}), ttl)
+
+    async def generation(self) -> int:
+        return await self.backend.get_counter(FEED_GENERATION_KEY)
+
+    @staticmethod
+    def feed_key(generation: int, *parts: Any) -> str:
+        """
+        세대 번호를 포함한 게시글 목록 캐시 키를 만듭니다.
+        """
+        return f"posts:feed:{generation}:" + ":".join(str(part) for part in parts)
+
+    async def post_key(self, post_id: int, *parts: Any) -> str:
+        """
+        게시글별 버전 번호를 포함한 단건 캐시 키를 만듭니다.
+        필드 선택 등 같은 게시글의 여러 표현을 한 번에 무효화할 수 있습니다.
+        """
+        version = await self.backend.get_counter(self._post_version_key(post_id))
+        return f"posts:{post_id}:{version}:" + ":".join(str(part) for part in parts)
+
+    @staticmethod
+    def _post_version_key(post_id: int) -> str:
+        return f"posts:{post_id}:version"
+
+    async def invalidate_post(self, post_id: int | None = None) -> None:
+        """
+        게시글이 작성/수정/삭제되었을 때 목록 전체와 해당 게시글 캐시를 무효화합니다.
+        """
+        await self.backend.incr(FEED_GENERATION_KEY)
+        if post_id is not None:
+            await self.backend.incr(self._post_version_key(post_id))
+
+    async def clear(self) -> None:
+        await self.backend.clear()
+
+
+def create_backend() -> CacheBackend:
+    if settings.RESPONSE_CACHE_BACKEND == "redis":
+        return RedisCacheBackend(settings.RESPONSE_CACHE_REDIS_URL)
+    return MemoryCacheBackend(max_size=settings.RESPONSE_CACHE_MAX_SIZE)
+
+
+response_cache = ResponseCache(
+    backend=create_backend(), ttl=settings.RESPONSE_CACHE_TTL_SECONDS
+)
@@ -0,0 +1,129 @@
+from typing import Any
+
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    Table,
+    Text,
+    delete,
+    insert,
+    literal_column,
+    update,
+)
+from sqlmodel import func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from core.config import get_settings
+from models.posts import COMMENT_SEARCH_COLUMNS, POST_SEARCH_COLUMNS, Comment, Post
+
+settings = get_settings()
+
+SEARCH_COLUMNS = {Post: POST_SEARCH_COLUMNS, Comment: COMMENT_SEARCH_COLUMNS}
+
+# SQLite FTS5 가상 테이블. 모델 메타데이터와 분리해 create_all 대상에서 제외한다
+fts_metadata = MetaData()
+FTS_TABLES = {
+    model: Table(
+        f"{model.__tablename__}_fts",
+        fts_metadata,
+        Column("rowid", Integer),
+        *(Column(name, Text) for name in columns),
+    )
+    for model, columns in SEARCH_COLUMNS.items()
+}
+
+
+def to_tsvector(model: Any) -> Any:
+    columns = [getattr(model, name) for name in SEARCH_COLUMNS[model]]
+    return func.to_tsvector(settings.SEARCH_TEXT_CONFIG, func.concat_ws(" ", *columns))
+
+
+def fts5_query(q: str) -> str:
+    """
+    사용자 입력을 FTS5 MATCH 구문으로 변환합니다.
+    각 단어를 따옴표로 감싸 연산자로 해석되지 않게 하고, 모든 단어를 AND로 묶습니다.
+    """
+    return " ".join('"' + term.replace('"', '""') + '"' for term in q.split())
+
+
+def index_statements(
+    dialect: str, model: Any, ids: list[int] | None = None
+) -> list[Any]:
+    """
+    주어진 행(ids가 None이면 전체)의 검색 색인을 다시 만드는 쿼리 목록을 반환합니다.
+    Postgres는 search_vector 컬럼을, SQLite는 FTS5 테이블을 갱신합니다.
+    """
+    if dialect == "postgresql":
+        # 색인 갱신은 내용 변경이 아니므로 updated_at(onupdate)을 유지한다
+        statement = update(model).values(
+            search_vector=to_tsvector(model), updated_at=model.updated_at
+        )
+        if ids is not None:
+            statement = statement.where(model.id.in_(ids))
+        return [statement]
+
+    fts = FTS_TABLES[model]
+    names = SEARCH_COLUMNS[model]
+    source = select(model.id, *(getattr(model, name) for name in names))
+    remove = delete(fts)
+    if ids is not None:
+        source = source.where(model.id.in_(ids))
+        remove = remove.where(fts.c.rowid.in_(ids))
+    return [remove, insert(fts).from_select(["rowid", *names], source)]
+
+
+async def index_rows(db: AsyncSession, model: Any, ids: list[int]) -> None:
+    """
+    작성/수정된 행의 검색 색인을 같은 트랜잭션 안에서 갱신합니다.
+    """
+    if not ids:
+        return
+    for statement in index_statements(db.bind.dialect.name, model, ids):
+        await db.exec(statement)
+
+
+def ranked_matches(dialect: str, model: Any, q: str) -> Any:
+    """
+    검색어와 일치하는 행의 (id, score) 서브쿼리를 만듭니다.
+    score는 높을수록 관련도가 높습니다.
+    """
+    if dialect == "postgresql":
+        tsquery = func.websearch_to_tsquery(settings.SEARCH_TEXT_CONFIG, q)
+        return (
+            select(
+                model.id.label("id"),
+                func.ts_rank(model.search_vector, tsquery).label("score"),
+            )
+            .where(model.search_vector.op("@@")(tsquery))
+            .subquery("matches")
+        )
+
+    # bm25()는 낮을수록 관련도가 높으므로 부호를 뒤집는다
+    fts = FTS_TABLES[model]
+    fts_ref = literal_column(fts.name)
+    return (
+        select(fts.c.rowid.label("id"), (-func.bm25(fts_ref)).label("score"))
+        .where(fts_ref.op("MATCH")(fts5_query(q)))
+        .subquery("matches")
+    )
+
+
+def index_missing_statements(dialect: str, model: Any) -> list[Any]:
+    """
+    아직 색인되지 않은 행(일괄 가져오기 등으로 직접 추가된 행)만 색인하는 쿼리 목록을
+    반환합니다.
+    """
+    if dialect == "postgresql":
+        return [
+            update(model)
+            .where(model.search_vector.is_(None))
+            .values(search_vector=to_tsvector(model), updated_at=model.updated_at)
+        ]
+
+    fts = FTS_TABLES[model]
+    names = SEARCH_COLUMNS[model]
+    source = select(model.id, *(getattr(model, name) for name in names)).where(
+        model.id.not_in(select(fts.c.rowid))
+    )
+    return [insert(fts).from_select(["rowid", *names], source)]
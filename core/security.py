@@ -1,14 +1,23 @@
+import asyncio
+import hashlib
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Any
+from typing import Callable, Optional, Any
 
 import jwt
 import bcrypt
 from fastapi import HTTPException, status
 
+from core.cache import TTLCache
 from core.config import get_settings
 
 settings = get_settings()
 
+# sha256(token) -> 검증된 페이로드. 항목별 TTL은 토큰의 exp까지로 설정한다
+token_cache = TTLCache(max_size=settings.TOKEN_CACHE_MAX_SIZE, ttl=0)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
@@ -30,6 +39,129 @@ def get_password_hash(password: str) -> str:
     return hashed.decode("utf-8")
 
 
+def _timed_call(
+    func: Callable[..., Any], args: tuple[Any, ...]
+) -> tuple[Any, float, float]:
+    """
+    워커 안에서 함수를 실행하고 시작/종료 시각을 함께 반환합니다.
+    프로세스 풀에서도 쓸 수 있도록 모듈 수준 함수로 둡니다.
+    """
+    started_at = time.monotonic()
+    result = func(*args)
+    return result, started_at, time.monotonic()
+
+
+class PasswordHashPool:
+    """
+    bcrypt 연산을 이벤트 루프 밖의 워커 풀에서 실행합니다.
+    실행 중이거나 대기 중인 작업이 한도를 넘으면 즉시 503을 반환하고,
+    큐 대기 시간과 해시 시간을 누적 기록합니다.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        queue_limit: int,
+        executor: str = "thread",
+    ):
+        self.max_workers = max_workers
+        self.queue_limit = queue_limit
+        self.executor_type = executor
+        self._executor: Executor | None = None
+        self._lock = threading.Lock()
+        self._pending = 0
+
+        self.completed = 0
+        self.rejected = 0
+        self.queue_wait_seconds = 0.0
+        self.hash_seconds = 0.0
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.queue_limit
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_type == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="password-hash"
+                )
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            if self._pending >= self.capacity:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="요청이 많아 잠시 후 다시 시도해주세요.",
+                )
+            self._pending += 1
+
+        submitted_at = time.monotonic()
+        try:
+            loop = asyncio.get_running_loop()
+            result, started_at, finished_at = await loop.run_in_executor(
+                self._get_executor(), _timed_call, func, args
+            )
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+        with self._lock:
+            self.completed += 1
+            self.queue_wait_seconds += max(started_at - submitted_at, 0.0)
+            self.hash_seconds += finished_at - started_at
+
+        return result
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "pending": self._pending,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "queue_wait_seconds": self.queue_wait_seconds,
+                "hash_seconds": self.hash_seconds,
+            }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+password_hash_pool = PasswordHashPool(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    queue_limit=settings.PASSWORD_HASH_QUEUE_LIMIT,
+    executor=settings.PASSWORD_HASH_EXECUTOR,
+)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    verify_password를 워커 풀에서 실행합니다.
+    풀이 가득 찬 경우 503 에러를 발생시킵니다.
+    """
+    return await password_hash_pool.run(
+        verify_password, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    get_password_hash를 워커 풀에서 실행합니다.
+    풀이 가득 찬 경우 503 에러를 발생시킵니다.
+    """
+    return await password_hash_pool.run(get_password_hash, password)
+
+
 def create_access_token(
     data: dict[str, Any], expires_delta: Optional[timedelta] = None
 ) -> str:
@@ -56,12 +188,17 @@ def decode_access_token(token: str) -> dict[str, Any]:
     """
     JWT 토큰을 디코딩합니다.
     토큰이 유효하지 않거나 만료된 경우 예외를 발생시킵니다.
+    이미 검증한 토큰은 exp까지 캐시에서 꺼내 서명 검증을 생략합니다.
     """
+    cache_key = hashlib.sha256(token.encode("utf-8")).digest()
+    cached_payload = token_cache.get(cache_key)
+    if cached_payload is not None:
+        return dict(cached_payload)
+
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
         )
-        return payload
     except jwt.ExpiredSignatureError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="토큰이 만료되었습니다."
@@ -70,3 +207,10 @@ def decode_access_token(token: str) -> dict[str, Any]:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="유효하지 않은 토큰입니다."
         )
+
+    # exp가 있는 토큰만 남은 유효 시간만큼 캐시 (만료 시점은 jwt.decode와 동일)
+    expires_at = payload.get("exp")
+    if isinstance(expires_at, (int, float)):
+        token_cache.set(cache_key, dict(payload), ttl=expires_at - time.time())
+
+    return payload
@@ -0,0 +1,37 @@
+from functools import lru_cache
+from typing import Any
+
+from fastapi import Response, status
+from pydantic import TypeAdapter
+
+from core.config import get_settings
+
+settings = get_settings()
+
+
+@lru_cache(maxsize=None)
+def get_adapter(tp: Any) -> TypeAdapter:
+    """
+    응답 타입별 TypeAdapter(직렬화 스키마)를 한 번만 만들어 재사용합니다.
+    """
+    return TypeAdapter(tp)
+
+
+def model_response(
+    content: Any,
+    tp: Any,
+    status_code: int = status.HTTP_200_OK,
+) -> Any:
+    """
+    FAST_JSON이 켜져 있으면 핸들러에서 이미 만든(검증된) 응답 모델을 pydantic-core로
+    바로 JSON 바이트로 직렬화해 반환합니다. FastAPI의 response_model 재검증과
+    jsonable_encoder, json.dumps 단계를 건너뜁니다.
+    꺼져 있으면 content를 그대로 반환해 기존 경로를 사용합니다.
+    """
+    if not settings.FAST_JSON:
+        return content
+    return Response(
+        content=get_adapter(tp).dump_json(content),
+        media_type="application/json",
+        status_code=status_code,
+    )
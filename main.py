@@ -1,15 +1,76 @@
-from fastapi import FastAPI, Request
+from contextlib import asynccontextmanager
+from typing import Annotated
+
+from fastapi import Cookie, Depends, FastAPI, HTTPException, Request, status
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, PlainTextResponse
 from fastapi.openapi.utils import get_openapi
 from fastapi.middleware.cors import CORSMiddleware
+from markupsafe import Markup
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from apis.admin import admin_router
 from apis.users import user_router
-from apis.posts import post_router
+from apis.posts import load_feed_page, load_post_detail, post_router
 from apis.comments import comment_router
+from apis.search import search_router
+from core.auth import get_optional_user, user_cache
+from core.config import get_settings
+from core.database import (
+    ReadYourWritesMiddleware,
+    async_engine,
+    engine,
+    get_async_session,
+    get_read_session,
+    replicas,
+)
+from core.fragments import FragmentCache
+from core.metrics import MetricsMiddleware, registry, stats_collector
+from core.pool import pool_stats
+from core.pubsub import broker
+from core.response_cache import response_cache
+from core.security import password_hash_pool, token_cache
+from models.users import User
+
+settings = get_settings()
+
+# 템플릿 설정
+templates = Jinja2Templates(directory="templates")
+
+# 게시글 카드/본문처럼 반복되는 HTML 조각 캐시 (SSR 모드에서 사용)
+fragment_cache = FragmentCache(
+    templates.env,
+    max_size=settings.FRAGMENT_CACHE_MAX_SIZE,
+    ttl=settings.FRAGMENT_CACHE_TTL_SECONDS,
+)
+
+# 요청마다 달라지는 내용이 없는 페이지는 한 번만 렌더링해 재사용한다
+STATIC_PAGES = ("login.html", "signup.html")
+prerendered_pages: dict[str, str] = {}
 
-app = FastAPI()
+
+def render_static_page(name: str) -> HTMLResponse:
+    """
+    미리 렌더링해 둔 정적 페이지를 반환합니다.
+    """
+    page = prerendered_pages.get(name)
+    if page is None:
+        page = prerendered_pages[name] = templates.get_template(name).render()
+    return HTMLResponse(page)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    서버 시작 시 정적 페이지를 미리 렌더링합니다.
+    """
+    for name in STATIC_PAGES:
+        render_static_page(name)
+    yield
+
+
+app = FastAPI(lifespan=lifespan)
 
 # 운영 환경용 CORS 설정
 # origins = [
@@ -32,9 +93,14 @@ app = FastAPI()
 #     max_age=600,  # 프리플라이트 요청 캐시 시간 (초)
 # )
 
-# 정적 파일과 템플릿 설정
+# 쓰기 후 잠시 동안 같은 사용자의 읽기를 primary로 보내는 고정 쿠키
+app.add_middleware(ReadYourWritesMiddleware)
+
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+# 정적 파일 설정
 app.mount("/static", StaticFiles(directory="static"), name="static")
-templates = Jinja2Templates(directory="templates")
 
 
 def custom_openapi():
@@ -67,44 +133,169 @@ app.openapi = custom_openapi
 app.include_router(user_router)
 app.include_router(post_router)
 app.include_router(comment_router)
+app.include_router(search_router)
+app.include_router(admin_router)
 
 
 @app.get("/health")
 async def health_check(request: Request):
     """
     서버 상태를 확인하는 엔드포인트입니다.
+    현재 워커의 실시간 댓글 연결 수도 함께 반환합니다.
     """
-    return {"status": "ok"}
+    return {"status": "ok", "live_connections": broker.stats()["connections"]}
+
+
+def cache_stats() -> dict[str, dict]:
+    caches = {
+        "token": token_cache.stats(),
+        "user": user_cache.stats(),
+        "fragment": fragment_cache.stats(),
+    }
+    if hasattr(response_cache.backend, "stats"):
+        caches["response"] = response_cache.backend.stats()
+    return caches
+
+
+registry.register_collector(
+    stats_collector(
+        "db_pool",
+        "커넥션 풀 상태",
+        lambda: pool_stats(
+            {
+                "sync": engine.pool,
+                "async": async_engine.pool,
+                **{
+                    f"replica{index}": replica.pool
+                    for index, replica in enumerate(replicas.engines)
+                },
+            }
+        ),
+    )
+)
+registry.register_collector(
+    stats_collector(
+        "password_hash_pool",
+        "비밀번호 해시 워커 풀 통계",
+        lambda: {"default": password_hash_pool.stats()},
+    )
+)
+registry.register_collector(
+    stats_collector(
+        "db_replica", "읽기 복제본 상태", lambda: {"default": replicas.stats()}
+    )
+)
+registry.register_collector(stats_collector("cache", "캐시 통계", cache_stats))
+registry.register_collector(
+    stats_collector("pubsub", "실시간 댓글 연결 통계", lambda: {"comments": broker.stats()})
+)
+
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics():
+    """
+    요청/DB/커넥션 풀/캐시/실시간 연결 지표를 Prometheus 텍스트 형식으로 반환하는
+    엔드포인트입니다.
+    """
+    if not settings.METRICS_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    return PlainTextResponse(
+        registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+async def get_ssr_session(
+    request: Request, primary: AsyncSession = Depends(get_async_session)
+):
+    """
+    SSR 모드에서만 읽기 세션(get_read_session)을 여는 의존성입니다.
+    SSR이 꺼져 있으면 None을 반환해 복제본 연결이나 커넥션 checkout을 하지 않습니다.
+    (primary 세션은 실제로 쿼리하기 전까지 커넥션을 잡지 않습니다.)
+    """
+    if not settings.SSR_ENABLED:
+        yield None
+        return
+    async with asynccontextmanager(get_read_session)(request, primary) as session:
+        yield session
+
+
+async def get_ssr_viewer(
+    access_token: Annotated[str | None, Cookie()] = None,
+    db: AsyncSession = Depends(get_async_session),
+) -> User | None:
+    """
+    SSR 모드에서만 현재 사용자를 확인하는 의존성입니다.
+    SSR이 꺼져 있으면 토큰 해석과 사용자 조회 없이 None을 반환합니다.
+    """
+    if not settings.SSR_ENABLED:
+        return None
+    return await get_optional_user(access_token=access_token, db=db)
 
 
 @app.get("/", response_class=HTMLResponse)
-async def home(request: Request):
+async def home(request: Request, db: AsyncSession | None = Depends(get_ssr_session)):
     """
     메인 페이지를 렌더링합니다.
     게시글 목록을 보여줍니다.
+    SSR 모드에서는 첫 페이지 게시글 카드를 HTML에 포함해 추가 API 호출 없이 그립니다.
     """
-    return templates.TemplateResponse("index.html", {"request": request})
+    context = {}
+    if settings.SSR_ENABLED:
+        posts = await load_feed_page(db, settings.SSR_FEED_PAGE_SIZE)
+        context["posts_html"] = Markup("").join(
+            fragment_cache.render("partials/post_card.html", version, post=post)
+            for post, version in posts
+        )
+    return templates.TemplateResponse(request, "index.html", context)
+
 
 @app.get("/posts/{post_id}", response_class=HTMLResponse)
-async def post_detail(request: Request, post_id: int):
+async def post_detail(
+    request: Request,
+    post_id: int,
+    viewer: Annotated[User | None, Depends(get_ssr_viewer)],
+    db: AsyncSession | None = Depends(get_ssr_session),
+):
     """
     게시글 상세 페이지를 렌더링합니다.
+    SSR 모드에서는 게시글 본문과 첫 댓글 페이지를 HTML에 포함하고,
+    /api/posts/{post_id}/detail 응답과 같은 데이터를 페이지에 함께 내려보냅니다.
     """
-    return templates.TemplateResponse("post_detail.html", {
-        "request": request,
-        "post_id": post_id
-    })
+    context = {"post_id": post_id}
+    if not settings.SSR_ENABLED:
+        return templates.TemplateResponse(request, "post_detail.html", context)
+
+    try:
+        detail, version = await load_post_detail(db, post_id, viewer, 50)
+    except HTTPException as e:
+        if e.status_code != status.HTTP_404_NOT_FOUND:
+            raise
+        return templates.TemplateResponse(
+            request,
+            "post_detail.html",
+            context,
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
+
+    context["post_html"] = fragment_cache.render(
+        "partials/post_article.html", (post_id, *version), post=detail.post
+    )
+    context["detail"] = detail
+    context["initial_detail"] = detail.model_dump(mode="json")
+    return templates.TemplateResponse(request, "post_detail.html", context)
+
 
 @app.get("/signup", response_class=HTMLResponse)
-async def signup_page(request: Request):
+async def signup_page():
     """
-    회원가입 페이지를 렌더링합니다.
+    회원가입 페이지를 반환합니다.
     """
-    return templates.TemplateResponse("signup.html", {"request": request})
+    return render_static_page("signup.html")
+
 
 @app.get("/login", response_class=HTMLResponse)
-async def login_page(request: Request):
+async def login_page():
     """
-    로그인 페이지를 렌더링합니다.
+    로그인 페이지를 반환합니다.
     """
-    return templates.TemplateResponse("login.html", {"request": request})
\ No newline at end of file
+    return render_static_page("login.html")
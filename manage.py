@@ -0,0 +1,149 @@
+"""
+운영용 관리 명령어 모음입니다.
+
+    python manage.py --help
+"""
+import sys
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+
+import typer
+from sqlalchemy import func, update
+from sqlmodel import Session, select
+
+from core.database import engine
+from core.export import EXPORT_MODELS, export_query, iter_export
+from core.importer import ImportStats, import_records, read_records
+from models.posts import Comment, Post
+
+cli = typer.Typer(help="JG-11 backend 관리 명령어", no_args_is_help=True)
+
+
+@cli.callback()
+def main():
+    """
+    JG-11 backend 관리 명령어
+    """
+
+
+@cli.command("recount-comments")
+def recount_comments(
+    post_id: int | None = typer.Option(None, help="특정 게시글만 다시 계산"),
+):
+    """
+    게시글의 comment_count를 실제 삭제되지 않은 댓글 수로 다시 계산합니다.
+    """
+    live_comments = (
+        select(func.count(Comment.id))
+        .where(Comment.post_id == Post.id, Comment.is_deleted == False)
+        .scalar_subquery()
+    )
+    statement = (
+        update(Post)
+        .where(Post.comment_count != live_comments)
+        # 댓글 수 보정은 게시글 내용 변경이 아니므로 updated_at(onupdate)을 유지한다
+        .values(comment_count=live_comments, updated_at=Post.updated_at)
+    )
+    if post_id is not None:
+        statement = statement.where(Post.id == post_id)
+
+    with Session(engine) as session:
+        result = session.exec(statement)
+        session.commit()
+
+    typer.echo(f"{result.rowcount}개 게시글의 댓글 수를 수정했습니다.")
+
+
+class ExportKind(str, Enum):
+    posts = "posts"
+    comments = "comments"
+
+
+@cli.command("export")
+def export(
+    kind: ExportKind = typer.Argument(..., help="내보낼 대상"),
+    output: Path | None = typer.Option(None, help="저장할 파일 (기본값: 표준 출력)"),
+    since: datetime | None = typer.Option(None, help="updated_at이 이 시각 이후인 행만"),
+    until: datetime | None = typer.Option(None, help="updated_at이 이 시각 이전인 행만"),
+    include_deleted: bool = typer.Option(False, help="삭제된 행도 포함"),
+    after_id: int | None = typer.Option(None, help="이 id 다음부터 이어서 내보내기"),
+):
+    """
+    게시글 또는 댓글을 NDJSON으로 내보냅니다.
+    서버 사이드 커서로 일정한 메모리만 사용하며, 중단되면 파일의 마지막 id를
+    --after-id로 넘겨 이어서 내보낼 수 있습니다 (--output 파일에는 이어 씁니다).
+    """
+    query = export_query(
+        EXPORT_MODELS[kind.value],
+        since=since,
+        until=until,
+        include_deleted=include_deleted,
+        after_id=after_id,
+    )
+
+    mode = "ab" if after_id is not None else "wb"
+    stream = output.open(mode) if output else sys.stdout.buffer
+    try:
+        for chunk in iter_export(engine, query):
+            stream.write(chunk)
+    finally:
+        if output:
+            stream.close()
+        else:
+            stream.flush()
+
+
+class ImportKind(str, Enum):
+    users = "users"
+    posts = "posts"
+    comments = "comments"
+
+
+class ImportFormat(str, Enum):
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+@cli.command("import")
+def import_rows(
+    kind: ImportKind = typer.Argument(..., help="가져올 대상"),
+    source: Path = typer.Argument(..., exists=True, dir_okay=False, help="입력 파일"),
+    fmt: ImportFormat | None = typer.Option(
+        None, "--format", help="입력 형식 (기본값: 확장자로 판단)"
+    ),
+    batch_size: int = typer.Option(5000, help="한 트랜잭션에 쓸 행 수"),
+):
+    """
+    사용자/게시글/댓글을 NDJSON 또는 CSV 파일에서 대량으로 가져옵니다.
+    Postgres에서는 COPY, SQLite에서는 배치 INSERT로 쓰며 입력을 스트리밍으로 읽습니다.
+
+    게시글/댓글의 작성자는 user_uuid 또는 user_email로 지정하고, 배치 단위로 확인합니다.
+    사용자 password는 bcrypt 해시를 그대로 저장합니다 (다시 해싱하지 않음).
+    """
+    fmt = fmt or (ImportFormat.csv if source.suffix == ".csv" else ImportFormat.ndjson)
+
+    def report(stats: ImportStats) -> None:
+        typer.echo(
+            f"{stats.imported}행 가져옴 ({stats.rows_per_second:,.0f} rows/s)", err=True
+        )
+
+    with source.open(newline="", encoding="utf-8") as stream:
+        stats = import_records(
+            engine,
+            kind.value,
+            read_records(stream, fmt.value),
+            batch_size=batch_size,
+            on_batch=report,
+        )
+
+    for line, reason in stats.skipped_lines:
+        typer.echo(f"  {line}번째 줄 건너뜀: {reason}", err=True)
+    typer.echo(
+        f"{stats.imported}행을 가져왔습니다 (건너뜀 {stats.skipped}행, "
+        f"{stats.elapsed:.1f}초, {stats.rows_per_second:,.0f} rows/s)."
+    )
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,94 @@
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import engine_from_config, pool
+from sqlmodel import SQLModel
+
+import models.posts  # noqa: F401
+import models.users  # noqa: F401
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = SQLModel.metadata
+
+
+def include_name(name, type_, parent_names) -> bool:
+    """
+    SQLite 검색 색인(FTS5 가상 테이블과 내부 테이블)은 모델에 없으므로 비교에서 제외합니다.
+    """
+    if type_ == "table":
+        return not (name.endswith("_fts") or "_fts_" in name)
+    return True
+
+
+def include_object(object, name, type_, reflected, compare_to) -> bool:
+    """
+    search_vector 컬럼과 GIN 인덱스는 Postgres에만 만들므로, 그 외 DB에서는 비교에서 제외합니다.
+    """
+    if context.get_bind().dialect.name == "postgresql":
+        return True
+    if type_ == "column":
+        return name != "search_vector"
+    if type_ == "index":
+        return not name.endswith("_search")
+    return True
+
+
+def get_url() -> str:
+    """
+    마이그레이션 대상 DB URL을 결정합니다.
+    -x db_url=... 인자, alembic 설정의 sqlalchemy.url, .env 설정 순으로 사용합니다.
+    """
+    x_args = context.get_x_argument(as_dictionary=True)
+    if x_args.get("db_url"):
+        return x_args["db_url"]
+
+    url = config.get_main_option("sqlalchemy.url")
+    if url:
+        return url
+
+    from core.config import get_settings
+
+    return get_settings().SYNC_DATABASE_URL
+
+
+def run_migrations_offline() -> None:
+    context.configure(
+        url=get_url(),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    configuration = config.get_section(config.config_ini_section, {})
+    configuration["sqlalchemy.url"] = get_url()
+    connectable = engine_from_config(
+        configuration, prefix="sqlalchemy.", poolclass=pool.NullPool
+    )
+
+    with connectable.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_name=include_name,
+            include_object=include_object,
+            # SQLite는 ALTER TABLE 지원이 제한적이므로 batch 모드로 처리
+            render_as_batch=connection.dialect.name == "sqlite",
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,43 @@
+"""hot query indexes
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 00:00:00
+
+목록 조회(is_deleted = false, created_at desc)와 게시글별 댓글 조회에 맞춘
+부분 인덱스를 추가한다. Postgres/SQLite 모두 삭제되지 않은 행만 인덱싱한다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_post_user_uuid", "post", ["user_uuid"])
+    op.create_index(
+        "ix_post_feed",
+        "post",
+        ["created_at", "id"],
+        postgresql_where=sa.text("is_deleted = false"),
+        sqlite_where=sa.text("is_deleted = 0"),
+    )
+    op.create_index(
+        "ix_comment_post_feed",
+        "comment",
+        ["post_id", "created_at", "id"],
+        postgresql_where=sa.text("is_deleted = false"),
+        sqlite_where=sa.text("is_deleted = 0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_comment_post_feed", table_name="comment")
+    op.drop_index("ix_post_feed", table_name="post")
+    op.drop_index("ix_post_user_uuid", table_name="post")
@@ -0,0 +1,39 @@
+"""post comment count
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 00:00:00
+
+게시글별 댓글 수를 비정규화한 comment_count 컬럼을 추가하고 기존 데이터로 채운다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("post") as batch_op:
+        batch_op.add_column(
+            sa.Column("comment_count", sa.Integer(), nullable=False, server_default="0")
+        )
+
+    op.execute(
+        """
+        UPDATE post SET comment_count = (
+            SELECT COUNT(*) FROM comment
+            WHERE comment.post_id = post.id AND comment.is_deleted = false
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("post") as batch_op:
+        batch_op.drop_column("comment_count")
@@ -0,0 +1,64 @@
+"""full text search
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 00:00:00
+
+게시글/댓글 전문 검색 색인을 추가한다.
+Postgres는 search_vector(tsvector) 컬럼과 GIN 인덱스를, SQLite는 FTS5 가상 테이블을
+사용하며 기존 데이터로 색인을 채운다. search_vector 컬럼과 인덱스는 Postgres에만 만든다.
+텍스트 검색 설정('simple')은 SEARCH_TEXT_CONFIG 기본값과 일치해야 한다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_COLUMNS = {"post": ("title", "content"), "comment": ("content",)}
+
+
+def upgrade() -> None:
+    is_postgres = op.get_bind().dialect.name == "postgresql"
+
+    for table, columns in SEARCH_COLUMNS.items():
+        if is_postgres:
+            op.add_column(
+                table,
+                sa.Column("search_vector", postgresql.TSVECTOR(), nullable=True),
+            )
+            op.create_index(
+                f"ix_{table}_search",
+                table,
+                ["search_vector"],
+                postgresql_using="gin",
+            )
+            op.execute(
+                f"UPDATE {table} SET search_vector = "
+                f"to_tsvector('simple', concat_ws(' ', {', '.join(columns)}))"
+            )
+        else:
+            op.execute(
+                f"CREATE VIRTUAL TABLE {table}_fts USING fts5({', '.join(columns)})"
+            )
+            op.execute(
+                f"INSERT INTO {table}_fts(rowid, {', '.join(columns)}) "
+                f"SELECT id, {', '.join(columns)} FROM {table}"
+            )
+
+
+def downgrade() -> None:
+    is_postgres = op.get_bind().dialect.name == "postgresql"
+
+    for table in SEARCH_COLUMNS:
+        if is_postgres:
+            op.drop_index(f"ix_{table}_search", table_name=table)
+            op.drop_column(table, "search_vector")
+        else:
+            op.execute(f"DROP TABLE IF EXISTS {table}_fts")
@@ -1,23 +1,91 @@
 from typing import Optional
 
+from sqlalchemy import DDL, Index, Text, event, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlmodel import Field
 
 from models.commons import TimeStamp, SoftDelete
 
+# 전문 검색 색인에 포함하는 컬럼
+POST_SEARCH_COLUMNS = ("title", "content")
+COMMENT_SEARCH_COLUMNS = ("content",)
+
+# Postgres에서는 tsvector, 그 외(SQLite)에서는 사용하지 않는 텍스트 컬럼
+SearchVector = Text().with_variant(TSVECTOR(), "postgresql")
+
 
 class Post(TimeStamp, SoftDelete, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str
     content: str
 
+    # 비정규화된 댓글 수 (댓글 작성/삭제 시 원자적으로 증감)
+    comment_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+
+    # 전문 검색 색인 (작성/수정 시 core.search에서 갱신)
+    search_vector: Optional[str] = Field(default=None, sa_type=SearchVector)
+
     # 외래키 관계
-    user_uuid: str = Field(foreign_key="user.uuid")
+    user_uuid: str = Field(foreign_key="user.uuid", index=True)
+
+    __table_args__ = (
+        # 목록 조회: 삭제되지 않은 글을 (created_at desc, id desc)로 정렬
+        Index(
+            "ix_post_feed",
+            "created_at",
+            "id",
+            postgresql_where=text("is_deleted = false"),
+            sqlite_where=text("is_deleted = 0"),
+        ),
+        # search_vector 검색 인덱스는 Postgres 전용 (SQLite는 FTS5 사용)
+        Index("ix_post_search", "search_vector", postgresql_using="gin").ddl_if(
+            dialect="postgresql"
+        ),
+    )
 
 
 class Comment(TimeStamp, SoftDelete, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     content: str
 
+    # 전문 검색 색인 (작성/수정 시 core.search에서 갱신)
+    search_vector: Optional[str] = Field(default=None, sa_type=SearchVector)
+
     # 외래키 관계
     user_uuid: str = Field(foreign_key="user.uuid")
     post_id: int = Field(foreign_key="post.id")
+
+    __table_args__ = (
+        # 댓글 목록 조회: 게시글별로 삭제되지 않은 댓글을 최신순 정렬
+        Index(
+            "ix_comment_post_feed",
+            "post_id",
+            "created_at",
+            "id",
+            postgresql_where=text("is_deleted = false"),
+            sqlite_where=text("is_deleted = 0"),
+        ),
+        Index("ix_comment_search", "search_vector", postgresql_using="gin").ddl_if(
+            dialect="postgresql"
+        ),
+    )
+
+
+# SQLite에는 tsvector가 없으므로 FTS5 가상 테이블을 검색 색인으로 사용한다
+for table, columns in (
+    (Post.__table__, POST_SEARCH_COLUMNS),
+    (Comment.__table__, COMMENT_SEARCH_COLUMNS),
+):
+    event.listen(
+        table,
+        "after_create",
+        DDL(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {table.name}_fts "
+            f"USING fts5({', '.join(columns)})"
+        ).execute_if(dialect="sqlite"),
+    )
+    event.listen(
+        table,
+        "after_drop",
+        DDL(f"DROP TABLE IF EXISTS {table.name}_fts").execute_if(dialect="sqlite"),
+    )
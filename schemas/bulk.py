@@ -0,0 +1,36 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+from core.config import get_settings
+
+settings = get_settings()
+
+
+class BulkDeleteRequest(BaseModel):
+    """
+    일괄 삭제 요청에 사용되는 스키마입니다.
+    삭제할 id 목록을 받습니다.
+    """
+
+    ids: List[int] = Field(min_length=1, max_length=settings.BULK_MAX_ITEMS)
+
+
+class BulkItemResult(BaseModel):
+    """
+    일괄 처리 결과의 항목별 상태입니다.
+    index는 요청 목록에서의 위치이며, status는 단건 API의 상태 코드와 같습니다.
+    """
+
+    index: int
+    id: int | None = None
+    status: int
+    detail: str | None = None
+
+
+class BulkResponse(BaseModel):
+    """
+    일괄 처리 응답에 사용되는 스키마입니다.
+    """
+
+    results: List[BulkItemResult]
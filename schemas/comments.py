@@ -1,4 +1,10 @@
-from pydantic import BaseModel
+from typing import List
+
+from pydantic import BaseModel, Field
+
+from core.config import get_settings
+
+settings = get_settings()
 
 
 class CommentCreate(BaseModel):
@@ -28,3 +34,32 @@ class CommentResponse(BaseModel):
     content: str
     user_name: str
     post_id: int
+
+
+class CommentBatchResponse(BaseModel):
+    """
+    ids로 여러 댓글을 한 번에 조회할 때 사용하는 응답 스키마입니다.
+    items는 요청 순서를 따르며, 찾지 못한 id는 missing에 담깁니다.
+    """
+
+    items: List[CommentResponse]
+    missing: List[int]
+
+
+class CommentBulkCreateItem(BaseModel):
+    """
+    댓글 일괄 작성 요청의 각 항목입니다.
+    """
+
+    post_id: int
+    content: str
+
+
+class CommentBulkCreateRequest(BaseModel):
+    """
+    댓글 일괄 작성 요청에 사용되는 스키마입니다.
+    """
+
+    items: List[CommentBulkCreateItem] = Field(
+        min_length=1, max_length=settings.BULK_MAX_ITEMS
+    )
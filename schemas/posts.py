@@ -1,4 +1,13 @@
-from pydantic import BaseModel, ConfigDict
+from typing import List
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from core.config import get_settings
+
+from schemas.comments import CommentResponse
+from schemas.users import UserInfoResponse
+
+settings = get_settings()
 
 
 class PostCreate(BaseModel):
@@ -20,6 +29,7 @@ class PostResponse(BaseModel):
     title: str
     content: str
     user_name: str
+    comment_count: int = 0
 
     # ConfigDict를 사용하여 설정을 정의합니다.
     model_config = ConfigDict(
@@ -35,3 +45,42 @@ class PostUpdate(BaseModel):
 
     title: str | None = None
     content: str | None = None
+
+
+class PostAuthorResponse(BaseModel):
+    """
+    게시글 작성자 정보 응답에 사용되는 스키마입니다.
+    """
+
+    user_name: str
+
+
+class PostDetailResponse(BaseModel):
+    """
+    게시글 상세 페이지에 필요한 데이터를 한 번에 담는 응답 스키마입니다.
+    게시글, 작성자, 첫 댓글 페이지와 현재 사용자(비로그인 시 null)를 포함합니다.
+    """
+
+    post: PostResponse
+    author: PostAuthorResponse
+    comments: List[CommentResponse]
+    next_comment_cursor: str | None = None
+    viewer: UserInfoResponse | None = None
+
+
+class PostBatchResponse(BaseModel):
+    """
+    ids로 여러 게시글을 한 번에 조회할 때 사용하는 응답 스키마입니다.
+    items는 요청 순서를 따르며, 찾지 못한 id는 missing에 담깁니다.
+    """
+
+    items: List[PostResponse]
+    missing: List[int]
+
+
+class PostBulkCreateRequest(BaseModel):
+    """
+    게시글 일괄 작성 요청에 사용되는 스키마입니다.
+    """
+
+    items: List[PostCreate] = Field(min_length=1, max_length=settings.BULK_MAX_ITEMS)
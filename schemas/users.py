@@ -22,3 +22,11 @@ class SignInRequest(BaseModel):
     email: EmailStr
     password: str
 
+
+class UserInfoResponse(BaseModel):
+    """
+    현재 로그인한 사용자 정보 응답에 사용되는 스키마입니다.
+    """
+
+    email: EmailStr
+    user_name: str
@@ -1,14 +1,109 @@
+import asyncio
+
+import httpx
 import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+from starlette.routing import Match
 from sqlmodel import SQLModel, create_engine, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from fastapi.testclient import TestClient
 
-from main import app
-from core.database import get_session
+from main import app, fragment_cache
+from core.auth import user_cache
+from core.database import get_async_session
+from core.metrics import UNMATCHED_ROUTE
+from core.response_cache import response_cache
 
 # 테스트용 인메모리 데이터베이스 설정
 DATABASE_URL = "sqlite:///./test.db"
+ASYNC_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
 engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
 
+# TestClient는 테스트마다 새 이벤트 루프를 띄우므로 커넥션을 재사용하지 않는다
+async_engine = create_async_engine(ASYNC_DATABASE_URL, poolclass=NullPool)
+async_session_factory = async_sessionmaker(
+    async_engine, class_=AsyncSession, expire_on_commit=False
+)
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "query_budget(budgets): 라우트별('METHOD /path/{param}') 요청 한 번의 "
+        "SQL 실행 수 상한. 모듈/클래스/함수에 선언하며 가까운 쪽이 우선한다.",
+    )
+
+
+def route_key(method: str, path: str) -> str:
+    """
+    요청 경로를 라우트 템플릿 키로 바꿉니다. (예: GET /api/posts/{post_id})
+    """
+    scope = {"type": "http", "method": method, "path": path, "root_path": ""}
+    partial = None
+    for route in app.router.routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return f"{method} {route.path}"
+        if match == Match.PARTIAL and partial is None:
+            partial = route
+    return f"{method} {partial.path if partial else UNMATCHED_ROUTE}"
+
+
+class QueryBudget:
+    """
+    테스트 클라이언트 요청 하나가 실행한 SQL 문 수를 세어, 선언된 라우트별 예산을
+    넘거나 예산이 선언되지 않은 라우트를 호출하면 테스트를 실패시킵니다.
+    """
+
+    def __init__(self, budgets: dict[str, int]):
+        self.budgets = budgets
+        self.counts: list[tuple[str, int]] = []
+        self._statements: int | None = None
+
+    def count_statement(self, *args) -> None:
+        if self._statements is not None:
+            self._statements += 1
+
+    def on_request(self, request: httpx.Request) -> None:
+        self._statements = 0
+
+    def on_response(self, response: httpx.Response) -> None:
+        statements, self._statements = self._statements or 0, None
+        route = route_key(response.request.method, response.request.url.path)
+        self.counts.append((route, statements))
+
+        budget = self.budgets.get(route)
+        if budget is None:
+            pytest.fail(f"{route}에 대한 query_budget이 선언되지 않았습니다.")
+        if statements > budget:
+            pytest.fail(f"{route}: SQL {statements}개 실행 (예산 {budget}개)")
+
+
+@pytest.fixture(scope="function")
+def query_budget(request):
+    """
+    query_budget 마커가 붙은 테스트에서 요청별 SQL 실행 수를 검사하는 픽스처입니다.
+    마커가 없으면 None을 반환하고 아무것도 검사하지 않습니다.
+    """
+    markers = list(request.node.iter_markers("query_budget"))
+    if not markers:
+        yield None
+        return
+
+    budgets: dict[str, int] = {}
+    for marker in reversed(markers):
+        budgets.update(marker.args[0])
+
+    budget = QueryBudget(budgets)
+    event.listen(Engine, "after_cursor_execute", budget.count_statement)
+    try:
+        yield budget
+    finally:
+        event.remove(Engine, "after_cursor_execute", budget.count_statement)
+
 
 # 테스트용 데이터베이스 세션 생성
 @pytest.fixture(scope="function")
@@ -19,14 +114,22 @@ def db_session():
     SQLModel.metadata.drop_all(bind=engine)  # 테이블 삭제
 
 
-# FastAPI의 의존성을 테스트용 세션으로 대체
+# FastAPI의 의존성을 테스트용 비동기 세션(aiosqlite)으로 대체
 @pytest.fixture(scope="function")
-def client(db_session):
-    def override_get_session():
-        with db_session as session:
+def client(db_session, query_budget):
+    async def override_get_async_session():
+        async with async_session_factory() as session:
             yield session
 
-    app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_async_session] = override_get_async_session
     with TestClient(app) as c:
+        if query_budget is not None:
+            c.event_hooks = {
+                "request": [query_budget.on_request],
+                "response": [query_budget.on_response],
+            }
         yield c
     app.dependency_overrides.clear()
+    user_cache.clear()
+    fragment_cache.clear()
+    asyncio.run(response_cache.clear())
@@ -0,0 +1,65 @@
+import json
+
+import pytest
+
+from core.config import get_settings
+
+
+@pytest.fixture
+def user_token(client):
+    """테스트용 사용자를 등록하고 로그인하여 토큰을 반환하는 픽스처입니다."""
+    signup_data = {
+        "email": "testuser@example.com",
+        "password": "testpassword",
+        "password_check": "testpassword",
+        "user_name": "테스트유저",
+    }
+    client.post("/api/users/signup", json=signup_data)
+
+    login_data = {"email": signup_data["email"], "password": signup_data["password"]}
+    response = client.post("/api/users/login", json=login_data)
+    return response.cookies.get("access_token")
+
+
+@pytest.fixture
+def admin_token(user_token, monkeypatch):
+    """테스트용 사용자를 관리자로 등록합니다."""
+    monkeypatch.setattr(get_settings(), "ADMIN_EMAILS", ["testuser@example.com"])
+    return user_token
+
+
+def read_ndjson(response) -> list[dict]:
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_export_posts(client, admin_token, monkeypatch):
+    """게시글 내보내기의 필터와 이어받기(after_id)를 테스트합니다."""
+    monkeypatch.setattr(get_settings(), "EXPORT_BATCH_SIZE", 2)
+    client.cookies.set("access_token", admin_token)
+    items = [{"title": f"제목 {i}", "content": f"내용 {i}"} for i in range(5)]
+    client.post("/api/posts/bulk", json={"items": items})
+    client.delete("/api/posts/3")
+
+    response = client.get("/api/admin/export/posts")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = read_ndjson(response)
+    assert [row["id"] for row in rows] == [1, 2, 4, 5]
+    assert rows[0]["title"] == "제목 0"
+    assert "search_vector" not in rows[0]
+
+    response = client.get("/api/admin/export/posts?include_deleted=true&after_id=2")
+    assert [row["id"] for row in read_ndjson(response)] == [3, 4, 5]
+
+    response = client.get("/api/admin/export/posts?since=2999-01-01T00:00:00")
+    assert response.text == ""
+
+
+def test_export_requires_admin(client, user_token):
+    """관리자가 아닌 사용자의 내보내기 시도를 테스트합니다."""
+    response = client.get("/api/admin/export/comments")
+    assert response.status_code == 401
+
+    client.cookies.set("access_token", user_token)
+    response = client.get("/api/admin/export/comments")
+    assert response.status_code == 403
@@ -1,11 +1,34 @@
+import asyncio
+
+import httpx
 import pytest
 
 from fastapi.testclient import TestClient
+from sqlmodel import select
 
 from main import app
+from models.posts import Post
 
 client = TestClient(app)
 
+# 요청 한 번이 실행할 수 있는 SQL 문 수 (목록 조회가 N+1로 바뀌면 실패)
+pytestmark = pytest.mark.query_budget(
+    {
+        "GET /api/comments": 2,
+        "POST /api/comments": 5,
+        "POST /api/comments/bulk": 6,
+        "POST /api/comments/bulk-delete": 3,
+        "DELETE /api/comments/{comment_id}": 3,
+        "PATCH /api/comments/{comment_id}": 5,
+        "GET /api/posts": 1,
+        "POST /api/posts": 5,
+        "GET /api/posts/{post_id}": 1,
+        "POST /api/users/login": 1,
+        "POST /api/users/signup": 2,
+        "GET /health": 0,
+    }
+)
+
 
 @pytest.fixture
 def user_token(client):
@@ -63,6 +86,76 @@ def test_create_comment_unauthorized(client, test_post):
     assert response.status_code == 401
 
 
+def test_comment_count_maintained(client, user_token, test_post, test_comment):
+    """댓글 작성/삭제 시 게시글의 댓글 수가 갱신되는지 테스트합니다."""
+    assert client.get(f"/api/posts/{test_post['id']}").json()["comment_count"] == 1
+
+    client.cookies.set("access_token", user_token)
+    client.delete(f"/api/comments/{test_comment['id']}?post_id={test_post['id']}")
+    assert client.get(f"/api/posts/{test_post['id']}").json()["comment_count"] == 0
+    assert client.get("/api/posts").json()[0]["comment_count"] == 0
+
+
+def test_comment_count_keeps_post_updated_at(
+    client, db_session, user_token, test_post
+):
+    """댓글 수 갱신이 게시글의 updated_at은 유지하고 ETag만 바꾸는지 테스트합니다."""
+    post_url = f"/api/posts/{test_post['id']}"
+    etag = client.get(post_url).headers["ETag"]
+    updated_at = db_session.exec(
+        select(Post.updated_at).where(Post.id == test_post["id"])
+    ).one()
+
+    client.cookies.set("access_token", user_token)
+    comment = client.post(
+        f"/api/comments?post_id={test_post['id']}", json={"content": "댓글"}
+    ).json()
+    client.delete(f"/api/comments/{comment['id']}?post_id={test_post['id']}")
+    client.post(f"/api/comments?post_id={test_post['id']}", json={"content": "댓글"})
+
+    assert (
+        db_session.exec(
+            select(Post.updated_at).where(Post.id == test_post["id"])
+        ).one()
+        == updated_at
+    )
+    response = client.get(post_url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["comment_count"] == 1
+
+
+def test_delete_comment_concurrently(client, user_token, test_post, test_comment):
+    """같은 댓글을 동시에 두 번 삭제해도 댓글 수는 한 번만 줄어드는지 테스트합니다."""
+    url = f"/api/comments/{test_comment['id']}?post_id={test_post['id']}"
+
+    async def delete_twice():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport,
+            base_url="http://testserver",
+            cookies={"access_token": user_token},
+        ) as async_client:
+            return await asyncio.gather(
+                async_client.delete(url), async_client.delete(url)
+            )
+
+    responses = asyncio.run(delete_twice())
+    assert sorted(response.status_code for response in responses) == [204, 404]
+    assert client.get(f"/api/posts/{test_post['id']}").json()["comment_count"] == 0
+
+    # 이미 삭제된 댓글을 다시 삭제해도 댓글 수는 그대로
+    client.cookies.set("access_token", user_token)
+    assert client.delete(url).status_code == 404
+    assert client.get(f"/api/posts/{test_post['id']}").json()["comment_count"] == 0
+
+
+def test_create_comment_nonexistent_post(client, user_token):
+    """존재하지 않는 게시글에 댓글 작성 시도를 테스트합니다."""
+    client.cookies.set("access_token", user_token)
+    response = client.post("/api/comments?post_id=99999", json={"content": "댓글"})
+    assert response.status_code == 404
+
+
 def test_get_comments(client, test_post, test_comment):
     """댓글 목록 조회를 테스트합니다."""
     response = client.get(f"/api/comments?post_id={test_post['id']}")
@@ -72,6 +165,65 @@ def test_get_comments(client, test_post, test_comment):
     assert response.json()[0]["content"] == test_comment["content"]
 
 
+def test_get_comments_cursor_pagination(client, user_token, test_post):
+    """커서 기반 댓글 목록 페이지네이션을 테스트합니다."""
+    client.cookies.set("access_token", user_token)
+    for i in range(3):
+        client.post(
+            f"/api/comments?post_id={test_post['id']}", json={"content": f"댓글 {i}"}
+        )
+
+    first_page = client.get(f"/api/comments?post_id={test_post['id']}&limit=2")
+    assert first_page.status_code == 200
+    assert len(first_page.json()) == 2
+    cursor = first_page.headers["X-Next-Cursor"]
+
+    second_page = client.get(
+        f"/api/comments?post_id={test_post['id']}&limit=2&cursor={cursor}"
+    )
+    assert second_page.status_code == 200
+    assert [comment["content"] for comment in second_page.json()] == ["댓글 0"]
+
+
+def test_get_comments_sparse_fields(client, test_post, test_comment):
+    """fields 파라미터로 필요한 댓글 필드만 반환하는지 테스트합니다."""
+    response = client.get(f"/api/comments?post_id={test_post['id']}&fields=content")
+    assert response.status_code == 200
+    assert response.json() == [{"content": test_comment["content"]}]
+
+
+def test_get_comments_by_ids(client, test_post, test_comment):
+    """ids로 여러 댓글을 조회하고 없는 id를 보고하는지 테스트합니다."""
+    response = client.get(f"/api/comments?ids=99999,{test_comment['id']}")
+    assert response.status_code == 200
+    assert [comment["id"] for comment in response.json()["items"]] == [
+        test_comment["id"]
+    ]
+    assert response.json()["missing"] == [99999]
+
+
+def test_get_comments_without_post_id(client):
+    """post_id와 ids가 모두 없는 댓글 목록 조회를 테스트합니다."""
+    response = client.get("/api/comments")
+    assert response.status_code == 422
+
+
+def test_get_comments_not_modified(client, user_token, test_post, test_comment):
+    """댓글 목록의 ETag 조건부 요청에 304를 반환하는지 테스트합니다."""
+    url = f"/api/comments?post_id={test_post['id']}"
+    etag = client.get(url).headers["ETag"]
+
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    # 댓글이 삭제되면 목록이 바뀌어 200을 반환
+    client.cookies.set("access_token", user_token)
+    client.delete(f"/api/comments/{test_comment['id']}?post_id={test_post['id']}")
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json() == []
+
+
 def test_update_comment_success(client, user_token, test_post, test_comment):
     """댓글 수정 성공 시나리오를 테스트합니다."""
     client.cookies.set("access_token", user_token)
@@ -120,3 +272,113 @@ def test_delete_comment_unauthorized(client, test_post, test_comment):
         f"/api/comments/{test_comment['id']}?post_id={test_post['id']}"
     )
     assert response.status_code == 401
+
+
+def test_bulk_create_comments(client, user_token, test_post):
+    """댓글 일괄 작성과 항목별 결과를 테스트합니다."""
+    client.cookies.set("access_token", user_token)
+    response = client.post(
+        "/api/comments/bulk",
+        json={
+            "items": [
+                {"post_id": test_post["id"], "content": "댓글 1"},
+                {"post_id": 99999, "content": "없는 게시글"},
+                {"post_id": test_post["id"], "content": "댓글 2"},
+            ]
+        },
+    )
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [result["status"] for result in results] == [201, 404, 201]
+
+    comments = client.get(f"/api/comments?post_id={test_post['id']}").json()
+    assert {comment["content"] for comment in comments} == {"댓글 1", "댓글 2"}
+    assert client.get(f"/api/posts/{test_post['id']}").json()["comment_count"] == 2
+
+
+def test_bulk_delete_comments(client, user_token, test_post, test_comment):
+    """댓글 일괄 삭제와 항목별 결과를 테스트합니다."""
+    client.cookies.set("access_token", user_token)
+    response = client.post(
+        "/api/comments/bulk-delete", json={"ids": [test_comment["id"], 99999]}
+    )
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [result["status"] for result in results] == [204, 404]
+
+    assert client.get(f"/api/comments?post_id={test_post['id']}").json() == []
+    assert client.get(f"/api/posts/{test_post['id']}").json()["comment_count"] == 0
+
+    # 이미 삭제된 댓글은 다시 세지 않는다
+    response = client.post(
+        "/api/comments/bulk-delete", json={"ids": [test_comment["id"]]}
+    )
+    assert [result["status"] for result in response.json()["results"]] == [404]
+    assert client.get(f"/api/posts/{test_post['id']}").json()["comment_count"] == 0
+
+
+def test_bulk_delete_comments_unauthorized(client, test_comment):
+    """인증되지 않은 사용자의 댓글 일괄 삭제 시도를 테스트합니다."""
+    client.cookies.clear()
+    response = client.post("/api/comments/bulk-delete", json={"ids": [test_comment["id"]]})
+    assert response.status_code == 401
+
+
+def test_live_comments(client, user_token, test_post):
+    """댓글 작성/수정/삭제가 WebSocket 구독자에게 전달되는지 테스트합니다."""
+    client.cookies.set("access_token", user_token)
+    post_id = test_post["id"]
+
+    with client.websocket_connect(f"/api/comments/live?post_id={post_id}") as ws:
+        assert client.get("/health").json()["live_connections"] == 1
+
+        comment = client.post(
+            f"/api/comments?post_id={post_id}", json={"content": "실시간 댓글"}
+        ).json()
+        assert ws.receive_json() == {"type": "created", "comment": comment}
+
+        client.patch(
+            f"/api/comments/{comment['id']}?post_id={post_id}",
+            json={"content": "수정된 댓글"},
+        )
+        message = ws.receive_json()
+        assert message["type"] == "updated"
+        assert message["comment"]["content"] == "수정된 댓글"
+
+        client.delete(f"/api/comments/{comment['id']}?post_id={post_id}")
+        assert ws.receive_json() == {
+            "type": "deleted",
+            "comment": {"id": comment["id"], "post_id": post_id},
+        }
+
+    assert client.get("/health").json()["live_connections"] == 0
+
+
+def test_get_comments_validators(client, user_token, test_post):
+    """댓글 목록 응답에 커서와 검증 헤더가 한 번씩만 실리는지 테스트합니다."""
+    client.cookies.set("access_token", user_token)
+    for i in range(3):
+        client.post(f"/api/comments?post_id={test_post['id']}", json={"content": f"{i}"})
+
+    url = f"/api/comments?post_id={test_post['id']}&limit=2"
+    response = client.get(url)
+    assert response.status_code == 200
+    for header in ("ETag", "Last-Modified", "X-Next-Cursor"):
+        assert len(response.headers.get_list(header)) == 1
+
+    not_modified = client.get(url, headers={"If-None-Match": response.headers["ETag"]})
+    assert not_modified.status_code == 304
+    assert not_modified.headers["ETag"] == response.headers["ETag"]
+
+
+def test_create_comment_fast_json(client, user_token, test_post, monkeypatch):
+    """FAST_JSON 경로로 댓글 작성 응답을 직렬화하는지 테스트합니다."""
+    from core.config import get_settings
+
+    monkeypatch.setattr(get_settings(), "FAST_JSON", True)
+    client.cookies.set("access_token", user_token)
+    response = client.post(
+        f"/api/comments?post_id={test_post['id']}", json={"content": "새 댓글"}
+    )
+    assert response.status_code == 201
+    assert response.json()["content"] == "새 댓글"
@@ -0,0 +1,224 @@
+import io
+import json
+
+import pytest
+from sqlmodel import Session, select
+from typer.testing import CliRunner
+
+import manage
+from core.importer import import_records, read_records
+from core.security import get_password_hash
+from models.posts import Post
+from models.users import User
+from tests.conftest import engine
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def manage_engine(monkeypatch, db_session):
+    """관리 명령어가 테스트용 데이터베이스를 사용하도록 엔진을 교체합니다."""
+    monkeypatch.setattr(manage, "engine", engine)
+    return engine
+
+
+def test_recount_comments(client, manage_engine, db_session):
+    """recount-comments 명령이 어긋난 댓글 수를 바로잡는지 테스트합니다."""
+    client.post(
+        "/api/users/signup",
+        json={
+            "email": "testuser@example.com",
+            "password": "testpassword",
+            "password_check": "testpassword",
+            "user_name": "테스트유저",
+        },
+    )
+    login_response = client.post(
+        "/api/users/login",
+        json={"email": "testuser@example.com", "password": "testpassword"},
+    )
+    client.cookies.set("access_token", login_response.cookies.get("access_token"))
+
+    response = client.post("/api/posts", json={"title": "제목", "content": "내용"})
+    post_id = response.json()["id"]
+    client.post(f"/api/comments?post_id={post_id}", json={"content": "댓글"})
+
+    post = db_session.exec(select(Post).where(Post.id == post_id)).one()
+    post.comment_count = 10
+    db_session.add(post)
+    db_session.commit()
+
+    result = runner.invoke(manage.cli, ["recount-comments"])
+    assert result.exit_code == 0
+
+    db_session.refresh(post)
+    assert post.comment_count == 1
+
+
+def test_export(client, manage_engine, tmp_path):
+    """export 명령이 NDJSON 파일을 만들고 after_id로 이어 쓰는지 테스트합니다."""
+    client.post(
+        "/api/users/signup",
+        json={
+            "email": "testuser@example.com",
+            "password": "testpassword",
+            "password_check": "testpassword",
+            "user_name": "테스트유저",
+        },
+    )
+    login_response = client.post(
+        "/api/users/login",
+        json={"email": "testuser@example.com", "password": "testpassword"},
+    )
+    client.cookies.set("access_token", login_response.cookies.get("access_token"))
+    items = [{"title": f"제목 {i}", "content": "내용"} for i in range(3)]
+    client.post("/api/posts/bulk", json={"items": items})
+
+    output = tmp_path / "posts.ndjson"
+    result = runner.invoke(
+        manage.cli,
+        ["export", "posts", "--output", str(output), "--until", "2000-01-01"],
+    )
+    assert result.exit_code == 0
+    assert output.read_text() == ""
+
+    result = runner.invoke(manage.cli, ["export", "posts", "--output", str(output)])
+    assert result.exit_code == 0
+    lines = output.read_text().splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [1, 2, 3]
+
+    # 마지막 줄을 잃었다고 가정하고 이어서 내보내기
+    output.write_text("\n".join(lines[:2]) + "\n")
+    result = runner.invoke(
+        manage.cli, ["export", "posts", "--output", str(output), "--after-id", "2"]
+    )
+    assert result.exit_code == 0
+    assert output.read_text().splitlines() == lines
+
+    result = runner.invoke(manage.cli, ["export", "comments"])
+    assert result.exit_code == 0
+    assert result.output == ""
+
+
+def test_import(client, manage_engine, tmp_path):
+    """import 명령이 사용자/게시글/댓글을 가져오고 참조와 파생 데이터를 맞추는지 테스트합니다."""
+    users = tmp_path / "users.ndjson"
+    users.write_text(
+        json.dumps(
+            {
+                "email": "imported@example.com",
+                "password": get_password_hash("testpassword"),
+                "user_name": "가져온유저",
+                "uuid": "imported-uuid",
+            }
+        )
+        + "\n"
+        + json.dumps(
+            {"email": "plain@example.com", "password": "plain", "user_name": "평문"}
+        )
+        + "\n"
+    )
+    result = runner.invoke(manage.cli, ["import", "users", str(users)])
+    assert result.exit_code == 0
+    assert "1행을 가져왔습니다 (건너뜀 1행" in result.output
+
+    # 입력의 해시를 그대로 저장했으므로 원래 비밀번호로 로그인 가능
+    login_response = client.post(
+        "/api/users/login",
+        json={"email": "imported@example.com", "password": "testpassword"},
+    )
+    assert login_response.status_code == 200
+
+    posts = tmp_path / "posts.csv"
+    posts.write_text(
+        "id,title,content,user_email,user_uuid\n"
+        "10,가져온 글,imported body,imported@example.com,\n"
+        "11,작성자 없음,내용,,unknown-uuid\n"
+    )
+    result = runner.invoke(
+        manage.cli, ["import", "posts", str(posts), "--batch-size", "1"]
+    )
+    assert result.exit_code == 0
+    assert "사용자를 찾을 수 없습니다: unknown-uuid" in result.output
+
+    comments = tmp_path / "comments.ndjson"
+    comments.write_text(
+        "\n".join(
+            json.dumps(
+                {"content": f"댓글 {i}", "post_id": 10, "user_uuid": "imported-uuid"}
+            )
+            for i in range(3)
+        )
+    )
+    result = runner.invoke(manage.cli, ["import", "comments", str(comments)])
+    assert result.exit_code == 0
+
+    post = client.get("/api/posts/10").json()
+    assert post["user_name"] == "가져온유저"
+    assert post["comment_count"] == 3
+
+    # 가져온 행도 검색 색인에 포함
+    response = client.get("/api/search/posts?q=imported")
+    assert [post["id"] for post in response.json()] == [10]
+
+    # 직접 지정한 id 이후로 자동 증가
+    client.cookies.set("access_token", login_response.cookies.get("access_token"))
+    response = client.post("/api/posts", json={"title": "새 글", "content": "내용"})
+    assert response.json()["id"] == 11
+
+
+def user_line(email: str) -> str:
+    return json.dumps(
+        {
+            "email": email,
+            "password": get_password_hash("testpassword"),
+            "user_name": email.split("@")[0],
+        }
+    )
+
+
+def test_import_skips_malformed_lines(client, manage_engine):
+    """JSON으로 읽을 수 없는 줄은 줄 번호와 함께 건너뛰고 나머지는 가져오는지 테스트합니다."""
+    lines = [
+        user_line("first@example.com"),
+        "{not json",
+        "[1, 2]",
+        user_line("second@example.com"),
+    ]
+    stream = io.StringIO("\n".join(lines) + "\n")
+    stats = import_records(
+        manage_engine, "users", read_records(stream, "ndjson"), batch_size=2
+    )
+
+    assert stats.imported == 2
+    assert [line for line, _ in stats.skipped_lines] == [2, 3]
+    assert "JSON" in stats.skipped_lines[0][1]
+
+
+def test_import_skips_duplicate_rows(client, manage_engine, tmp_path):
+    """배치 안의 중복 이메일은 해당 줄만 건너뛰고 같은 배치의 다른 행은 쓰는지 테스트합니다."""
+    users = tmp_path / "users.ndjson"
+    users.write_text(
+        "\n".join(
+            [
+                user_line("first@example.com"),
+                user_line("second@example.com"),
+                user_line("first@example.com"),
+                user_line("third@example.com"),
+            ]
+        )
+        + "\n"
+    )
+    result = runner.invoke(
+        manage.cli, ["import", "users", str(users), "--batch-size", "4"]
+    )
+    assert result.exit_code == 0
+    assert "3행을 가져왔습니다 (건너뜀 1행" in result.output
+
+    with Session(manage_engine) as session:
+        emails = session.exec(select(User.email)).all()
+    assert sorted(emails) == [
+        "first@example.com",
+        "second@example.com",
+        "third@example.com",
+    ]
@@ -0,0 +1,67 @@
+from sqlalchemy import text
+from sqlmodel import create_engine
+
+from core.metrics import (
+    Histogram,
+    db_pool_checkout_wait,
+    http_request_statements,
+    http_requests,
+    registry,
+)
+from core.pool import TimedQueuePool
+
+
+def test_metrics_endpoint(client):
+    """라우트 템플릿별 요청 수와 요청당 SQL 실행 수가 기록되는지 테스트합니다."""
+    registry.clear()
+
+    client.get("/api/posts/1")
+    client.get("/api/posts/2")
+    client.get("/no-such-page")
+
+    labels = ("GET", "/api/posts/{post_id}")
+    assert http_requests.value((*labels, "404")) == 2
+    assert http_requests.value(("GET", "__unmatched__", "404")) == 1
+    assert http_request_statements.count(labels) == 2
+    assert http_request_statements.sum(labels) >= 2
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert (
+        'http_requests_total{method="GET",route="/api/posts/{post_id}",status="404"} 2'
+        in body
+    )
+    assert "# TYPE http_request_duration_seconds histogram" in body
+    assert 'cache_hits{name="token"}' in body
+    assert 'pubsub_connections{name="comments"} 0' in body
+    assert 'db_pool_checked_out{name="async"}' in body
+
+
+def test_histogram_buckets():
+    """히스토그램이 누적 버킷, 합계, 개수를 올바르게 출력하는지 테스트합니다."""
+    histogram = Histogram("latency", "테스트", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value, ("/a",))
+
+    assert list(histogram.samples()) == [
+        'latency_bucket{route="/a",le="0.1"} 2',
+        'latency_bucket{route="/a",le="1.0"} 3',
+        'latency_bucket{route="/a",le="+Inf"} 4',
+        'latency_sum{route="/a"} 3.65',
+        'latency_count{route="/a"} 4',
+    ]
+
+
+def test_pool_checkout_wait():
+    """풀에서 커넥션을 꺼낼 때마다 대기 시간이 풀 이름 라벨로 기록되는지 테스트합니다."""
+    engine = create_engine(
+        "sqlite://", poolclass=TimedQueuePool, pool_logging_name="metrics-test"
+    )
+    for _ in range(3):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    engine.dispose()
+
+    assert db_pool_checkout_wait.count(("metrics-test",)) == 3
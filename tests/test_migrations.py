@@ -0,0 +1,30 @@
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, inspect
+
+
+def test_migrations_match_models(tmp_path):
+    """마이그레이션을 끝까지 적용했을 때 모델과 스키마가 일치하는지 테스트합니다."""
+    db_url = f"sqlite:///{tmp_path}/migrations.db"
+    config = Config("alembic.ini")
+    config.set_main_option("sqlalchemy.url", db_url)
+
+    command.upgrade(config, "head")
+    command.check(config)  # 모델과 차이가 있으면 예외 발생
+
+    inspector = inspect(create_engine(db_url))
+    indexes = {
+        index["name"]
+        for table in ("post", "comment")
+        for index in inspector.get_indexes(table)
+    }
+    assert {"ix_post_feed", "ix_post_user_uuid", "ix_comment_post_feed"} <= indexes
+
+    # search_vector 컬럼과 GIN 인덱스는 Postgres 전용 (SQLite는 FTS5 사용)
+    assert not {"ix_post_search", "ix_comment_search"} & indexes
+    for table in ("post", "comment"):
+        columns = {column["name"] for column in inspector.get_columns(table)}
+        assert "search_vector" not in columns
+    assert {"post_fts", "comment_fts"} <= set(inspector.get_table_names())
+
+    command.downgrade(config, "base")
@@ -0,0 +1,93 @@
+from sqlalchemy import text
+from sqlmodel import create_engine
+
+from core.metrics import db_pool_ping
+from core.pool import (
+    PoolUsage,
+    TimedQueuePool,
+    enable_idle_ping,
+    pool_stats,
+    time_pings,
+)
+
+
+def make_engine(name: str, **options):
+    return create_engine(
+        "sqlite://", poolclass=TimedQueuePool, pool_logging_name=name, **options
+    )
+
+
+def test_pool_stats_recommend_size_from_demand():
+    """동시에 사용한 커넥션 수로 추천 풀 크기를 계산하는지 테스트합니다."""
+    engine = make_engine("pool-demand", pool_size=5)
+    with engine.connect(), engine.connect(), engine.connect() as third:
+        third.execute(text("SELECT 1"))
+        stats = pool_stats({"test": engine.pool})["test"]
+        assert stats["checked_out"] == 3
+        assert stats["overflow"] == 0
+
+    stats = pool_stats({"test": engine.pool})["test"]
+    assert stats["checked_out"] == 0
+    assert stats["demand_peak"] == 3
+    assert stats["demand_p95"] == 3
+    assert stats["recommended_size"] == 4
+    engine.dispose()
+
+
+def test_pool_usage_counts_waiting_requests():
+    """커넥션을 기다리는 요청도 수요에 포함되는지 테스트합니다."""
+    usage = PoolUsage()
+    for _ in range(3):
+        usage.start_wait()
+    usage.end_wait(checked_out=2)  # 2개 사용 중 + 2개 대기 중
+
+    assert usage.peak_demand == 4
+    assert usage.recommended_size() == 5
+
+
+def test_pre_ping_is_timed():
+    """pool_pre_ping의 커넥션 확인 시간이 기록되는지 테스트합니다."""
+    engine = make_engine("pool-pre-ping", pool_pre_ping=True)
+    time_pings(engine)
+    for _ in range(3):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+    # 첫 checkout은 새 커넥션이라 확인하지 않는다
+    assert db_pool_ping.count(("pool-pre-ping",)) == 2
+    engine.dispose()
+
+
+def test_idle_ping_only_checks_idle_connections():
+    """적응형 모드에서는 오래 쉰 커넥션만 확인하는지 테스트합니다."""
+    busy = make_engine("pool-busy")
+    time_pings(busy)
+    enable_idle_ping(busy, idle_seconds=3600)
+
+    idle = make_engine("pool-idle")
+    time_pings(idle)
+    enable_idle_ping(idle, idle_seconds=0)
+
+    for engine in (busy, idle):
+        for _ in range(3):
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+        engine.dispose()
+
+    assert db_pool_ping.count(("pool-busy",)) == 0
+    assert db_pool_ping.count(("pool-idle",)) == 2
+
+
+def test_idle_ping_replaces_dead_connection():
+    """확인에 실패한 커넥션은 버리고 새 커넥션으로 다시 시도하는지 테스트합니다."""
+    engine = make_engine("pool-dead")
+    enable_idle_ping(engine, idle_seconds=0)
+
+    with engine.connect() as conn:
+        first = conn.connection.dbapi_connection
+
+    engine.dialect.do_ping = lambda dbapi_connection: False
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT 1")).scalar() == 1
+        assert conn.connection.dbapi_connection is not first
+    engine.dispose()
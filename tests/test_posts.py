@@ -2,10 +2,32 @@ import pytest
 
 from fastapi.testclient import TestClient
 
+from core.auth import user_cache
 from main import app
 
 client = TestClient(app)
 
+# 요청 한 번이 실행할 수 있는 SQL 문 수 (목록 조회가 N+1로 바뀌면 실패)
+pytestmark = pytest.mark.query_budget(
+    {
+        "GET /": 1,
+        "POST /api/comments": 5,
+        "GET /api/posts": 1,
+        "POST /api/posts": 5,
+        "POST /api/posts/bulk": 6,
+        "POST /api/posts/bulk-delete": 2,
+        "DELETE /api/posts/{post_id}": 2,
+        "GET /api/posts/{post_id}": 1,
+        "PATCH /api/posts/{post_id}": 5,
+        "GET /api/posts/{post_id}/detail": 2,
+        "POST /api/users/login": 1,
+        "POST /api/users/signup": 2,
+        "GET /login": 0,
+        "GET /posts/{post_id}": 2,
+        "GET /signup": 0,
+    }
+)
+
 
 @pytest.fixture
 def user_token(client):
@@ -69,6 +91,100 @@ def test_get_posts(client, test_post):
     assert response.json()[0]["title"] == test_post["title"]
 
 
+def test_get_posts_cursor_pagination(client, user_token):
+    """커서 기반 게시글 목록 페이지네이션을 테스트합니다."""
+    client.cookies.set("access_token", user_token)
+    for i in range(3):
+        client.post("/api/posts", json={"title": f"제목 {i}", "content": "내용"})
+
+    first_page = client.get("/api/posts?limit=2")
+    assert first_page.status_code == 200
+    assert [post["title"] for post in first_page.json()] == ["제목 2", "제목 1"]
+    cursor = first_page.headers["X-Next-Cursor"]
+
+    second_page = client.get(f"/api/posts?limit=2&cursor={cursor}")
+    assert second_page.status_code == 200
+    assert [post["title"] for post in second_page.json()] == ["제목 0"]
+    assert "X-Next-Cursor" not in second_page.headers
+
+
+def test_get_posts_invalid_cursor(client):
+    """잘못된 커서로 게시글 목록 조회 시도를 테스트합니다."""
+    response = client.get("/api/posts?cursor=invalid")
+    assert response.status_code == 400
+
+
+def test_get_posts_cache_invalidated_on_write(client, user_token, test_post):
+    """게시글 목록 캐시가 작성/수정/삭제 시 무효화되는지 테스트합니다."""
+    assert len(client.get("/api/posts").json()) == 1
+
+    client.cookies.set("access_token", user_token)
+    client.post("/api/posts", json={"title": "새 게시글", "content": "내용"})
+    posts = client.get("/api/posts").json()
+    assert [post["title"] for post in posts] == ["새 게시글", test_post["title"]]
+
+    client.patch(f"/api/posts/{test_post['id']}", json={"title": "수정된 제목"})
+    assert client.get("/api/posts").json()[1]["title"] == "수정된 제목"
+    assert client.get(f"/api/posts/{test_post['id']}").json()["title"] == "수정된 제목"
+
+    client.delete(f"/api/posts/{test_post['id']}")
+    assert len(client.get("/api/posts").json()) == 1
+
+
+def test_get_posts_summary_view(client, user_token):
+    """요약 보기에서 본문 대신 잘린 미리보기를 반환하는지 테스트합니다."""
+    client.cookies.set("access_token", user_token)
+    client.post("/api/posts", json={"title": "긴 게시글", "content": "가" * 500})
+
+    response = client.get("/api/posts?view=summary")
+    assert response.status_code == 200
+    post = response.json()[0]
+    assert set(post) == {"id", "title", "excerpt", "user_name", "comment_count"}
+    assert post["excerpt"] == "가" * 200 + "…"
+
+
+def test_get_posts_sparse_fields(client, test_post):
+    """fields 파라미터로 필요한 필드만 반환하는지 테스트합니다."""
+    response = client.get("/api/posts?fields=id,title")
+    assert response.status_code == 200
+    assert response.json() == [{"id": test_post["id"], "title": test_post["title"]}]
+
+    response = client.get(f"/api/posts/{test_post['id']}?fields=content")
+    assert response.json() == {"content": test_post["content"]}
+
+    response = client.get("/api/posts?fields=password")
+    assert response.status_code == 400
+
+
+def test_get_posts_by_ids(client, user_token):
+    """ids로 여러 게시글을 요청 순서대로 조회하고 없는 id를 보고하는지 테스트합니다."""
+    client.cookies.set("access_token", user_token)
+    post_ids = []
+    for i in range(3):
+        response = client.post("/api/posts", json={"title": f"제목 {i}", "content": "내용"})
+        post_ids.append(response.json()["id"])
+
+    response = client.get(f"/api/posts?ids={post_ids[2]},99999,{post_ids[0]}")
+    assert response.status_code == 200
+    assert [post["id"] for post in response.json()["items"]] == [
+        post_ids[2],
+        post_ids[0],
+    ]
+    assert response.json()["missing"] == [99999]
+
+    # 배치 조회 응답 형태가 OpenAPI 문서에 포함된다
+    schema = client.app.openapi()["paths"]["/api/posts"]["get"]["responses"]["200"]
+    variants = schema["content"]["application/json"]["schema"]["anyOf"]
+    assert {"$ref": "#/components/schemas/PostBatchResponse"} in variants
+
+
+def test_get_posts_by_ids_invalid(client):
+    """잘못된 ids 파라미터와 최대 개수 초과를 테스트합니다."""
+    assert client.get("/api/posts?ids=a,b").status_code == 400
+    too_many = ",".join(str(i) for i in range(1, 102))
+    assert client.get(f"/api/posts?ids={too_many}").status_code == 400
+
+
 def test_get_post_by_id(client, test_post):
     """특정 게시글 조회를 테스트합니다."""
     response = client.get(f"/api/posts/{test_post['id']}")
@@ -77,6 +193,84 @@ def test_get_post_by_id(client, test_post):
     assert response.json()["content"] == test_post["content"]
 
 
+def test_get_post_not_modified(client, user_token, test_post):
+    """ETag / Last-Modified 조건부 요청에 304를 반환하는지 테스트합니다."""
+    response = client.get(f"/api/posts/{test_post['id']}")
+    etag = response.headers["ETag"]
+
+    response = client.get(
+        f"/api/posts/{test_post['id']}", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+
+    # 댓글 수가 없는 응답은 If-Modified-Since로도 비교한다
+    url = f"/api/posts/{test_post['id']}?fields=id,title,content"
+    last_modified = client.get(url).headers["Last-Modified"]
+    response = client.get(url, headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 304
+
+    # 게시글이 수정되면 ETag가 바뀌어 200을 반환
+    client.cookies.set("access_token", user_token)
+    client.patch(f"/api/posts/{test_post['id']}", json={"title": "수정된 제목"})
+    response = client.get(
+        f"/api/posts/{test_post['id']}", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_get_post_modified_since_after_comment(client, user_token, test_post):
+    """댓글이 달린 뒤 If-Modified-Since 요청에 바뀐 댓글 수를 반환하는지 테스트합니다."""
+    url = f"/api/posts/{test_post['id']}"
+    last_modified = client.get(url).headers["Last-Modified"]
+
+    client.cookies.set("access_token", user_token)
+    client.post(f"/api/comments?post_id={test_post['id']}", json={"content": "댓글"})
+
+    response = client.get(url, headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 200
+    assert response.json()["comment_count"] == 1
+
+
+def test_get_posts_not_modified(client, test_post):
+    """게시글 목록의 ETag 조건부 요청에 304를 반환하는지 테스트합니다."""
+    etag = client.get("/api/posts").headers["ETag"]
+
+    response = client.get("/api/posts", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+def test_get_post_detail(client, user_token, test_post):
+    """게시글 상세 통합 엔드포인트가 게시글, 댓글, 현재 사용자를 함께 반환하는지 테스트합니다."""
+    client.cookies.set("access_token", user_token)
+    client.post(f"/api/comments?post_id={test_post['id']}", json={"content": "댓글"})
+
+    response = client.get(f"/api/posts/{test_post['id']}/detail")
+    assert response.status_code == 200
+    detail = response.json()
+    assert detail["post"]["title"] == test_post["title"]
+    assert detail["post"]["comment_count"] == 1
+    assert detail["author"] == {"user_name": "테스트유저"}
+    assert [comment["content"] for comment in detail["comments"]] == ["댓글"]
+    assert detail["viewer"] == {
+        "email": "testuser@example.com",
+        "user_name": "테스트유저",
+    }
+
+    # 비로그인 사용자는 viewer가 null
+    client.cookies.clear()
+    response = client.get(f"/api/posts/{test_post['id']}/detail")
+    assert response.status_code == 200
+    assert response.json()["viewer"] is None
+
+
+def test_get_nonexistent_post_detail(client):
+    """존재하지 않는 게시글의 상세 조회를 테스트합니다."""
+    response = client.get("/api/posts/99999/detail")
+    assert response.status_code == 404
+
+
 def test_get_nonexistent_post(client):
     """존재하지 않는 게시글 ��회를 테스트합니다."""
     response = client.get("/api/posts/99999")
@@ -121,4 +315,105 @@ def test_delete_post_unauthorized(client, test_post):
     client.cookies.clear()
     
     response = client.delete(f"/api/posts/{test_post['id']}")
-    assert response.status_code == 401
\ No newline at end of file
+    assert response.status_code == 401
+
+
+def test_bulk_create_posts(client, user_token):
+    """게시글 일괄 작성을 테스트합니다."""
+    client.cookies.set("access_token", user_token)
+    response = client.post(
+        "/api/posts/bulk",
+        json={"items": [{"title": f"제목 {i}", "content": "내용"} for i in range(3)]},
+    )
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [result["status"] for result in results] == [201, 201, 201]
+    assert len(client.get("/api/posts").json()) == 3
+
+
+def test_bulk_delete_posts(client, user_token, test_post):
+    """게시글 일괄 삭제와 다른 사용자 게시글에 대한 권한 확인을 테스트합니다."""
+    other_user = {
+        "email": "other@example.com",
+        "password": "testpassword",
+        "password_check": "testpassword",
+        "user_name": "다른유저",
+    }
+    client.post("/api/users/signup", json=other_user)
+    login_response = client.post(
+        "/api/users/login",
+        json={"email": other_user["email"], "password": other_user["password"]},
+    )
+    client.cookies.set("access_token", login_response.cookies.get("access_token"))
+
+    response = client.post("/api/posts/bulk-delete", json={"ids": [test_post["id"]]})
+    assert response.json()["results"][0]["status"] == 403
+
+    client.cookies.set("access_token", user_token)
+    response = client.post(
+        "/api/posts/bulk-delete", json={"ids": [test_post["id"], 99999]}
+    )
+    assert [result["status"] for result in response.json()["results"]] == [204, 404]
+    assert client.get(f"/api/posts/{test_post['id']}").status_code == 404
+
+
+def test_ssr_pages_embed_data(client, user_token, test_post, monkeypatch):
+    """SSR 모드에서 목록/상세 페이지가 데이터를 HTML에 포함하고 조각을 캐시하는지 테스트합니다."""
+    from main import fragment_cache, settings
+
+    monkeypatch.setattr(settings, "SSR_ENABLED", True)
+    client.cookies.set("access_token", user_token)
+    client.post(f"/api/comments?post_id={test_post['id']}", json={"content": "댓글"})
+
+    response = client.get("/")
+    assert response.status_code == 200
+    assert f'href="/posts/{test_post["id"]}"' in response.text
+    assert "const serverRendered = true;" in response.text
+
+    response = client.get(f"/posts/{test_post['id']}")
+    assert response.status_code == 200
+    assert "<h1>테스트 게시글</h1>" in response.text
+    assert "댓글" in response.text
+    assert '"viewer": {"email": "testuser@example.com"' in response.text
+
+    # 같은 버전의 조각은 다시 렌더링하지 않고, 수정하면 새 조각을 렌더링
+    client.get("/")
+    assert fragment_cache.stats()["hits"] >= 1
+    client.patch(f"/api/posts/{test_post['id']}", json={"title": "수정된 제목"})
+    response = client.get(f"/posts/{test_post['id']}")
+    assert "<h1>수정된 제목</h1>" in response.text
+
+    response = client.get("/posts/99999")
+    assert response.status_code == 404
+
+
+@pytest.mark.query_budget({"GET /": 0, "GET /posts/{post_id}": 0})
+def test_pages_without_ssr(client, test_post):
+    """SSR 모드가 꺼져 있으면 DB 조회나 사용자 확인 없이 빈 페이지 틀만 렌더링하는지 테스트합니다."""
+    # 로그인 쿠키가 있어도 SSR이 꺼져 있으면 사용자를 조회하지 않는다
+    user_cache.clear()
+    response = client.get("/")
+    assert response.status_code == 200
+    assert "const serverRendered = false;" in response.text
+
+    response = client.get(f"/posts/{test_post['id']}")
+    assert response.status_code == 200
+    assert "const initialDetail = null;" in response.text
+
+    # 없는 게시글은 페이지 틀만 내려가고, 상세 API의 404를 보고 스크립트가 안내를 표시한다
+    response = client.get("/posts/999999")
+    assert response.status_code == 200
+    assert "renderNotFound()" in response.text
+    assert client.get("/api/posts/999999/detail").status_code == 404
+
+    for path in ("/login", "/signup"):
+        response = client.get(path)
+        assert response.status_code == 200
+        assert "text/html" in response.headers["content-type"]
+
+
+@pytest.mark.query_budget({"GET /api/posts": 0})
+def test_query_budget_exceeded(client, test_post):
+    """선언한 SQL 실행 수 예산을 넘는 요청은 테스트를 실패시키는지 확인합니다."""
+    with pytest.raises(pytest.fail.Exception, match="GET /api/posts: SQL 1개"):
+        client.get("/api/posts")
@@ -0,0 +1,67 @@
+import asyncio
+
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeRedis
+
+from core.pubsub import MemoryBroker, RedisBroker
+
+
+def test_memory_broker_fan_out():
+    """같은 채널의 모든 구독자에게 메시지가 전달되는지 테스트합니다."""
+
+    async def scenario():
+        broker = MemoryBroker(queue_size=10)
+        async with broker.subscribe("a") as first, broker.subscribe("a") as second:
+            async with broker.subscribe("b") as other:
+                await broker.publish("a", "hello")
+                assert broker.stats()["connections"] == 3
+
+                received = [await anext(aiter(s)) for s in (first, second)]
+                assert received == ["hello", "hello"]
+                assert other._queue.empty()
+
+        assert broker.stats()["connections"] == 0
+        assert broker.stats()["channels"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_memory_broker_drops_slow_consumer():
+    """큐가 가득 찬 느린 구독자는 발행자를 막지 않고 구독이 끊기는지 테스트합니다."""
+
+    async def scenario():
+        broker = MemoryBroker(queue_size=2)
+        async with broker.subscribe("a") as slow:
+            for i in range(3):
+                await broker.publish("a", str(i))
+
+            assert slow.overflowed
+            assert [message async for message in slow] == []
+            assert broker.stats()["connections"] == 0
+            assert broker.stats()["dropped"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_redis_broker_publish_subscribe():
+    """Redis 브로커로 발행한 메시지가 같은 채널 구독자에게만 전달되는지 테스트합니다."""
+
+    async def scenario():
+        broker = RedisBroker("redis://localhost:6379/0", queue_size=10)
+        broker._client = FakeRedis(server=FakeServer())
+        async with broker.subscribe("a") as subscription:
+            async with broker.subscribe("b") as other:
+                # 리스너가 패턴 구독을 마칠 때까지 기다린다
+                async with asyncio.timeout(5):
+                    while await broker._client.pubsub_numpat() == 0:
+                        await asyncio.sleep(0.01)
+
+                await broker.publish("a", "hello")
+                async with asyncio.timeout(5):
+                    assert await anext(aiter(subscription)) == "hello"
+                assert other._queue.empty()
+                assert broker.stats()["published"] == 1
+
+        broker._listener.cancel()
+
+    asyncio.run(scenario())
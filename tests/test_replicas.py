@@ -0,0 +1,120 @@
+import os
+import time
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+from sqlmodel import SQLModel, create_engine
+
+import core.database
+from core.database import STICKY_COOKIE, ReplicaSet
+
+# 복제가 따라오지 않은(비어 있는) 복제본 역할을 하는 두 번째 SQLite 파일
+REPLICA_PATH = "./test_replica.db"
+
+
+@pytest.fixture
+def replica(monkeypatch):
+    """빈 복제본 DB를 만들어 읽기 세션이 사용하도록 바꾸는 픽스처입니다."""
+    sync_engine = create_engine(f"sqlite:///{REPLICA_PATH}")
+    SQLModel.metadata.create_all(bind=sync_engine)
+
+    replica_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{REPLICA_PATH}", poolclass=NullPool
+    )
+    replicas = ReplicaSet([replica_engine], retry_seconds=30)
+    monkeypatch.setattr(core.database, "replicas", replicas)
+    yield replicas
+
+    SQLModel.metadata.drop_all(bind=sync_engine)
+    sync_engine.dispose()
+    os.remove(REPLICA_PATH)
+
+
+@pytest.fixture
+def created_post(client, replica):
+    """primary에 사용자와 게시글을 만들고 게시글 정보를 반환하는 픽스처입니다."""
+    client.post(
+        "/api/users/signup",
+        json={
+            "email": "testuser@example.com",
+            "password": "testpassword",
+            "password_check": "testpassword",
+            "user_name": "테스트유저",
+        },
+    )
+    response = client.post(
+        "/api/users/login",
+        json={"email": "testuser@example.com", "password": "testpassword"},
+    )
+    client.cookies.set("access_token", response.cookies.get("access_token"))
+
+    response = client.post(
+        "/api/posts", json={"title": "테스트 게시글", "content": "테스트 내용입니다."}
+    )
+    assert response.status_code == 201
+    assert STICKY_COOKIE in response.headers["set-cookie"]
+    return response.json()
+
+
+def test_reads_use_replica_after_sticky_window(client, created_post):
+    """고정 쿠키가 없는 읽기는 복제본(아직 비어 있음)에서 처리되는지 테스트합니다."""
+    client.cookies.delete(STICKY_COOKIE)
+
+    assert client.get(f"/api/posts/{created_post['id']}").status_code == 404
+    assert client.get("/api/posts").json() == []
+
+
+def test_read_your_writes(client, created_post):
+    """쓰기 직후 같은 사용자의 읽기는 primary에서 처리되는지 테스트합니다."""
+    # 다른 사용자가 복제본에서 읽어 (비어 있는) 목록이 캐시되어도
+    sticky = client.cookies.get(STICKY_COOKIE)
+    client.cookies.delete(STICKY_COOKIE)
+    assert client.get("/api/posts").json() == []
+
+    client.cookies.set(STICKY_COOKIE, sticky)
+    response = client.get("/api/posts")
+    assert [post["id"] for post in response.json()] == [created_post["id"]]
+    assert client.get(f"/api/posts/{created_post['id']}").status_code == 200
+
+
+def catch_up(replica_path: str) -> None:
+    """primary(test.db)의 사용자와 게시글을 복제본으로 복사해 복제를 따라잡게 합니다."""
+    sync_engine = create_engine(f"sqlite:///{replica_path}")
+    with sync_engine.begin() as conn:
+        conn.execute(text("ATTACH DATABASE './test.db' AS source"))
+        for table in ("user", "post"):
+            conn.execute(text(f'INSERT INTO "{table}" SELECT * FROM source."{table}"'))
+    sync_engine.dispose()
+
+
+def test_replica_reads_are_cached_briefly(client, created_post, monkeypatch):
+    """복제본에서 읽은 (오래된) 응답은 복제가 따라잡은 뒤까지 캐시되지 않는지 테스트합니다."""
+    monkeypatch.setattr(core.database.settings.db, "DB_REPLICA_STICKY_SECONDS", 0.2)
+
+    # 고정 쿠키가 없는 다른 사용자가 아직 따라오지 못한 복제본에서 읽는다
+    client.cookies.delete(STICKY_COOKIE)
+    assert client.get("/api/posts").json() == []
+
+    catch_up(REPLICA_PATH)
+    time.sleep(0.3)
+
+    response = client.get("/api/posts")
+    assert [post["id"] for post in response.json()] == [created_post["id"]]
+
+
+def test_unhealthy_replica_falls_back_to_primary(client, created_post, monkeypatch):
+    """연결할 수 없는 복제본은 제외하고 primary에서 읽는지 테스트합니다."""
+    replicas = ReplicaSet(
+        [create_async_engine("sqlite+aiosqlite:////nonexistent/replica.db")],
+        retry_seconds=30,
+    )
+    monkeypatch.setattr(core.database, "replicas", replicas)
+    client.cookies.delete(STICKY_COOKIE)
+
+    for _ in range(2):
+        response = client.get(f"/api/posts/{created_post['id']}")
+        assert response.status_code == 200
+
+    assert replicas.stats() == {"replicas": 1, "healthy": 0, "fallbacks": 1}
@@ -0,0 +1,61 @@
+import asyncio
+
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeRedis
+
+from core.response_cache import MemoryCacheBackend, RedisCacheBackend, ResponseCache
+
+
+def test_version_counters_are_bounded():
+    """게시글 버전 카운터가 캐시 크기만큼만 유지되는지 테스트합니다."""
+    cache = ResponseCache(MemoryCacheBackend(max_size=2), ttl=30)
+
+    async def scenario():
+        for post_id in range(10):
+            await cache.invalidate_post(post_id)
+        return cache.backend.stats()["counters"]
+
+    assert asyncio.run(scenario()) == 2
+
+
+def test_evicted_counter_does_not_reuse_old_version():
+    """제거된 카운터의 예전 버전으로 저장된 응답을 다시 읽지 않는지 테스트합니다."""
+    cache = ResponseCache(MemoryCacheBackend(max_size=2), ttl=30)
+
+    async def scenario():
+        # 수정 전 응답이 버전 0으로 캐시된 뒤 게시글이 수정된다
+        stale_key = await cache.post_key(1)
+        await cache.set(stale_key, b"old")
+        await cache.invalidate_post(1)
+
+        # 다른 게시글 수정으로 1번 게시글의 카운터가 제거된다
+        for post_id in range(2, 5):
+            await cache.invalidate_post(post_id)
+
+        return await cache.get(await cache.post_key(1))
+
+    assert asyncio.run(scenario()) is None
+
+
+def test_redis_backend():
+    """Redis 백엔드에서 저장/조회/무효화와 버전 카운터가 동작하는지 테스트합니다."""
+
+    async def scenario():
+        backend = RedisCacheBackend("redis://localhost:6379/0")
+        backend._client = FakeRedis(server=FakeServer())
+        cache = ResponseCache(backend, ttl=30)
+
+        assert await cache.generation() == 0
+        key = await cache.post_key(1, "id,title")
+        await cache.set(key, b'{"id": 1}', {"ETag": '"v1"'})
+        assert await cache.get(key) == (b'{"id": 1}', {"ETag": '"v1"'})
+
+        await cache.invalidate_post(1)
+        assert await cache.generation() == 1
+        assert await cache.post_key(1, "id,title") != key
+        assert await cache.get(await cache.post_key(1, "id,title")) is None
+
+        await backend.delete(key)
+        assert await cache.get(key) is None
+
+    asyncio.run(scenario())
@@ -0,0 +1,94 @@
+import pytest
+
+
+@pytest.fixture
+def user_token(client):
+    """테스트용 사용자를 등록하고 로그인하여 토큰을 반환하는 픽스처입니다."""
+    signup_data = {
+        "email": "testuser@example.com",
+        "password": "testpassword",
+        "password_check": "testpassword",
+        "user_name": "테스트유저",
+    }
+    client.post("/api/users/signup", json=signup_data)
+
+    login_data = {"email": signup_data["email"], "password": signup_data["password"]}
+    response = client.post("/api/users/login", json=login_data)
+    return response.cookies.get("access_token")
+
+
+def test_search_posts(client, user_token):
+    """게시글 검색이 작성/수정/삭제를 반영하고 관련도 순으로 반환하는지 테스트합니다."""
+    client.cookies.set("access_token", user_token)
+    first = client.post(
+        "/api/posts", json={"title": "fastapi 입문", "content": "fastapi fastapi 예제"}
+    ).json()
+    second = client.post(
+        "/api/posts", json={"title": "파이썬", "content": "fastapi 한 번 언급"}
+    ).json()
+    client.post("/api/posts", json={"title": "무관한 글", "content": "다른 내용"})
+
+    response = client.get("/api/search/posts?q=fastapi")
+    assert response.status_code == 200
+    assert [post["id"] for post in response.json()] == [first["id"], second["id"]]
+    assert "excerpt" in response.json()[0]
+
+    # 수정하면 새 내용으로 검색되고, 삭제된 글은 제외
+    client.patch(f"/api/posts/{second['id']}", json={"content": "django 예제"})
+    response = client.get("/api/search/posts?q=django")
+    assert [post["id"] for post in response.json()] == [second["id"]]
+
+    client.delete(f"/api/posts/{first['id']}")
+    response = client.get("/api/search/posts?q=fastapi")
+    assert response.json() == []
+
+
+def test_search_posts_keyset_paging(client, user_token):
+    """검색 결과를 커서로 나누어 조회할 때 중복이나 누락이 없는지 테스트합니다."""
+    client.cookies.set("access_token", user_token)
+    items = [{"title": f"검색 {i}", "content": "keyword " * (i + 1)} for i in range(5)]
+    client.post("/api/posts/bulk", json={"items": items})
+
+    seen = []
+    cursor = None
+    while True:
+        url = "/api/search/posts?q=keyword&limit=2"
+        response = client.get(url + (f"&cursor={cursor}" if cursor else ""))
+        assert response.status_code == 200
+        seen += [post["id"] for post in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+
+    assert sorted(seen) == list(range(1, 6))
+    assert len(seen) == len(set(seen))
+
+    response = client.get("/api/search/posts?q=keyword&cursor=invalid")
+    assert response.status_code == 400
+
+
+def test_search_comments(client, user_token):
+    """댓글 검색과 검색어 특수문자 처리를 테스트합니다."""
+    client.cookies.set("access_token", user_token)
+    post = client.post("/api/posts", json={"title": "글", "content": "내용"}).json()
+    comment = client.post(
+        f"/api/comments?post_id={post['id']}", json={"content": 'say "hello" OR'}
+    ).json()
+
+    response = client.get(f"/api/search/comments?q=hello&post_id={post['id']}")
+    assert response.status_code == 200
+    assert response.json() == [
+        {
+            "id": comment["id"],
+            "content": 'say "hello" OR',
+            "user_name": "테스트유저",
+            "post_id": post["id"],
+        }
+    ]
+
+    # FTS 연산자로 해석될 수 있는 입력도 오류 없이 처리
+    response = client.get('/api/search/comments?q="hello" OR NEAR(')
+    assert response.status_code == 200
+
+    response = client.get("/api/search/comments?q=%20")
+    assert response.status_code == 400
@@ -0,0 +1,67 @@
+import time
+
+import jwt
+import pytest
+from fastapi import HTTPException
+
+from core.config import get_settings
+from core.security import create_access_token, decode_access_token, token_cache
+
+settings = get_settings()
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    token_cache.clear()
+    yield
+    token_cache.clear()
+
+
+def test_decode_access_token_cached():
+    """한 번 검증한 토큰은 캐시에서 같은 페이로드를 반환하는지 테스트합니다."""
+    token = create_access_token({"sub": "user-uuid"})
+
+    first = decode_access_token(token)
+    second = decode_access_token(token)
+
+    assert first == second
+    assert second["sub"] == "user-uuid"
+    assert token_cache.stats() == {"size": 1, "hits": 1, "misses": 1}
+
+
+def test_decode_access_token_cache_returns_copy():
+    """캐시된 페이로드를 수정해도 다음 조회에 영향이 없는지 테스트합니다."""
+    token = create_access_token({"sub": "user-uuid"})
+
+    decode_access_token(token)["sub"] = "changed"
+    assert decode_access_token(token)["sub"] == "user-uuid"
+
+
+def test_decode_expired_token_not_cached():
+    """만료된 토큰은 캐시되지 않고 401을 발생시키는지 테스트합니다."""
+    token = jwt.encode(
+        {"sub": "user-uuid", "exp": int(time.time()) - 10},
+        settings.SECRET_KEY,
+        algorithm=settings.ALGORITHM,
+    )
+
+    with pytest.raises(HTTPException) as exc_info:
+        decode_access_token(token)
+
+    assert exc_info.value.status_code == 401
+    assert token_cache.stats()["size"] == 0
+
+
+def test_decode_invalid_token_not_cached():
+    """서명이 잘못된 토큰은 캐시되지 않는지 테스트합니다."""
+    token = jwt.encode(
+        {"sub": "user-uuid", "exp": int(time.time()) + 60},
+        "wrong-secret",
+        algorithm=settings.ALGORITHM,
+    )
+
+    for _ in range(2):
+        with pytest.raises(HTTPException):
+            decode_access_token(token)
+
+    assert token_cache.stats()["size"] == 0
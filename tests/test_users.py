@@ -1,10 +1,26 @@
 import pytest
 
 from fastapi.testclient import TestClient
+from sqlmodel import select
+
 from main import app
+from core.auth import user_cache
+from core.security import password_hash_pool
+from models.users import User
 
 client = TestClient(app)
 
+# 요청 한 번이 실행할 수 있는 SQL 문 수 (목록 조회가 N+1로 바뀌면 실패)
+pytestmark = pytest.mark.query_budget(
+    {
+        "POST /api/users/login": 1,
+        "GET /api/users/me": 1,
+        "POST /api/users/signout": 0,
+        "POST /api/users/signup": 2,
+        "POST __unmatched__": 0,
+    }
+)
+
 
 @pytest.fixture
 def new_user_data():
@@ -47,6 +63,13 @@ def test_signup_duplicate_email(client, new_user_data):
     assert response.json()["detail"] == "이미 등록된 이메일입니다."
 
 
+def test_signup_hash_pool_full(client, new_user_data, monkeypatch):
+    """비밀번호 해시 워커 풀이 가득 찼을 때 503을 반환하는지 테스트합니다."""
+    monkeypatch.setattr(password_hash_pool, "_pending", password_hash_pool.capacity)
+    response = client.post("/api/users/signup", json=new_user_data)
+    assert response.status_code == 503
+
+
 def test_login_success(client, registered_user):
     """로그인 성공 시나리오를 테스트합니다."""
     response = client.post("/api/users/login", json=registered_user)
@@ -77,6 +100,28 @@ def test_login_nonexistent_email(client):
     assert response.json()["detail"] == "이메일 또는 비밀번호가 올바르지 않습니다."
 
 
+def test_get_my_info_uses_user_cache(client, registered_user, db_session):
+    """인증 사용자 캐시 적중과 사용자 변경 시 무효화를 테스트합니다."""
+    login_response = client.post("/api/users/login", json=registered_user)
+    client.cookies.set("access_token", login_response.cookies.get("access_token"))
+
+    client.get("/api/users/me")
+    response = client.get("/api/users/me")
+    assert response.status_code == 200
+    assert user_cache.stats()["hits"] == 1
+
+    # 사용자 정보가 바뀌면 캐시가 무효화되어 새 값을 반환
+    user = db_session.exec(
+        select(User).where(User.email == registered_user["email"])
+    ).one()
+    user.user_name = "변경된유저"
+    db_session.add(user)
+    db_session.commit()
+
+    response = client.get("/api/users/me")
+    assert response.json()["user_name"] == "변경된유저"
+
+
 def test_signout_success(client, registered_user):
     """로그아웃 성공 시나리오를 테스트합니다."""
     # 로그인 후 쿠키 설정